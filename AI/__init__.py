@@ -1,12 +1,3 @@
 # AI 패키지 초기화
-from . import detection
+# detection, cctv 는 torch/ultralytics 가 필요하므로 패키지 import 시 불러오지 않고 직접 import
 from . import scoring
-from . import model
-from . import cctv
-
-# detection 모듈
-from .detection import model
-from .detection import roi
-
-# scoring 모듈
-from .scoring.compute_risk import compute_risk
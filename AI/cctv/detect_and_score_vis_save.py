@@ -18,7 +18,8 @@ sys.path.append(AI_ROOT)
 if AI_ROOT not in sys.path:
     sys.path.append(AI_ROOT)
 
-from scoring.compute_risk import compute_flood_risk
+from scoring.compute_risk import DEFAULT_RAIN_SCORE, compute_flood_risk
+from scoring.rainfall_service import RainfallService, RedisRainfallService
 from detection.model import FastSCNN
 
 # ───────────────────────────────
@@ -49,11 +50,22 @@ SAVE_VIDEO = True
 OUTPUT_DIR = os.path.join(AI_ROOT, "output")
 OUTPUT_PATH = os.path.join(OUTPUT_DIR, "test1.mp4")
 
+# 강수 자료 설정 (백그라운드 폴링, 프레임마다 API 호출하지 않음)
+USE_RAINFALL = True
+RAIN_STN_ID = 401          # 특정 지역 STN 코드
+RAIN_TM = os.getenv("RAIN_TM")  # 과거 시각(YYYYMMDDHHMI) 재현 시에만 지정, 기본은 실시간
+RAIN_SOURCE = "redis"      # "redis": 백엔드가 수집한 공유 캐시, "kma": KMA API 직접 호출
+REDIS_HOST = "192.168.100.92"
+REDIS_PORT = 6379
+REDIS_RAINFALL_KEY = "rainfall:latest"
+
 # MQTT 설정
 BROKER = "192.168.100.92"
 PORT = 1883
 CLIENT_ID = "jetson-detector"
 PUB_TOPIC = "topic/jetson_score"
+CAMERA_ID = "cam-01"       # 백엔드에서 카메라별 점수 이력을 구분하는 ID
+SCORE_COMPONENTS = ("dem_score", "rain_score", "drain_score", "puddle_score")
 
 # ───────────────────────────────
 # 디바이스 설정
@@ -164,6 +176,17 @@ def main():
     mqtt_client.connect(BROKER, PORT)
     print("MQTT 연결 성공")
 
+    rainfall = None
+    if USE_RAINFALL:
+        if RAIN_SOURCE == "redis":
+            rainfall = RedisRainfallService(
+                host=REDIS_HOST, port=REDIS_PORT, key=REDIS_RAINFALL_KEY
+            ).start()
+        else:
+            rainfall = RainfallService(tm=RAIN_TM).start()
+    else:
+        print(f"[RAIN] 강수 자료 미사용: 기본 강수 점수({DEFAULT_RAIN_SCORE})로 계산합니다.")
+
     cap = cv2.VideoCapture(VIDEO_PATH)
     if not cap.isOpened():
         print("영상을 열 수 없습니다.")
@@ -288,7 +311,8 @@ def main():
             dem_csv_path=DEM_CSV_PATH,
             clean_count=clean_count,
             unclean_count=unclean_count,
-            puddle_ratio=puddle_ratio
+            puddle_ratio=puddle_ratio,
+            rain_data=rainfall.get(RAIN_STN_ID) if rainfall else None
         )
 
         # 로그 출력(필요 시 MQTT 전송/CSV 저장 등으로 교체)
@@ -299,8 +323,13 @@ def main():
         if not df.empty:
             first_row = df.iloc[0]
             score_data = {
+                "camera_id": CAMERA_ID,
+                "lat": float(first_row["lat"]),
+                "lng": float(first_row["lng"]),
+                **{key: float(first_row[key]) for key in SCORE_COMPONENTS},
                 "final_score": float(first_row["final_score"]),
-                "risk_level": str(first_row["risk_level"])
+                "risk_level": str(first_row["risk_level"]),
+                "rain_fallback": bool(first_row["rain_fallback"])
             }
             payload = json.dumps(score_data)
             mqtt_client.publish(PUB_TOPIC, payload)
@@ -322,6 +351,8 @@ def main():
 
     cap.release()
     mqtt_client.disconnect()
+    if rainfall is not None:
+        rainfall.stop()
     if out is not None:
         out.release()
         print(f"[INFO] 저장 완료: {OUTPUT_PATH}")
@@ -1,6 +1,9 @@
-from .analyze_dem import *
-from .clip_dem_area import *
+# analyze_dem, clip_dem_area, convert_dem_to_latlng, score_history, visualize_risk_map 은
+# 실행 시 파일을 읽고 쓰는 스크립트이므로 패키지 import 대상에서 제외
 from .compute_risk import *
-from .convert_dem_to_latlng import *
 from .get_rainfall import *
-from .visualize_risk_map import *
+from .terrain import *
+from .projection import *
+from .rainfall_service import *
+from .score_table import *
+from .risk_tiles import *
@@ -1,8 +1,22 @@
+import os
+import sys
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.neighbors import NearestNeighbors
-from geopy.distance import geodesic
+
+# 경로 설정: 모듈 import 용
+CUR_DIR = os.path.dirname(os.path.abspath(__file__))
+AI_ROOT = os.path.abspath(os.path.join(CUR_DIR, ".."))
+if AI_ROOT not in sys.path:
+    sys.path.append(AI_ROOT)
+
+from scoring.projection import latlng_to_xy, within_radius
+from scoring.risk_tiles import RiskTileRenderer
+from scoring.terrain import (
+    analyze_terrain,
+    grid_from_points,
+    terrain_risk_components,
+    terrain_risk_score,
+)
 
 # 입력 DEM 파일 (lat, lng, elevation)
 df = pd.read_csv("./data/seocho_elevation_data.csv")
@@ -22,36 +36,31 @@ def classify_by_elevation(elev):
 
 df["elevation_level"] = df["elevation"].apply(classify_by_elevation)
 
-# k-NN 기반 경사도 계산
-k = 30
-coords = df[["lat", "lng"]].values
-elevations = df["elevation"].values
-
-nbrs = NearestNeighbors(n_neighbors=k + 1).fit(coords)
-distances, indices = nbrs.kneighbors(coords)
+# 격자 기반 지형 분석 (경사, D8 흐름 누적, 와지)
+# 위경도를 EPSG:5186(m 단위)으로 되돌려 규칙 격자로 정렬
+x, y = latlng_to_xy(df["lat"].values, df["lng"].values)
+dem, rows, cols, origin = grid_from_points(x, y, df["elevation"].values)
 
-slopes = []
-for i, neighbors in enumerate(indices):
-    neighbor_elev = elevations[neighbors[1:]]
-    neighbor_dist = distances[i][1:]
-    dz = neighbor_elev - elevations[i]
-    slope = np.mean(np.abs(dz / neighbor_dist))
-    slopes.append(slope)
+layers = analyze_terrain(dem, origin[2])
+components = terrain_risk_components(dem, layers)
+terrain_score = terrain_risk_score(components)
 
-df["slope"] = slopes
-df["slope_norm"] = 1 - (np.array(slopes) / max(slopes))  # 평평할수록 1에 가까움
+df["slope"] = layers["slope"][rows, cols]
+df["flow_accumulation"] = layers["flow_accumulation"][rows, cols]
+df["depression_depth"] = layers["depression_depth"][rows, cols]
+df["slope_norm"] = components["flatness"][rows, cols]  # 평평할수록 1에 가까움
+df["flow_norm"] = components["flow"][rows, cols]
 
-# 경사도 낮아서 평평한 지역이면 위험도 올려줌 (Caution → Danger)
-def apply_slope_override(row):
-    if row["elevation_level"] == "Caution" and row["slope_norm"] > 0.8:
-        return "Danger"
-    else:
-        return row["elevation_level"]
+# 평평하거나 물이 모이는 지형이면 위험도 올려줌 (Caution → Danger)
+collects_water = (
+    (df["slope_norm"] > 0.8) | (df["depression_depth"] > 0) | (df["flow_norm"] > 0.8)
+)
+df["risk_level"] = np.where(
+    (df["elevation_level"] == "Caution") & collects_water, "Danger", df["elevation_level"]
+)
 
-df["risk_level"] = df.apply(apply_slope_override, axis=1)
-
-# 위험 점수
-df["risk_score"] = df["risk_level"].map({"Safe": 0.0, "Caution": 0.5, "Danger": 1.0})
+# 위험 점수 (고도, 평탄도, 흐름 누적, 와지 깊이의 가중합)
+df["risk_score"] = terrain_score[rows, cols]
 
 # 저장 및 시각화
 df["slope"] = df["slope"].round(4)
@@ -60,16 +69,10 @@ df["risk_score"] = df["risk_score"].round(4)
 results = df[["lat", "lng", "elevation", "slope", "risk_score", "risk_level"]].copy()
 results = results.sort_values(by=["lat", "lng"]).reset_index(drop=True)
 
-# 시각화
-color_map = {"Safe": "blue", "Caution": "orange", "Danger": "red"}
-plt.figure(figsize=(8, 6))
-plt.scatter(results["lng"], results["lat"], c=results["risk_level"].map(color_map), s=40)
-plt.title("Flood Risk")
-plt.xlabel("Longitude")
-plt.ylabel("Latitude")
-plt.grid(True)
-plt.tight_layout()
-plt.savefig("./output/dem_risk_map.png")
+# 시각화: 위험 점수 격자를 XYZ 타일로 렌더링 (바뀐 타일만 다시 저장)
+renderer = RiskTileRenderer(origin, dem.shape, "./output/tiles/dem_risk")
+updated = renderer.render(terrain_score)
+print(f"위험도 타일 {len(updated)}장 갱신")
 
 # 저장
 results.to_csv("./data/dem_risk_results.csv", index=False)
@@ -80,16 +83,13 @@ results.to_csv("./data/dem_risk_results.csv", index=False)
 # CCTV 위치 기반 DEM 평균 위험도 계산 및 저장 
 
 def compute_average_dem_score_near_cctv(cctv_lat, cctv_lng, radius_m=150):
-    nearby_points = []
-    for _, row in results.iterrows():
-        dist = geodesic((cctv_lat, cctv_lng), (row["lat"], row["lng"])).meters
-        if dist <= radius_m:
-            nearby_points.append(row["risk_score"])
-    
-    if not nearby_points:
+    nearby = within_radius(results["lat"].values, results["lng"].values, cctv_lat, cctv_lng, radius_m)
+    nearby_points = results["risk_score"].values[nearby]
+
+    if nearby_points.size == 0:
         avg_score = 0.0  # 근처 데이터 없음 → 기본값
     else:
-        avg_score = round(np.mean(nearby_points), 4)
+        avg_score = round(float(np.mean(nearby_points)), 4)
     
     # 결과 저장
     avg_df = pd.DataFrame([{
@@ -1,14 +1,21 @@
+import os
+import sys
 import pandas as pd
-import pyproj
+
+# 경로 설정: 모듈 import 용
+CUR_DIR = os.path.dirname(os.path.abspath(__file__))
+AI_ROOT = os.path.abspath(os.path.join(CUR_DIR, ".."))
+if AI_ROOT not in sys.path:
+    sys.path.append(AI_ROOT)
+
+from scoring.projection import latlng_to_xy
 
 # 변환할 위도, 경도 (WGS84, EPSG:4326 기준)
 lat = 37.49858578128938
 lon = 127.02676215392935 
 
-# 원본 좌표계 -> 변환할 좌표계 설정
-transformer = pyproj.Transformer.from_crs("EPSG:4326", "EPSG:5186", always_xy=True)
-# 위도, 경도 값을 EPSG:5186 좌표로 변환
-x, y = transformer.transform(lon, lat)
+# 위도, 경도 값을 EPSG:5186 좌표로 변환 (공용 변환기 사용)
+x, y = latlng_to_xy(lat, lon)
 
 print(f"원본 위도, 경도 (WGS84): ({lat}, {lon})")
 print(f"변환된 EPSG:5186 좌표 (x, y): ({x}, {y})")
@@ -1,6 +1,11 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from .get_rainfall import get_rain_data_by_stn 
+from .score_table import score_table
+
+# 강수 자료가 없을 때 사용하는 강수량 점수 (결과의 rain_fallback=True 로 표시)
+DEFAULT_RAIN_SCORE = 0.8
 
 # 위험도 등급 분류 함수
 def classify_total_score(score):
@@ -11,38 +16,19 @@ def classify_total_score(score):
     else:
         return "Danger"
 
-# 강수량 위험도 점수 계산
+# 요소별 점수 (스칼라 입력 → 스칼라 출력)
+# 기준값은 score_table.SCORE_TABLE 한 곳에만 있고, 여기서는 컴파일된 채점기에 위임
 def calculate_rain_score(rn_hr1, rn_day, rn_15m_max):
+    return float(score_table.rain_score(rn_hr1, rn_day, rn_15m_max))
+
+# 물웅덩이(시맨틱 세그멘테이션) 점수 (0.0 to 1.0), puddle_ratio=None 이면 결과 없음
+def calculate_puddle_score(puddle_ratio):
+    return float(score_table.puddle_score(np.nan if puddle_ratio is None else puddle_ratio))
 
-    score = 0.0
-
-    # 1시간 강수량 기준 
-    if rn_hr1 >= 70:
-        score += 0.4  
-    elif rn_hr1 >= 50:
-        score += 0.3   
-    elif rn_hr1 >= 30:
-        score += 0.2   
-    elif rn_hr1 >= 15:
-        score += 0.1   
-
-    # 일 누적 강수량 기준 (배수 능력 초과 여부)
-    if rn_day >= 300:
-        score += 0.4   
-    elif rn_day >= 200:
-        score += 0.3   
-    elif rn_day >= 100:
-        score += 0.2   
-    elif rn_day >= 60:
-        score += 0.1  
-
-    # 15분 강수량 기준
-    if rn_15m_max >= 20:
-        score += 0.3   # 저지대, 지하차도 침수 위험 매우 높음
-    elif rn_15m_max >= 15:
-        score += 0.2   # 도로, 배수 불량 지역 침수 위험 증가
-
-    return min(score, 1.0)
+# 하수구 점수 (0.0 to 1.0)
+def calculate_drain_score(clean_count, unclean_count, puddle_ratio=None):
+    puddle = np.nan if puddle_ratio is None else puddle_ratio
+    return float(score_table.drain_score(clean_count, unclean_count, puddle))
 
 # 메인 함수
 def compute_flood_risk(
@@ -52,16 +38,20 @@ def compute_flood_risk(
     rn_15m_max=0.0,
     clean_count=0,
     unclean_count=0,
-    puddle_ratio=None  # 시맨틱 모델용
+    puddle_ratio=None,  # 시맨틱 모델용
+    rain_data=None      # RainfallService.get() 결과 {RN_HR1, RN_DAY, RN_15M_MAX}
 ):
     # 현재 시간
     current_time = datetime.now().isoformat()
 
     # 1. 강수량 점수 계산
-    stn_id = 401  # 특정 지역 STN 코드
-    # rain_data = get_rain_data_by_stn(stn_id)           # 실시간 기상청 API에서 호출
-    # rain_score = calculate_rain_score(rain_data["RN_HR1"], rain_data["RN_DAY"], rain_data["RN_15M_MAX"])
-    rain_score = 0.8  # 테스트용 강수량 점수 (실제 API 호출로 대체 필요)
+    # 프레임마다 API 를 호출하지 않고, 백그라운드 RainfallService 가 메모리에 보관한 값을 전달받음
+    # 자료가 없으면(서비스 미사용/자료 만료/지점 없음) 기본값을 쓰고 rain_fallback 으로 알림
+    rain_fallback = rain_data is None
+    if not rain_fallback:
+        rain_score = calculate_rain_score(rain_data["RN_HR1"], rain_data["RN_DAY"], rain_data["RN_15M_MAX"])
+    else:
+        rain_score = DEFAULT_RAIN_SCORE
     # print("rain_score = ", rain_score)
 
     # 2. DEM 위험도 불러오기 
@@ -69,32 +59,14 @@ def compute_flood_risk(
 
     # 3. 시맨틱 세그멘테이션 점수 (0.0 to 1.0)
     
-    if puddle_ratio is not None:
-        if puddle_ratio >= 0.25:
-            puddle_score = max(0.7, puddle_ratio * 3.0)  # 최소 0.8
-        elif puddle_ratio >= 0.15:
-            puddle_score = max(0.4, puddle_ratio * 3.0)  # 최소 0.5
-        else:
-            puddle_score = puddle_ratio * 2.0  
-        puddle_score = min(puddle_score, 1.0)  # 상한 1.0
-    else:
-        puddle_score = 0.0
-    
+    puddle_score = calculate_puddle_score(puddle_ratio)
+
     print("*** puddle_ratio: ", puddle_ratio)
     print("*** puddle_score: ", puddle_score)
 
 
     # 4. 하수구 점수 계산 (0.0 to 1.0)
-    total = clean_count + unclean_count
-    if total == 0:  # 하수구 탐지 X
-        # 하수구 탐지가 안 되면서 물 비율이 높으면 위험으로 간주
-        if puddle_ratio is not None and puddle_ratio > 0.5:  
-            drain_score = 0.6  # 물에 잠겼을 가능성
-        else:
-            drain_score = 0.25  # 하수구 유무 불명확, 기본값 유지
-    else:
-        ratio = unclean_count / total
-        drain_score = min(ratio * 2.0, 1.0) # 0 ~ 1
+    drain_score = calculate_drain_score(clean_count, unclean_count, puddle_ratio)
 
     print("drain_score: ", drain_score)
 
@@ -121,7 +93,11 @@ def compute_flood_risk(
         final_scores.append({
             "lat": row["lat"],
             "lng": row["lng"],
-            # "dem_score": round(dem_score, 3),
+            "dem_score": round(dem_score, 3),
+            "rain_score": round(rain_score, 3),
+            "rain_fallback": rain_fallback,
+            "drain_score": round(drain_score, 3),
+            "puddle_score": round(puddle_score, 3),
             "final_score": round(final_score, 3),
             "risk_level": risk_level,
             "timestamp": current_time
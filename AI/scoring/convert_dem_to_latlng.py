@@ -1,5 +1,14 @@
+import os
+import sys
 import pandas as pd
-from pyproj import Transformer
+
+# 경로 설정: 모듈 import 용
+CUR_DIR = os.path.dirname(os.path.abspath(__file__))
+AI_ROOT = os.path.abspath(os.path.join(CUR_DIR, ".."))
+if AI_ROOT not in sys.path:
+    sys.path.append(AI_ROOT)
+
+from scoring.projection import xy_to_latlng
 
 # 파일 경로
 input_txt_path = "./data/seocho_clip.txt"
@@ -8,14 +17,11 @@ output_csv_path = "./data/seocho_elevation_data.csv"
 # 1. txt 파일 불러오기 (x, y, elevation 구조)
 df = pd.read_csv(input_txt_path, sep=r"\s+", names=["x", "y", "elevation"])
 
-# 2. 좌표 변환기 정의 (EPSG:5186 -> EPSG:4326)
-transformer = Transformer.from_crs("epsg:5186", "epsg:4326", always_xy=True)
-
-# 3. 위도 경도 변환
-df["lng"], df["lat"] = transformer.transform(df["x"].values, df["y"].values)
+# 2. 위도 경도 변환 (EPSG:5186 -> EPSG:4326, 공용 변환기로 일괄 변환)
+df["lat"], df["lng"] = xy_to_latlng(df["x"].values, df["y"].values)
 
-# 4. 필요한 컬럼만 저장
+# 3. 필요한 컬럼만 저장
 df_latlng = df[["lat", "lng", "elevation"]]
 
-# 5. CSV로 저장
+# 4. CSV로 저장
 df_latlng.to_csv(output_csv_path, index=False)
\ No newline at end of file
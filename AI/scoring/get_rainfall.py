@@ -5,13 +5,47 @@ from datetime import datetime
 import os
 from dotenv import load_dotenv
 
-def save_rain_data():
-    # Load API key from .env file
-    load_dotenv()
-    API_KEY = os.getenv("API_KEY")
+# Load API key from .env file (모듈 로드 시 한 번만)
+load_dotenv()
+API_KEY = os.getenv("API_KEY")
+
+# API endpoint
+KMA_AWS_URL = "https://apihub.kma.go.kr/api/typ01/url/awsh.php"
+
+# Expected column names (based on API doc and actual structure)
+RAIN_COLUMNS = [
+    "YYMMDDHHMI", "STN", "RE_SUM", "RE_QCM",
+    "RN_DAY", "RN_DAY_MI", "RN_HR1", "RN_HR1_MI",
+    "RN_60M_MAX", "RN_60M_MAX_MI", "RN_60M_QCM",
+    "RN_15M_MAX", "RN_15M_MAX_MI", "RN_15M_QCM"
+]
+RAIN_FIELDS = ("RN_HR1", "RN_DAY", "RN_15M_MAX")
+
+
+def parse_rain_table(raw_text):
+    """awsh.php 응답 전체를 한 번만 파싱해 {STN: {RN_HR1, RN_DAY, RN_15M_MAX, YYMMDDHHMI}} 반환"""
+    stn_idx = RAIN_COLUMNS.index("STN")
+    field_idx = [(name, RAIN_COLUMNS.index(name)) for name in RAIN_FIELDS]
+
+    table = {}
+    for line in raw_text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        values = line.split()
+        if len(values) < len(RAIN_COLUMNS):
+            continue
+        try:
+            row = {name: float(values[i]) for name, i in field_idx}
+            stn = int(values[stn_idx])
+        except ValueError:
+            continue
+        row["YYMMDDHHMI"] = values[0]
+        table.setdefault(stn, row)  # 같은 지점이 여러 번 나오면 첫 행 사용
+    return table
+
 
-    # API endpoint
-    url = "https://apihub.kma.go.kr/api/typ01/url/awsh.php"
+def save_rain_data():
+    url = KMA_AWS_URL
 
     # Request parameters
     params = {
@@ -32,17 +66,9 @@ def save_rain_data():
             # Remove comment lines starting with '#'
             lines = [line for line in raw_text.splitlines() if line and not line.startswith("#")]
 
-            # Expected column names (based on API doc and actual structure)
-            columns = [
-                "YYMMDDHHMI", "STN", "RE_SUM", "RE_QCM",
-                "RN_DAY", "RN_DAY_MI", "RN_HR1", "RN_HR1_MI",
-                "RN_60M_MAX", "RN_60M_MAX_MI", "RN_60M_QCM",
-                "RN_15M_MAX", "RN_15M_MAX_MI", "RN_15M_QCM"
-            ]
-
             # Parse data into DataFrame
             data_str = "\n".join(lines)
-            df = pd.read_csv(StringIO(data_str), delim_whitespace=True, names=columns)
+            df = pd.read_csv(StringIO(data_str), sep=r"\s+", names=RAIN_COLUMNS)
 
             # Select relevant columns
             selected = df[["YYMMDDHHMI", "STN", "RN_HR1", "RN_HR1_MI", "RN_15M_MAX", "RN_DAY"]]
@@ -64,11 +90,7 @@ def save_rain_data():
 
 
 def get_rain_data_by_stn(stn_id, save_path=None):
-    # Load API key
-    load_dotenv()
-    API_KEY = os.getenv("API_KEY")
-
-    url = "https://apihub.kma.go.kr/api/typ01/url/awsh.php"
+    # 단발성 조회용. 반복 조회는 rainfall_service.RainfallService 사용
     params = {
         "var": "RN",
         "tm": 202208082100,
@@ -78,44 +100,23 @@ def get_rain_data_by_stn(stn_id, save_path=None):
     }
 
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = requests.get(KMA_AWS_URL, params=params, timeout=30)
         print("Requested URL:", response.url)
 
         if response.status_code != 200:
             print(f"[ERROR] API 요청 실패 - 상태 코드: {response.status_code}")
             return None
 
-        # Parse raw text
-        lines = [line for line in response.text.splitlines() if line and not line.startswith("#")]
-        columns = [
-            "YYMMDDHHMI", "STN", "RE_SUM", "RE_QCM",
-            "RN_DAY", "RN_DAY_MI", "RN_HR1", "RN_HR1_MI",
-            "RN_60M_MAX", "RN_60M_MAX_MI", "RN_60M_QCM",
-            "RN_15M_MAX", "RN_15M_MAX_MI", "RN_15M_QCM"
-        ]
-        data_str = "\n".join(lines)
-        df = pd.read_csv(StringIO(data_str), delim_whitespace=True, names=columns)
-
-        # STN 기준으로 필터링
-        filtered = df[df["STN"] == stn_id]
-        if filtered.empty:
+        # STN 기준으로 조회
+        row = parse_rain_table(response.text).get(stn_id)
+        if row is None:
             print(f"[WARNING] STN {stn_id}에 해당하는 데이터 없음.")
             return None
 
-        row = filtered.iloc[0]
-        result = {
-            "RN_HR1": float(row["RN_HR1"]),
-            "RN_DAY": float(row["RN_DAY"]),
-            "RN_15M_MAX": float(row["RN_15M_MAX"])
-        }
+        result = {name: row[name] for name in RAIN_FIELDS}
 
         print(result)
 
-        # if save_path:
-        #     filtered[["YYMMDDHHMI", "STN", "RN_HR1", "RN_15M_MAX", "RN_DAY"]].to_csv(
-        #         save_path, index=False, encoding="utf-8-sig")
-        #     print(f"결과 CSV 저장 완료: {save_path}")
-
         return result
 
     except Exception as e:
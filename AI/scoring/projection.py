@@ -0,0 +1,38 @@
+from functools import lru_cache
+import numpy as np
+from pyproj import Transformer
+
+# 좌표계
+WGS84 = "EPSG:4326"      # 위경도
+KOREA_TM = "EPSG:5186"   # Korea 2000 / Central Belt 2010 (DEM 좌표계, m 단위)
+
+
+# 변환기 생성 비용이 크므로 프로세스 전체에서 (src, dst) 조합당 한 번만 생성
+@lru_cache(maxsize=None)
+def get_transformer(src_crs, dst_crs):
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
+
+def latlng_to_xy(lat, lng):
+    """위경도 → EPSG:5186 (x, y). 스칼라/배열 모두 한 번에 변환"""
+    transformer = get_transformer(WGS84, KOREA_TM)
+    return transformer.transform(np.asarray(lng, dtype=float), np.asarray(lat, dtype=float))
+
+
+def xy_to_latlng(x, y):
+    """EPSG:5186 (x, y) → (위도, 경도)"""
+    transformer = get_transformer(KOREA_TM, WGS84)
+    lng, lat = transformer.transform(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    return lat, lng
+
+
+def distances_from(lat, lng, center_lat, center_lng):
+    """중심점으로부터 각 점까지의 거리(m) - 투영 좌표계 기준 유클리드 거리"""
+    x, y = latlng_to_xy(lat, lng)
+    cx, cy = latlng_to_xy(center_lat, center_lng)
+    return np.hypot(x - cx, y - cy)
+
+
+def within_radius(lat, lng, center_lat, center_lng, radius_m):
+    """중심점 반경 radius_m 이내인 점의 불리언 마스크"""
+    return distances_from(lat, lng, center_lat, center_lng) <= radius_m
@@ -0,0 +1,199 @@
+import json
+import threading
+import time
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .get_rainfall import API_KEY, KMA_AWS_URL, RAIN_FIELDS, parse_rain_table
+
+# KMA AWS 자료는 1분 단위로 갱신되며, 정각 직후에는 아직 반영되지 않은 경우가 많음
+KMA_UPDATE_INTERVAL = 60.0   # 초
+KMA_PUBLISH_DELAY = 15.0     # 갱신 주기 경계 이후 대기 시간(초)
+RAIN_STALE_TTL = 180.0       # 이 시간 이상 갱신되지 않은 자료는 사용하지 않음(초)
+
+# get() 이 None 을 돌려주는 이유 (호출 측은 기본 강수 점수로 대체)
+RAIN_STALE = "stale"         # 아직 받은 자료가 없거나 TTL 초과
+RAIN_MISSING = "missing"     # 자료는 최신이지만 해당 지점(STN)이 없음
+
+
+class RainfallService:
+    """백그라운드에서 강수 자료를 주기적으로 받아 메모리에서 조회하게 해주는 서비스
+
+    - 폴링은 전용 스레드에서 KMA 갱신 주기에 맞춰 수행 (호출 측은 블로킹되지 않음)
+    - 응답은 폴링당 한 번만 파싱해 지점(STN)별 dict 로 보관
+    - get() 은 네트워크 없이 메모리에서 바로 반환, 오래된 자료는 None
+    - None 을 돌려주는 상태는 fallback_reason() 으로 확인 가능, 상태가 바뀔 때 경고 출력
+    """
+
+    def __init__(
+        self,
+        url=KMA_AWS_URL,
+        api_key=API_KEY,
+        tm=None,
+        poll_interval=KMA_UPDATE_INTERVAL,
+        publish_delay=KMA_PUBLISH_DELAY,
+        ttl=RAIN_STALE_TTL,
+        timeout=10.0,
+    ):
+        self.url = url
+        self.api_key = api_key
+        self.tm = tm                      # None 이면 실시간, 고정 시각(YYYYMMDDHHMI) 지정 가능
+        self.poll_interval = poll_interval
+        self.publish_delay = publish_delay
+        self.ttl = ttl
+        self.timeout = timeout
+
+        # 연결 재사용 (keep-alive) + 일시적 오류 재시도
+        self.session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+        self.session.mount(url.split("://", 1)[0] + "://", HTTPAdapter(pool_maxsize=2, max_retries=retry))
+
+        self._lock = threading.Lock()
+        self._table = {}
+        self._updated_at = None           # time.monotonic() 기준 마지막 성공 시각
+        self._fallback = {}               # STN → RAIN_STALE/RAIN_MISSING (정상이면 없음)
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    # ─────────────────────────────────────
+    # 폴링
+    def _request_params(self):
+        return {
+            "var": "RN",
+            "tm": self.tm or datetime.now().strftime("%Y%m%d%H%M"),
+            "help": "1",
+            "authKey": self.api_key,
+        }
+
+    def _fetch_table(self):
+        response = self.session.get(self.url, params=self._request_params(), timeout=self.timeout)
+        response.raise_for_status()
+        return parse_rain_table(response.text)
+
+    def poll_once(self):
+        """한 번 받아서 파싱 후 교체. 성공 여부 반환"""
+        try:
+            table = self._fetch_table()
+        except Exception as e:
+            print(f"[RAIN] 강수 자료 갱신 실패: {e}")
+            return False
+
+        if not table:
+            print("[RAIN] 응답에 강수 자료가 없습니다.")
+            return False
+
+        with self._lock:
+            self._table = table
+            self._updated_at = time.monotonic()
+        return True
+
+    def _seconds_until_next_poll(self):
+        # 벽시계 기준 갱신 주기 경계 + 반영 지연에 맞춰 대기
+        now = time.time()
+        next_tick = (now // self.poll_interval + 1) * self.poll_interval + self.publish_delay
+        if next_tick - now > self.poll_interval:
+            next_tick -= self.poll_interval
+        return next_tick - now
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.poll_once()
+            self._stop_event.wait(self._seconds_until_next_poll())
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="rainfall-poller", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout + 1.0)
+            self._thread = None
+        self.session.close()
+
+    # ─────────────────────────────────────
+    # 조회
+    @property
+    def age(self):
+        """마지막 갱신 이후 경과 시간(초), 아직 없으면 None"""
+        with self._lock:
+            updated_at = self._updated_at
+        return None if updated_at is None else time.monotonic() - updated_at
+
+    def is_stale(self):
+        age = self.age
+        return age is None or age > self.ttl
+
+    def get(self, stn_id):
+        """지점의 최신 {RN_HR1, RN_DAY, RN_15M_MAX}, 자료가 없거나 오래됐으면 None"""
+        if self.is_stale():
+            self._set_fallback(stn_id, RAIN_STALE)
+            return None
+        with self._lock:
+            row = self._table.get(stn_id)
+        if row is None:
+            self._set_fallback(stn_id, RAIN_MISSING)
+            return None
+        self._set_fallback(stn_id, None)
+        return {name: row[name] for name in RAIN_FIELDS}
+
+    def fallback_reason(self, stn_id):
+        """마지막 get(stn_id) 가 None 이었던 이유 (RAIN_STALE/RAIN_MISSING), 정상이면 None"""
+        with self._lock:
+            return self._fallback.get(stn_id)
+
+    def _set_fallback(self, stn_id, reason):
+        # 프레임마다 출력하지 않도록 상태가 바뀔 때만 경고
+        with self._lock:
+            previous = self._fallback.pop(stn_id, None)
+            if reason is not None:
+                self._fallback[stn_id] = reason
+        if reason == previous:
+            return
+        if reason == RAIN_STALE:
+            age = self.age
+            age_text = "수신 이력 없음" if age is None else f"{age:.0f}초 전 갱신"
+            print(f"[RAIN] 경고: 강수 자료가 오래되어 STN {stn_id} 에 기본 강수 점수를 사용합니다. ({age_text})")
+        elif reason == RAIN_MISSING:
+            print(f"[RAIN] 경고: 강수 자료에 STN {stn_id} 이 없어 기본 강수 점수를 사용합니다.")
+        else:
+            print(f"[RAIN] STN {stn_id} 강수 자료 수신 재개")
+
+
+class RedisRainfallService(RainfallService):
+    """백엔드 수집기가 Redis 해시에 올려 둔 강수 자료를 읽는 서비스
+
+    - 여러 검출기가 각자 KMA API 를 호출하지 않고 백엔드가 한 번 받은 자료를 공유
+    - 폴링/조회 방식은 RainfallService 와 동일, 가져오는 곳만 Redis (HGETALL 1회)
+    """
+
+    UPDATED_AT_FIELD = "updated_at"
+
+    def __init__(self, host="localhost", port=6379, key="rainfall:latest", **kwargs):
+        super().__init__(**kwargs)
+        import redis  # Redis 공유 캐시를 쓸 때만 필요
+
+        self.key = key
+        self.redis = redis.Redis(
+            host=host, port=port, decode_responses=True,
+            socket_timeout=self.timeout, socket_connect_timeout=self.timeout,
+        )
+
+    def _fetch_table(self):
+        raw = self.redis.hgetall(self.key)
+        updated_at = raw.pop(self.UPDATED_AT_FIELD, None)
+        # 백엔드 수집이 멈춘 경우 오래된 자료를 새 자료처럼 쓰지 않도록 거부
+        if updated_at is None or time.time() - float(updated_at) > self.ttl:
+            raise RuntimeError("Redis 강수 자료가 없거나 오래되었습니다.")
+        return {int(stn): json.loads(value) for stn, value in raw.items()}
+
+    def stop(self):
+        super().stop()
+        self.redis.close()
@@ -0,0 +1,259 @@
+import hashlib
+import json
+import math
+import os
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image
+
+from .projection import KOREA_TM, get_transformer, xy_to_latlng
+
+# 위험도 격자 → XYZ 타일(Web Mercator, 256px PNG) 렌더러
+# - 타일마다 참조하는 격자 블록(행/열 범위)을 모서리 좌표 변환만으로 구하고, 블록의 양자화
+#   점수 해시를 manifest 에 기록 → 블록이 그대로인 타일은 픽셀 매핑/렌더링 없이 건너뜀
+# - 다시 그려야 하는 타일의 픽셀 → 격자 셀 매핑은 int32 로 보관 (타일당 256KB,
+#   기본은 피라미드 전체, max_lookups 로 LRU 상한 지정 가능)
+# - 색상은 256 단계 LUT 인덱싱으로 벡터화 (matplotlib 불필요)
+
+WEB_MERCATOR = "EPSG:3857"
+MERCATOR_HALF = 20037508.342789244  # Web Mercator 원점 ~ 경계 거리(m)
+TILE_SIZE = 256
+TRANSFORM_STEP = 16  # 이 픽셀 간격으로만 좌표 변환 후 보간
+MANIFEST_NAME = "manifest.json"
+EMPTY_TILE = "empty:"  # manifest 에서 전부 투명해 저장하지 않은 타일의 해시 접두사
+
+# 점수(0~1) 색상 구간 (YlOrRd 계열, RGBA)
+RISK_COLOR_STOPS = [
+    (0.0, (255, 255, 204, 160)),
+    (0.25, (254, 217, 118, 170)),
+    (0.5, (253, 141, 60, 190)),
+    (0.75, (227, 26, 28, 210)),
+    (1.0, (128, 0, 38, 230)),
+]
+NODATA = 0  # LUT 0번은 투명 (값이 없는 픽셀)
+LEVELS = 255  # 점수는 1~255 로 양자화
+
+
+def build_colormap(stops=RISK_COLOR_STOPS):
+    """(256, 4) uint8 LUT, 0번은 투명 / 1~255번은 점수 0~1"""
+    positions = np.array([p for p, _ in stops])
+    colors = np.array([c for _, c in stops], dtype=float)
+    levels = np.linspace(0.0, 1.0, LEVELS)
+
+    lut = np.zeros((LEVELS + 1, 4), dtype=np.uint8)
+    for channel in range(4):
+        lut[1:, channel] = np.rint(np.interp(levels, positions, colors[:, channel]))
+    return lut
+
+
+RISK_COLORMAP = build_colormap()
+
+
+def quantize_scores(scores):
+    """점수 배열 → uint8 LUT 인덱스 (NaN 은 NODATA)"""
+    scores = np.asarray(scores, dtype=float)
+    nodata = np.isnan(scores)
+    clipped = np.clip(np.where(nodata, 0.0, scores), 0.0, 1.0)
+    index = np.rint(clipped * (LEVELS - 1)).astype(np.uint8) + 1
+    index[nodata] = NODATA
+    return index
+
+
+def lnglat_to_tile(lng, lat, zoom):
+    n = 2 ** zoom
+    x = int((lng + 180.0) / 360.0 * n)
+    lat_rad = math.radians(lat)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_pixel_mercator(z, x, y, pixels):
+    """타일 내 픽셀 위치(0~tile_size)의 Web Mercator 좌표 격자"""
+    span = 2.0 * MERCATOR_HALF / 2 ** z
+    offsets = np.asarray(pixels, dtype=float) / TILE_SIZE
+    mx = -MERCATOR_HALF + (x + offsets) * span
+    my = MERCATOR_HALF - (y + offsets) * span
+    return np.meshgrid(mx, my)
+
+
+def _interp_2d(coarse, coarse_pos, fine_pos):
+    """성긴 격자 값을 행/열 방향 선형 보간으로 세밀한 격자에 펼침"""
+    i = np.clip(np.searchsorted(coarse_pos, fine_pos, side="right") - 1, 0, len(coarse_pos) - 2)
+    w = (fine_pos - coarse_pos[i]) / (coarse_pos[i + 1] - coarse_pos[i])
+    wr, wc = w[:, None], w[None, :]
+    r0, r1, c0, c1 = i[:, None], i[:, None] + 1, i[None, :], i[None, :] + 1
+    top = coarse[r0, c0] * (1 - wc) + coarse[r0, c1] * wc
+    bottom = coarse[r1, c0] * (1 - wc) + coarse[r1, c1] * wc
+    return top * (1 - wr) + bottom * wr
+
+
+def tile_pixel_xy(z, x, y, tile_size=TILE_SIZE, step=TRANSFORM_STEP):
+    """타일 픽셀 중심의 EPSG:5186 좌표 (tile_size, tile_size) 배열 2개
+
+    타일 범위 안에서는 좌표 변환이 거의 선형이므로 step 픽셀 간격으로만 변환하고
+    나머지는 보간한다 (90m 격자 대비 오차 무시 가능, 변환 횟수 1/step² 로 감소).
+    """
+    fine = (np.arange(tile_size) + 0.5) * TILE_SIZE / tile_size
+    coarse = np.linspace(fine[0], fine[-1], max(tile_size // step, 1) + 1)
+    mx, my = tile_pixel_mercator(z, x, y, coarse)
+    gx, gy = get_transformer(WEB_MERCATOR, KOREA_TM).transform(mx, my)
+    return _interp_2d(gx, coarse, fine), _interp_2d(gy, coarse, fine)
+
+
+class RiskTileRenderer:
+    """DEM 위험도 격자(EPSG:5186)를 XYZ 타일 피라미드로 렌더링
+
+    Args:
+        origin: grid_from_points() 의 (x_min, y_max, cell_size)
+        shape: 격자 (H, W)
+        tile_dir: 타일 저장 디렉토리 ({z}/{x}/{y}.png + manifest.json)
+        max_lookups: 보관할 타일 매핑 수 (LRU, 기본은 전체 타일 수)
+    """
+
+    def __init__(self, origin, shape, tile_dir, min_zoom=12, max_zoom=17, tile_size=TILE_SIZE,
+                 max_lookups=None):
+        self.x_min, self.y_max, self.cell_size = origin
+        self.shape = tuple(shape)
+        self.tile_dir = tile_dir
+        self.tile_size = tile_size
+        self.zooms = range(min_zoom, max_zoom + 1)
+        self.colormap = RISK_COLORMAP
+
+        self.max_lookups = max_lookups or sum(1 for _ in self.tiles())
+        self._lookups = OrderedDict()   # (z, x, y) → 격자 1차원 인덱스 int32 (격자 밖은 -1)
+        self._blocks = {}   # (z, x, y) → 참조하는 격자 블록 (r0, r1, c0, c1) 또는 None
+        self.manifest = self._load_manifest()
+
+    # ─────────────────────────────────────
+    # 타일 ↔ 격자 매핑
+    def bounds_latlng(self):
+        height, width = self.shape
+        # 셀 중심 좌표 기준이므로 반 셀씩 넓혀서 외곽 계산
+        half = 0.5 * self.cell_size
+        xs = [self.x_min - half, self.x_min + (width - 1) * self.cell_size + half]
+        ys = [self.y_max - (height - 1) * self.cell_size - half, self.y_max + half]
+        gx, gy = np.meshgrid(xs, ys)
+        lat, lng = xy_to_latlng(gx.ravel(), gy.ravel())
+        return lat.min(), lng.min(), lat.max(), lng.max()
+
+    def tiles(self):
+        """격자를 덮는 모든 (z, x, y) 타일"""
+        south, west, north, east = self.bounds_latlng()
+        for z in self.zooms:
+            x0, y0 = lnglat_to_tile(west, north, z)
+            x1, y1 = lnglat_to_tile(east, south, z)
+            for x in range(x0, x1 + 1):
+                for y in range(y0, y1 + 1):
+                    yield z, x, y
+
+    def _lookup(self, tile):
+        lookup = self._lookups.get(tile)
+        if lookup is not None:
+            self._lookups.move_to_end(tile)
+        else:
+            gx, gy = tile_pixel_xy(*tile, tile_size=self.tile_size)
+            gx, gy = gx.ravel(), gy.ravel()
+            cols = np.rint((gx - self.x_min) / self.cell_size).astype(np.int64)
+            rows = np.rint((self.y_max - gy) / self.cell_size).astype(np.int64)
+            height, width = self.shape
+            inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+            lookup = np.where(inside, rows * width + cols, -1).astype(np.int32)
+            self._lookups[tile] = lookup
+            while len(self._lookups) > self.max_lookups:
+                self._lookups.popitem(last=False)
+        return lookup
+
+    def _block(self, tile):
+        """타일 픽셀이 참조할 수 있는 격자 블록 (r0, r1, c0, c1), 겹치지 않으면 None
+
+        타일 가장자리를 TRANSFORM_STEP 간격으로만 변환하고 반올림 오차만큼 한 셀씩 넓힌다.
+        """
+        if tile in self._blocks:
+            return self._blocks[tile]
+        edge = np.linspace(0.0, TILE_SIZE, max(self.tile_size // TRANSFORM_STEP, 1) + 1)
+        mx, my = tile_pixel_mercator(*tile, edge)
+        gx, gy = get_transformer(WEB_MERCATOR, KOREA_TM).transform(mx, my)
+        cols = (gx - self.x_min) / self.cell_size
+        rows = (self.y_max - gy) / self.cell_size
+        height, width = self.shape
+        r0, r1 = max(math.floor(rows.min()) - 1, 0), min(math.ceil(rows.max()) + 1, height - 1)
+        c0, c1 = max(math.floor(cols.min()) - 1, 0), min(math.ceil(cols.max()) + 1, width - 1)
+        block = (r0, r1, c0, c1) if r0 <= r1 and c0 <= c1 else None
+        self._blocks[tile] = block
+        return block
+
+    def _block_digest(self, block, levels):
+        """격자 형태/위치와 블록의 양자화 점수 해시"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((self.x_min, self.y_max, self.cell_size, self.shape, block)).encode())
+        if block is not None:
+            r0, r1, c0, c1 = block
+            digest.update(levels[r0:r1 + 1, c0:c1 + 1].tobytes())
+        return digest.hexdigest()
+
+    # ─────────────────────────────────────
+    # 렌더링
+    def tile_path(self, z, x, y):
+        return os.path.join(self.tile_dir, str(z), str(x), f"{y}.png")
+
+    def _load_manifest(self):
+        path = os.path.join(self.tile_dir, MANIFEST_NAME)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_manifest(self):
+        os.makedirs(self.tile_dir, exist_ok=True)
+        path = os.path.join(self.tile_dir, MANIFEST_NAME)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def render_tile(self, tile, levels):
+        """양자화된 격자(1차원)에서 타일 1장의 LUT 인덱스 (tile_size, tile_size)"""
+        lookup = self._lookup(tile)
+        index = np.where(lookup >= 0, levels[np.maximum(lookup, 0)], NODATA)
+        return index.reshape(self.tile_size, self.tile_size).astype(np.uint8)
+
+    def render(self, scores):
+        """위험도 격자를 렌더링하고 새로 쓰거나 지운 타일 키 목록 반환
+
+        참조하는 격자 블록의 점수가 바뀌지 않은 타일은 블록 해시 비교만 하고 건너뛴다.
+        """
+        scores = np.asarray(scores, dtype=float)
+        if scores.shape != self.shape:
+            raise ValueError(f"격자 크기가 다릅니다: {scores.shape} != {self.shape}")
+        levels = quantize_scores(scores)
+        flat_levels = levels.ravel()
+
+        changed = []
+        manifest_changed = False
+        for tile in self.tiles():
+            key = "{}/{}/{}".format(*tile)
+            path = self.tile_path(*tile)
+            block = self._block(tile)
+            digest = self._block_digest(block, levels)
+            entry = self.manifest.get(key)
+            if entry == EMPTY_TILE + digest or (entry == digest and os.path.exists(path)):
+                continue
+
+            manifest_changed = True
+            index = self.render_tile(tile, flat_levels) if block is not None else None
+            if index is None or not index.any():  # 전부 투명한 타일은 저장하지 않음
+                self.manifest[key] = EMPTY_TILE + digest
+                if os.path.exists(path):
+                    os.remove(path)
+                    changed.append(key)
+                continue
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            Image.fromarray(self.colormap[index], "RGBA").save(path, "PNG")
+            self.manifest[key] = digest
+            changed.append(key)
+
+        if manifest_changed:
+            self._save_manifest()
+        return changed
@@ -0,0 +1,45 @@
+import os
+import sys
+import time
+import pandas as pd
+
+# 경로 설정: 모듈 import 용
+CUR_DIR = os.path.dirname(os.path.abspath(__file__))
+AI_ROOT = os.path.abspath(os.path.join(CUR_DIR, ".."))
+if AI_ROOT not in sys.path:
+    sys.path.append(AI_ROOT)
+
+from scoring.score_table import score_batch
+
+# 과거 자료 일괄 채점
+# - 입력 CSV 의 각 행을 (강수, 물웅덩이, 하수구) 조합으로 보고 한 번의 배열 연산으로 점수 계산
+# - 없는 컬럼은 기본값 (하수구 0개, 물웅덩이 결과 없음)
+input_csv_path = "./data/rainfall_summary.csv"
+output_csv_path = "./output/rainfall_scores.csv"
+
+# 1. CSV 불러오기
+df = pd.read_csv(input_csv_path, encoding="utf-8-sig", index_col=0)
+n = len(df)
+
+def column(name, default):
+    return df[name].to_numpy(dtype=float) if name in df.columns else default
+
+# 2. 일괄 채점
+start = time.perf_counter()
+scores = score_batch(
+    df["RN_HR1"].to_numpy(dtype=float),
+    df["RN_DAY"].to_numpy(dtype=float),
+    df["RN_15M_MAX"].to_numpy(dtype=float),
+    clean_count=column("clean_count", 0),
+    unclean_count=column("unclean_count", 0),
+    puddle_ratio=column("puddle_ratio", float("nan")),
+)
+elapsed = time.perf_counter() - start
+
+# 3. 저장
+for name, values in scores.items():
+    df[name] = values
+os.makedirs(os.path.dirname(output_csv_path), exist_ok=True)
+df.to_csv(output_csv_path, index=False)
+
+print(f"{n}건 채점 완료 ({elapsed * 1000:.2f} ms) → {output_csv_path}")
@@ -0,0 +1,135 @@
+import numpy as np
+
+# 점수 기준표 (compute_risk 의 요소별 점수 기준을 선언형으로 표현)
+#
+# - step: 입력이 threshold 이상이면 해당 구간 값 (values[0] 은 가장 낮은 threshold 미만)
+#         strict=True 이면 "초과" 기준
+# - band: 구간별 max(floor, 입력 * slope), 이후 cap 으로 상한
+#
+# 기준을 바꿀 때는 이 표만 수정하면 된다. compute_flood_risk(스칼라)와 score_history(배열) 모두
+# compile_score_table() 결과로 계산하며, 원래 분기 구현은 tests/branch_scores.py 에 기준값으로만 남아 있음
+SCORE_TABLE = {
+    "rain": {
+        # 1시간 강수량
+        "rn_hr1": {"thresholds": [15, 30, 50, 70], "values": [0.0, 0.1, 0.2, 0.3, 0.4]},
+        # 일 누적 강수량 (배수 능력 초과 여부)
+        "rn_day": {"thresholds": [60, 100, 200, 300], "values": [0.0, 0.1, 0.2, 0.3, 0.4]},
+        # 15분 강수량 (15mm: 배수 불량 지역, 20mm: 저지대/지하차도 위험)
+        "rn_15m_max": {"thresholds": [15, 20], "values": [0.0, 0.2, 0.3]},
+        "cap": 1.0,
+    },
+    "puddle": {
+        "thresholds": [0.15, 0.25],
+        "floors": [-np.inf, 0.4, 0.7],
+        "slopes": [2.0, 3.0, 3.0],
+        "cap": 1.0,
+        "missing": 0.0,     # 시맨틱 모델 결과 없음
+    },
+    "drain": {
+        "slope": 2.0,       # 막힌 하수구 비율 * 2
+        "cap": 1.0,
+        # 하수구 미탐지 시: 물 비율이 0.5 초과면 잠겼을 가능성, 아니면 기본값
+        "undetected": {"thresholds": [0.5], "values": [0.25, 0.6], "strict": True},
+    },
+}
+
+RAIN_COMPONENTS = ("rn_hr1", "rn_day", "rn_15m_max")
+
+
+class _Step:
+    """계단 함수 1개를 searchsorted 용 배열로 변환한 것"""
+
+    def __init__(self, spec):
+        self.thresholds = np.asarray(spec["thresholds"], dtype=float)
+        self.values = np.asarray(spec["values"], dtype=float)
+        if self.values.size != self.thresholds.size + 1:
+            raise ValueError("values 는 thresholds 보다 1개 많아야 합니다.")
+        if np.any(np.diff(self.thresholds) <= 0):
+            raise ValueError("thresholds 는 오름차순이어야 합니다.")
+        # "이상" 이면 같은 값이 위 구간에 속하도록 right, "초과" 면 left
+        self.side = "left" if spec.get("strict", False) else "right"
+
+    def index(self, x):
+        return np.searchsorted(self.thresholds, x, side=self.side)
+
+    def __call__(self, x):
+        return self.values[self.index(x)]
+
+
+class CompiledScoreTable:
+    """SCORE_TABLE 을 배열로 컴파일한 채점기
+
+    모든 메서드는 스칼라/배열 입력을 모두 받아 배열 단위로 한 번에 계산한다.
+    결과는 원래 분기 구현(tests/branch_scores.py)과 부동소수점까지 동일하다.
+    """
+
+    def __init__(self, table=SCORE_TABLE):
+        rain = table["rain"]
+        self.rain_steps = [_Step(rain[name]) for name in RAIN_COMPONENTS]
+        self.rain_cap = float(rain["cap"])
+
+        puddle = table["puddle"]
+        self.puddle_bands = _Step({"thresholds": puddle["thresholds"], "values": puddle["floors"]})
+        self.puddle_slopes = np.asarray(puddle["slopes"], dtype=float)
+        self.puddle_cap = float(puddle["cap"])
+        self.puddle_missing = float(puddle["missing"])
+
+        drain = table["drain"]
+        self.drain_slope = float(drain["slope"])
+        self.drain_cap = float(drain["cap"])
+        self.drain_undetected = _Step(drain["undetected"])
+
+    def rain_score(self, rn_hr1, rn_day, rn_15m_max):
+        score = np.zeros(np.broadcast(np.asarray(rn_hr1), np.asarray(rn_day), np.asarray(rn_15m_max)).shape)
+        # 분기 구현과 같은 순서로 더해야 합계가 정확히 일치
+        for step, x in zip(self.rain_steps, (rn_hr1, rn_day, rn_15m_max)):
+            score = score + step(np.asarray(x, dtype=float))
+        return np.minimum(score, self.rain_cap)
+
+    def puddle_score(self, puddle_ratio):
+        """puddle_ratio 가 NaN(None) 이면 missing 값"""
+        ratio = np.asarray(puddle_ratio, dtype=float)
+        missing = np.isnan(ratio)
+        safe = np.where(missing, 0.0, ratio)
+
+        band = self.puddle_bands.index(safe)
+        score = np.maximum(self.puddle_bands.values[band], safe * self.puddle_slopes[band])
+        score = np.minimum(score, self.puddle_cap)
+        return np.where(missing, self.puddle_missing, score)
+
+    def drain_score(self, clean_count, unclean_count, puddle_ratio=np.nan):
+        clean = np.asarray(clean_count, dtype=float)
+        unclean = np.asarray(unclean_count, dtype=float)
+        total = clean + unclean
+        detected = total > 0
+
+        ratio = np.divide(unclean, total, out=np.zeros(np.broadcast(unclean, total).shape), where=detected)
+        detected_score = np.minimum(ratio * self.drain_slope, self.drain_cap)
+
+        puddle = np.asarray(puddle_ratio, dtype=float)
+        undetected_score = self.drain_undetected(np.where(np.isnan(puddle), -np.inf, puddle))
+        return np.where(detected, detected_score, undetected_score)
+
+    def score_batch(self, rn_hr1, rn_day, rn_15m_max, clean_count, unclean_count, puddle_ratio):
+        """(강수, 물웅덩이, 하수구) 입력 배열을 한 번에 채점
+
+        Returns:
+            {"rain_score", "puddle_score", "drain_score"} 배열 dict
+        """
+        return {
+            "rain_score": self.rain_score(rn_hr1, rn_day, rn_15m_max),
+            "puddle_score": self.puddle_score(puddle_ratio),
+            "drain_score": self.drain_score(clean_count, unclean_count, puddle_ratio),
+        }
+
+
+def compile_score_table(table=SCORE_TABLE):
+    return CompiledScoreTable(table)
+
+
+# 기본 기준표로 컴파일한 공용 채점기
+score_table = compile_score_table()
+
+
+def score_batch(rn_hr1, rn_day, rn_15m_max, clean_count=0, unclean_count=0, puddle_ratio=np.nan):
+    return score_table.score_batch(rn_hr1, rn_day, rn_15m_max, clean_count, unclean_count, puddle_ratio)
@@ -0,0 +1,277 @@
+import heapq
+import math
+
+import numpy as np
+
+# 격자 기반 지형 분석 엔진
+# - 경사/향: 유한차분으로 벡터화 계산
+# - D8 흐름 방향 / 흐름 누적: 위상 정렬(Kahn) 기반 O(n) 처리
+# - 와지(sink) 깊이: Priority-Flood 로 채운 DEM 과의 차이
+# - 흐름 방향/누적은 채운 DEM(평지는 ε 기울기) 위에서 계산해 배수망이 끊기지 않게 함
+
+# D8 이웃 오프셋 (행, 열) - 동쪽부터 시계 방향, 행은 남쪽으로 증가
+D8_OFFSETS = np.array([
+    (0, 1), (1, 1), (1, 0), (1, -1),
+    (0, -1), (-1, -1), (-1, 0), (-1, 1),
+])
+D8_DISTANCES = np.hypot(D8_OFFSETS[:, 0], D8_OFFSETS[:, 1])
+NO_FLOW = -1  # 더 낮은 이웃이 없는 셀 (와지 바닥, 평지, nodata)
+
+# 지형 위험 점수 가중치 (합계 1.0)
+TERRAIN_WEIGHTS = {
+    "elevation": 0.4,    # 평균 대비 저지대 정도
+    "flatness": 0.2,     # 경사가 완만할수록 물이 고임
+    "flow": 0.2,         # 상류 유입 면적 (흐름 누적)
+    "depression": 0.2,   # 와지 깊이
+}
+DEPRESSION_FULL_DEPTH = 1.0  # 이 깊이(m) 이상의 와지는 최대 위험
+
+
+def infer_cell_size(x, y, decimals=2):
+    """같은 열(x)에 속한 점들의 y 간격 중앙값으로 격자 간격 추정"""
+    xr = np.round(np.asarray(x, dtype=float), decimals)
+    yr = np.round(np.asarray(y, dtype=float), decimals)
+    order = np.lexsort((yr, xr))
+    xs, ys = xr[order], yr[order]
+    same_col = xs[1:] == xs[:-1]
+    dy = np.diff(ys)[same_col]
+    dy = dy[dy > 0]
+    if dy.size == 0:
+        raise ValueError("격자 간격을 추정할 수 없습니다 (같은 열에 점이 2개 이상 필요)")
+    return float(np.median(dy))
+
+
+def grid_from_points(x, y, values, cell_size=None):
+    """흩어진 (x, y, value) 점들을 규칙 격자로 정렬
+
+    같은 셀에 떨어지는 점들은 평균하고, 값이 없는 셀은 NaN 으로 남긴다.
+    행 0 이 가장 북쪽(y 최대)이다.
+
+    Returns:
+        grid: (H, W) 배열
+        rows, cols: 각 입력 점의 격자 인덱스
+        origin: (x_min, y_max, cell_size)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if cell_size is None:
+        cell_size = infer_cell_size(x, y)
+
+    x_min, y_max = x.min(), y.max()
+    cols = np.rint((x - x_min) / cell_size).astype(np.int64)
+    rows = np.rint((y_max - y) / cell_size).astype(np.int64)
+    height, width = rows.max() + 1, cols.max() + 1
+
+    flat = rows * width + cols
+    sums = np.bincount(flat, weights=values, minlength=height * width)
+    counts = np.bincount(flat, minlength=height * width)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        grid = np.where(counts > 0, sums / counts, np.nan)
+
+    return grid.reshape(height, width), rows, cols, (x_min, y_max, cell_size)
+
+
+def _padded(dem, fill):
+    return np.pad(dem, 1, mode="constant", constant_values=fill)
+
+
+def _axis_gradient(center, forward, backward, cell_size):
+    # 중앙 차분, 이웃이 없으면(nodata/경계) 한쪽 차분, 둘 다 없으면 0
+    central = (forward - backward) / (2.0 * cell_size)
+    one_sided = np.where(
+        np.isnan(forward), (center - backward) / cell_size, (forward - center) / cell_size
+    )
+    gradient = np.where(np.isnan(central), one_sided, central)
+    return np.nan_to_num(gradient, nan=0.0)
+
+
+def compute_slope_aspect(dem, cell_size):
+    """경사(도)와 향(도, 북쪽 0 시계 방향, 평지는 NaN) 계산"""
+    padded = _padded(dem, np.nan)
+    center = padded[1:-1, 1:-1]
+    # 행은 남쪽으로 증가하므로 북쪽 이웃은 위쪽 행
+    dz_dx = _axis_gradient(center, padded[1:-1, 2:], padded[1:-1, :-2], cell_size)
+    dz_dy = _axis_gradient(center, padded[:-2, 1:-1], padded[2:, 1:-1], cell_size)
+
+    slope = np.degrees(np.arctan(np.hypot(dz_dx, dz_dy)))
+    # 향: 내리막이 향하는 방위각
+    aspect = (np.degrees(np.arctan2(-dz_dx, -dz_dy)) + 360.0) % 360.0
+    aspect[(dz_dx == 0) & (dz_dy == 0)] = np.nan
+
+    nodata = np.isnan(dem)
+    slope[nodata] = np.nan
+    aspect[nodata] = np.nan
+    return slope, aspect
+
+
+def d8_flow_direction(dem, cell_size=1.0):
+    """D8 흐름 방향 (D8_OFFSETS 인덱스, 내리막이 없으면 NO_FLOW)"""
+    height, width = dem.shape
+    padded = _padded(dem, np.nan)
+
+    drops = np.empty((8, height, width))
+    for k, (dr, dc) in enumerate(D8_OFFSETS):
+        neighbour = padded[1 + dr:1 + dr + height, 1 + dc:1 + dc + width]
+        drops[k] = (dem - neighbour) / (D8_DISTANCES[k] * cell_size)
+    drops = np.nan_to_num(drops, nan=-np.inf)
+
+    direction = np.argmax(drops, axis=0)
+    steepest = np.take_along_axis(drops, direction[None], axis=0)[0]
+    direction[~(steepest > 0)] = NO_FLOW
+    return direction
+
+
+def downstream_index(direction):
+    """각 셀이 흘러가는 셀의 1차원 인덱스 (없으면 -1)"""
+    height, width = direction.shape
+    flat_dir = direction.ravel()
+    rows, cols = np.divmod(np.arange(flat_dir.size), width)
+
+    valid = flat_dir != NO_FLOW
+    offsets = D8_OFFSETS[np.where(valid, flat_dir, 0)]
+    downstream = (rows + offsets[:, 0]) * width + (cols + offsets[:, 1])
+    downstream[~valid] = -1
+    return downstream
+
+
+def flow_accumulation(direction, valid_mask=None):
+    """흐름 누적 (자기 자신 포함, 상류 셀 수)
+
+    재귀 대신 위상 정렬(Kahn)을 단계별로 벡터화해 처리한다.
+    각 셀은 유입 셀을 모두 처리한 뒤 한 번만 하류로 전달되므로 전체 작업량은 O(n).
+    """
+    downstream = downstream_index(direction)
+    n = downstream.size
+
+    acc = np.ones(n) if valid_mask is None else valid_mask.ravel().astype(float)
+    has_down = downstream >= 0
+    indegree = np.bincount(downstream[has_down], minlength=n)
+
+    frontier = np.flatnonzero(indegree == 0)
+    while frontier.size:
+        frontier = frontier[has_down[frontier]]
+        targets = downstream[frontier]
+        np.add.at(acc, targets, acc[frontier])
+        np.subtract.at(indegree, targets, 1)
+        targets = np.unique(targets)
+        frontier = targets[indegree[targets] == 0]
+
+    return acc.reshape(direction.shape)
+
+
+def _priority_flood(dem):
+    """Priority-Flood 한 번으로 (채운 DEM, ε 기울기를 준 흐름 계산용 DEM) 반환
+
+    격자 경계와 nodata(NaN)에 맞닿은 셀에서 시작해 ε 면이 낮은 셀부터 안쪽으로 채워 나간다.
+    ε 면은 채운 와지/평지 셀을 이전 셀보다 아주 조금(1 ULP) 높여 모든 셀에 경계까지
+    이어지는 내리막을 만든다. 채운 DEM 은 같은 순서로 max(원 고도, 이전 셀 채움 고도)
+    이므로 ε 없이 채운 결과와 같다 (평지/경사면의 와지 깊이는 정확히 0).
+
+    셀마다 heap 에 한 번 들어가는 파이썬 루프라 100만 셀에 약 3~4초 걸린다.
+    구 단위 10m 격자(~50만 셀)는 2초 안팎, 그보다 큰 격자는 구역을 나눠 처리한다.
+    """
+    height, width = dem.shape
+    padded_width = width + 2
+    routed = _padded(dem, np.nan).ravel()
+    closed = np.isnan(routed)
+
+    neighbour_offsets = D8_OFFSETS[:, 0] * padded_width + D8_OFFSETS[:, 1]
+
+    # 시작점: 이웃 중 하나라도 경계/nodata 인 유효 셀
+    seeds = np.zeros(routed.size, dtype=bool)
+    open_idx = np.flatnonzero(~closed)
+    for offset in neighbour_offsets:
+        seeds[open_idx[closed[open_idx + offset]]] = True
+
+    # 셀 단위 루프는 numpy 스칼라 대신 파이썬 리스트로 처리 (원소 접근이 몇 배 빠름)
+    routed_list = routed.tolist()
+    filled_list = routed_list[:]
+    closed_list = bytearray(seeds | closed)
+    offsets = neighbour_offsets.tolist()
+    heap = [(routed_list[i], i) for i in np.flatnonzero(seeds).tolist()]
+    heapq.heapify(heap)
+    heappop, heappush, nextafter, inf = heapq.heappop, heapq.heappush, math.nextafter, math.inf
+
+    while heap:
+        level, idx = heappop(heap)
+        fill_level = filled_list[idx]
+        for offset in offsets:
+            nb = idx + offset
+            if closed_list[nb]:
+                continue
+            closed_list[nb] = 1
+            if filled_list[nb] < fill_level:
+                filled_list[nb] = fill_level
+            value = routed_list[nb]
+            if value <= level:
+                value = routed_list[nb] = nextafter(level, inf)
+            heappush(heap, (value, nb))
+
+    routed = np.array(routed_list)
+    filled = np.array(filled_list)
+    shape = (height + 2, width + 2)
+    return filled.reshape(shape)[1:-1, 1:-1], routed.reshape(shape)[1:-1, 1:-1]
+
+
+def fill_depressions(dem, epsilon=False):
+    """Priority-Flood 로 와지를 채운 DEM 반환
+
+    epsilon=True 이면 평지/채운 와지에 ε 기울기를 준 면 (D8 입력용).
+    """
+    filled, routed = _priority_flood(dem)
+    return routed if epsilon else filled
+
+
+def analyze_terrain(dem, cell_size):
+    """DEM 격자에서 지형 레이어 일괄 계산"""
+    valid = ~np.isnan(dem)
+    slope, aspect = compute_slope_aspect(dem, cell_size)
+    # 흐름은 와지를 채우고 평지에 기울기를 준 면에서 계산 (원 DEM 에서는 작은 웅덩이/평지마다 끊김)
+    # 와지 깊이는 ε 없이 채운 DEM 기준 (ε 면을 쓰면 평지도 1e-15 수준의 깊이를 가짐)
+    filled, routed = _priority_flood(dem)
+    direction = d8_flow_direction(routed, cell_size)
+    accumulation = flow_accumulation(direction, valid_mask=valid)
+    depression = np.where(valid, filled - dem, np.nan)
+
+    return {
+        "slope": slope,
+        "aspect": aspect,
+        "flow_direction": direction,
+        "flow_accumulation": accumulation,
+        "depression_depth": depression,
+    }
+
+
+def terrain_risk_components(dem, layers):
+    """지형 레이어를 0~1 위험 요소로 정규화"""
+    mean_elev = np.nanmean(dem)
+    std_elev = np.nanstd(dem, ddof=1)
+
+    # 평균 고도 이상이면 0, 평균 - 1.5σ 이하이면 1 (기존 Danger 기준과 동일)
+    elevation = np.clip((mean_elev - dem) / (1.5 * std_elev), 0.0, 1.0)
+
+    slope = layers["slope"]
+    max_slope = np.nanmax(slope)
+    flatness = 1.0 - slope / max_slope if max_slope > 0 else np.ones_like(slope)
+
+    # 자기 자신만 있는 셀은 0, nodata 는 NaN
+    accumulation = np.where(np.isnan(dem), np.nan, layers["flow_accumulation"])
+    upstream = np.log(accumulation)
+    max_upstream = np.nanmax(upstream)
+    flow = upstream / max_upstream if max_upstream > 0 else np.zeros_like(upstream)
+
+    depression = np.clip(layers["depression_depth"] / DEPRESSION_FULL_DEPTH, 0.0, 1.0)
+
+    return {
+        "elevation": elevation,
+        "flatness": flatness,
+        "flow": flow,
+        "depression": depression,
+    }
+
+
+def terrain_risk_score(components, weights=TERRAIN_WEIGHTS):
+    """정규화된 위험 요소의 가중합 (0~1)"""
+    score = sum(weights[name] * components[name] for name in weights)
+    return np.clip(score, 0.0, 1.0)
@@ -1,39 +1,33 @@
+import os
+import sys
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
-# 스타일 세팅 (예쁜 시각화용)
-plt.style.use("seaborn-v0_8-whitegrid")
-sns.set_context("talk")
+# 경로 설정: 모듈 import 용
+CUR_DIR = os.path.dirname(os.path.abspath(__file__))
+AI_ROOT = os.path.abspath(os.path.join(CUR_DIR, ".."))
+if AI_ROOT not in sys.path:
+    sys.path.append(AI_ROOT)
 
-# CSV 불러오기
-df = pd.read_csv("./output/final_flood_score.csv")
+from scoring.projection import latlng_to_xy
+from scoring.risk_tiles import RiskTileRenderer
+from scoring.terrain import grid_from_points
 
-# 색상: final_score 기준으로 colormap 적용
-fig, ax = plt.subplots(figsize=(12, 7))
+# 위험도 지도를 XYZ 타일(z/x/y.png)로 렌더링
+# - 점마다 scatter 로 그리는 대신 격자를 바로 색상 타일로 변환
+# - 이전 실행과 점수가 같은 타일은 다시 쓰지 않으므로 갱신은 수 ms 수준
+# - 백엔드 /tiles/{layer}/{z}/{x}/{y}.png 에서 그대로 서빙
+# - DEM 위험도 레이어(dem_risk)는 analyze_dem.py 가 렌더링, 여기서는 최종 점수 레이어만
+input_csv_path = "./output/final_flood_score.csv"
+tile_dir = "./output/tiles/final_score"
 
-sc = ax.scatter(
-    df["lat"],
-    df["lng"],
-    c=df["final_score"],
-    cmap="YlOrRd",         # Yellow → Orange → Red
-    s=200,
-    edgecolors="black",
-    linewidth=0.7,
-    alpha=0.9
-)
+# CSV 불러오기 (lat, lng, final_score)
+df = pd.read_csv(input_csv_path)
 
-# 색상 범례(colorbar)
-cbar = plt.colorbar(sc)
-cbar.set_label("Flood Risk Score", fontsize=14)
+# 위경도 → EPSG:5186 격자
+x, y = latlng_to_xy(df["lat"].values, df["lng"].values)
+grid, _, _, origin = grid_from_points(x, y, df["final_score"].values)
 
-# 그래프 꾸미기
-plt.title("Flood Risk Visualization (by Final Score)", fontsize=18, weight='bold')
-plt.xlabel("lat Coordinate", fontsize=14)
-plt.ylabel("lng Coordinate", fontsize=14)
-plt.xticks(fontsize=12)
-plt.yticks(fontsize=12)
-
-plt.grid(True, linestyle="--", alpha=0.5)
-plt.tight_layout()
-plt.savefig("./output/flood_risk_map.png", dpi=300)
\ No newline at end of file
+# 타일 렌더링
+renderer = RiskTileRenderer(origin, grid.shape, tile_dir)
+updated = renderer.render(grid)
+print(f"최종 위험도 타일 {len(updated)}장 갱신 → {tile_dir}")
@@ -0,0 +1,63 @@
+# compute_risk 의 원래 if/elif 분기 구현 (테스트 기준값 전용)
+# 운영 코드는 score_table 의 컴파일된 채점기를 사용하며, 이 구현과 결과가 같아야 함
+
+# 강수량 위험도 점수 계산
+def calculate_rain_score(rn_hr1, rn_day, rn_15m_max):
+
+    score = 0.0
+
+    # 1시간 강수량 기준 
+    if rn_hr1 >= 70:
+        score += 0.4  
+    elif rn_hr1 >= 50:
+        score += 0.3   
+    elif rn_hr1 >= 30:
+        score += 0.2   
+    elif rn_hr1 >= 15:
+        score += 0.1   
+
+    # 일 누적 강수량 기준 (배수 능력 초과 여부)
+    if rn_day >= 300:
+        score += 0.4   
+    elif rn_day >= 200:
+        score += 0.3   
+    elif rn_day >= 100:
+        score += 0.2   
+    elif rn_day >= 60:
+        score += 0.1  
+
+    # 15분 강수량 기준
+    if rn_15m_max >= 20:
+        score += 0.3   # 저지대, 지하차도 침수 위험 매우 높음
+    elif rn_15m_max >= 15:
+        score += 0.2   # 도로, 배수 불량 지역 침수 위험 증가
+
+    return min(score, 1.0)
+
+# 물웅덩이(시맨틱 세그멘테이션) 점수 계산 (0.0 to 1.0)
+def calculate_puddle_score(puddle_ratio):
+    if puddle_ratio is not None:
+        if puddle_ratio >= 0.25:
+            puddle_score = max(0.7, puddle_ratio * 3.0)  # 최소 0.8
+        elif puddle_ratio >= 0.15:
+            puddle_score = max(0.4, puddle_ratio * 3.0)  # 최소 0.5
+        else:
+            puddle_score = puddle_ratio * 2.0  
+        puddle_score = min(puddle_score, 1.0)  # 상한 1.0
+    else:
+        puddle_score = 0.0
+    return puddle_score
+
+# 하수구 점수 계산 (0.0 to 1.0)
+def calculate_drain_score(clean_count, unclean_count, puddle_ratio=None):
+    total = clean_count + unclean_count
+    if total == 0:  # 하수구 탐지 X
+        # 하수구 탐지가 안 되면서 물 비율이 높으면 위험으로 간주
+        if puddle_ratio is not None and puddle_ratio > 0.5:  
+            drain_score = 0.6  # 물에 잠겼을 가능성
+        else:
+            drain_score = 0.25  # 하수구 유무 불명확, 기본값 유지
+    else:
+        ratio = unclean_count / total
+        drain_score = min(ratio * 2.0, 1.0) # 0 ~ 1
+    return drain_score
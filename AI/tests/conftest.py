@@ -0,0 +1,7 @@
+import os
+import sys
+
+# 테스트에서 scoring, detection 패키지를 import 할 수 있도록 AI 루트를 경로에 추가
+AI_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if AI_ROOT not in sys.path:
+    sys.path.insert(0, AI_ROOT)
@@ -0,0 +1,57 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# 고정 자료의 관측 시각 (2022-08-08 강남 집중호우), 과거 시각 조회(tm) 재현용
+KMA_FIXTURE_TM = 202208082100
+
+# awsh.php (help=1) 응답 형식을 흉내 낸 고정 자료
+KMA_FIXTURE_TEXT = """#START7777
+# YYMMDDHHMI STN RE_SUM RE_QCM RN_DAY RN_DAY_MI RN_HR1 RN_HR1_MI RN_60M_MAX RN_60M_MAX_MI RN_60M_QCM RN_15M_MAX RN_15M_MAX_MI RN_15M_QCM
+202208082100 10 0 0 1.0 0 0.0 0 0.0 0 0 0.0 0 0
+202208082100 401 60 0 184.5 0 92.0 0 92.0 2030 0 27.0 2045 0
+202208082100 402 60 0 55.0 0 14.5 0 20.0 2030 0 9.0 2045 0
+#7777END
+"""
+
+
+class KmaFixtureServer:
+    """KMA AWS 엔드포인트 대신 고정 자료를 돌려주는 로컬 HTTP 서버"""
+
+    def __init__(self, text=KMA_FIXTURE_TEXT, status=200):
+        self.text = text
+        self.status = status
+        self.requests = []  # 받은 요청의 쿼리 파라미터
+
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive 로 연결 재사용 확인 가능
+
+            def do_GET(self):
+                fixture.requests.append(parse_qs(urlparse(self.path).query))
+                body = fixture.text.encode("euc-kr")
+                self.send_response(fixture.status)
+                self.send_header("Content-Type", "text/plain; charset=euc-kr")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/api/typ01/url/awsh.php"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from scoring.projection import (
+    KOREA_TM,
+    WGS84,
+    distances_from,
+    get_transformer,
+    latlng_to_xy,
+    within_radius,
+    xy_to_latlng,
+)
+
+# 강남역, 교대역 부근
+LAT = np.array([37.49858578128938, 37.4934])
+LNG = np.array([127.02676215392935, 127.0140])
+
+
+def test_transformer_is_shared():
+    assert get_transformer(WGS84, KOREA_TM) is get_transformer(WGS84, KOREA_TM)
+    assert get_transformer(KOREA_TM, WGS84) is not get_transformer(WGS84, KOREA_TM)
+
+
+def test_round_trip_batch_and_scalar():
+    x, y = latlng_to_xy(LAT, LNG)
+    assert x.shape == (2,)
+    assert (float(x[0]), float(y[0])) == pytest.approx((202366.5, 544347.5), abs=1e-3)
+
+    lat, lng = xy_to_latlng(x, y)
+    np.testing.assert_allclose(lat, LAT, atol=1e-9)
+    np.testing.assert_allclose(lng, LNG, atol=1e-9)
+
+    sx, sy = latlng_to_xy(LAT[0], LNG[0])
+    assert (float(sx), float(sy)) == pytest.approx((x[0], y[0]))
+
+
+def test_distances_and_radius():
+    # 위도 0.01도 ≈ 1110m (EPSG:5186 축척 계수는 1 에 가까움)
+    lat = np.array([37.5, 37.51, 37.5])
+    lng = np.array([127.0, 127.0, 127.0])
+    distances = distances_from(lat, lng, 37.5, 127.0)
+    assert distances[0] == pytest.approx(0.0, abs=1e-6)
+    assert distances[1] == pytest.approx(1109.6, abs=2.0)
+
+    assert within_radius(lat, lng, 37.5, 127.0, 1000).tolist() == [True, False, True]
+    assert within_radius(lat, lng, 37.5, 127.0, 1200).all()
@@ -0,0 +1,98 @@
+import time
+
+from kma_fixture import KMA_FIXTURE_TEXT, KMA_FIXTURE_TM, KmaFixtureServer
+from scoring.compute_risk import DEFAULT_RAIN_SCORE, compute_flood_risk
+from scoring.get_rainfall import parse_rain_table
+from scoring.rainfall_service import RAIN_MISSING, RAIN_STALE, RainfallService
+
+
+def test_parse_rain_table_indexes_by_station():
+    table = parse_rain_table(KMA_FIXTURE_TEXT)
+
+    assert set(table) == {10, 401, 402}
+    assert table[401]["RN_HR1"] == 92.0
+    assert table[401]["RN_DAY"] == 184.5
+    assert table[401]["RN_15M_MAX"] == 27.0
+
+
+def test_poll_once_serves_lookups_from_memory():
+    with KmaFixtureServer() as fixture:
+        service = RainfallService(url=fixture.url, api_key="test", tm=KMA_FIXTURE_TM)
+        assert service.get(401) is None  # 아직 폴링 전
+
+        assert service.poll_once()
+        for _ in range(100):
+            assert service.get(401) == {"RN_HR1": 92.0, "RN_DAY": 184.5, "RN_15M_MAX": 27.0}
+        assert service.get(999) is None
+
+        # 조회는 네트워크를 타지 않으므로 요청은 한 번뿐
+        assert len(fixture.requests) == 1
+        assert fixture.requests[0]["tm"] == [str(KMA_FIXTURE_TM)]
+        service.stop()
+
+
+def test_stale_readings_are_not_served():
+    with KmaFixtureServer() as fixture:
+        service = RainfallService(url=fixture.url, api_key="test", ttl=0.05)
+        assert service.poll_once()
+        assert service.get(402) is not None
+        time.sleep(0.1)
+        assert service.is_stale()
+        assert service.get(402) is None
+        service.stop()
+
+
+def test_fallback_is_reported_once_per_state_change(capsys):
+    with KmaFixtureServer() as fixture:
+        service = RainfallService(url=fixture.url, api_key="test", ttl=0.05)
+        for _ in range(3):
+            assert service.get(401) is None
+        assert service.fallback_reason(401) == RAIN_STALE
+
+        assert service.poll_once()
+        assert service.get(401) is not None
+        assert service.fallback_reason(401) is None
+        assert service.get(999) is None
+        assert service.fallback_reason(999) == RAIN_MISSING
+        service.stop()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3  # 만료 경고 1회, 복구 1회, 지점 없음 경고 1회
+    assert "STN 401" in lines[0] and "경고" in lines[0]
+    assert "STN 999" in lines[2] and "경고" in lines[2]
+
+
+def test_missing_rain_data_marks_fallback(tmp_path):
+    dem_csv = tmp_path / "dem.csv"
+    dem_csv.write_text("lat,lng,risk_score\n37.5,127.0,0.5\n")
+    rain = {"RN_HR1": 92.0, "RN_DAY": 184.5, "RN_15M_MAX": 27.0}
+
+    fallback = compute_flood_risk(dem_csv_path=dem_csv, puddle_ratio=0.5)
+    measured = compute_flood_risk(dem_csv_path=dem_csv, puddle_ratio=0.5, rain_data=rain)
+
+    assert fallback["rain_fallback"].tolist() == [True]
+    assert fallback["rain_score"].tolist() == [DEFAULT_RAIN_SCORE]
+    assert measured["rain_fallback"].tolist() == [False]
+
+
+def test_failed_poll_keeps_previous_readings():
+    with KmaFixtureServer() as fixture:
+        service = RainfallService(url=fixture.url, api_key="test")
+        assert service.poll_once()
+
+        fixture.status = 404
+        assert not service.poll_once()
+        assert service.get(401)["RN_HR1"] == 92.0
+        service.stop()
+
+
+def test_background_thread_polls_on_start():
+    with KmaFixtureServer() as fixture:
+        service = RainfallService(url=fixture.url, api_key="test").start()
+        try:
+            deadline = time.monotonic() + 5.0
+            while service.get(401) is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert service.get(401) is not None
+        finally:
+            service.stop()
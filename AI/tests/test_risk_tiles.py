@@ -0,0 +1,63 @@
+import numpy as np
+
+from scoring.projection import latlng_to_xy
+from scoring.risk_tiles import NODATA, RiskTileRenderer, quantize_scores
+
+
+def _renderer(tile_dir):
+    # 강남역 부근 20 x 30 격자 (90m)
+    x, y = latlng_to_xy(37.4979, 127.0276)
+    origin = (float(x), float(y), 90.0)
+    return RiskTileRenderer(origin, (20, 30), str(tile_dir), min_zoom=13, max_zoom=15)
+
+
+def test_quantize_scores():
+    index = quantize_scores([np.nan, 0.0, 0.5, 1.0, 2.0])
+    assert index.tolist() == [NODATA, 1, 128, 255, 255]
+
+
+def test_render_only_rewrites_changed_tiles(tmp_path):
+    scores = np.linspace(0.0, 1.0, 600).reshape(20, 30)
+    renderer = _renderer(tmp_path)
+
+    written = renderer.render(scores)
+    assert written
+    assert all((tmp_path / f"{key}.png").exists() for key in written)
+
+    # 점수가 같으면 새 렌더러(manifest 재사용)여도 다시 쓰지 않음
+    assert _renderer(tmp_path).render(scores) == []
+
+    # 셀 하나만 바뀌면 그 셀을 포함하는 타일만 (줌 레벨마다 최대 몇 장) 다시 씀
+    scores[10, 15] = 0.0
+    rewritten = renderer.render(scores)
+    assert 0 < len(rewritten) < len(written)
+    assert {key.split("/")[0] for key in rewritten} == {"13", "14", "15"}
+
+
+def test_lookups_are_int32_and_bounded(tmp_path):
+    scores = np.linspace(0.0, 1.0, 600).reshape(20, 30)
+    x, y = latlng_to_xy(37.4979, 127.0276)
+    renderer = RiskTileRenderer(
+        (float(x), float(y), 90.0), (20, 30), str(tmp_path), min_zoom=13, max_zoom=15, max_lookups=2
+    )
+    renderer.render(scores)
+
+    assert len(renderer._lookups) == 2
+    assert all(lookup.dtype == np.int32 for lookup in renderer._lookups.values())
+    # 최근에 쓴 타일 매핑만 남음
+    assert list(renderer._lookups) == list(renderer.tiles())[-2:]
+
+
+def test_unchanged_blocks_skip_tile_mapping(tmp_path):
+    scores = np.linspace(0.0, 1.0, 600).reshape(20, 30)
+    _renderer(tmp_path).render(scores)
+
+    # 새 렌더러: 블록 해시만 비교하고 픽셀 매핑은 만들지 않음
+    renderer = _renderer(tmp_path)
+    assert renderer.max_lookups == len(list(renderer.tiles()))
+    assert renderer.render(scores) == []
+    assert not renderer._lookups
+
+    scores[0, 0] = np.nan
+    assert renderer.render(scores)
+    assert 0 < len(renderer._lookups) < renderer.max_lookups
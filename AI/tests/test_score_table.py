@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from branch_scores import calculate_drain_score, calculate_puddle_score, calculate_rain_score
+from scoring import compute_risk
+from scoring.score_table import SCORE_TABLE, compile_score_table, score_batch
+
+
+# 기준값 경계(같은 값, 바로 아래/위)를 모두 포함하는 입력
+def _edges(thresholds, extra):
+    values = set(extra)
+    for t in thresholds:
+        values.update((t, np.nextafter(t, -np.inf), np.nextafter(t, np.inf)))
+    return np.array(sorted(values))
+
+
+def test_rain_score_matches_branches():
+    rn_hr1 = _edges(SCORE_TABLE["rain"]["rn_hr1"]["thresholds"], [0.0, 5.5, 120.0])
+    rn_day = _edges(SCORE_TABLE["rain"]["rn_day"]["thresholds"], [0.0, 80.0, 500.0])
+    rn_15m = _edges(SCORE_TABLE["rain"]["rn_15m_max"]["thresholds"], [0.0, 7.0, 40.0])
+    h, d, m = (a.ravel() for a in np.meshgrid(rn_hr1, rn_day, rn_15m))
+
+    expected = [calculate_rain_score(*args) for args in zip(h.tolist(), d.tolist(), m.tolist())]
+    np.testing.assert_array_equal(score_batch(h, d, m)["rain_score"], expected)
+
+
+def test_puddle_and_drain_scores_match_branches():
+    rng = np.random.default_rng(0)
+    ratios = np.concatenate([
+        _edges([0.15, 0.25, 0.5], [0.0, 1 / 3, 1.0]),
+        rng.random(2000),
+    ])
+    clean = rng.integers(0, 5, ratios.size)
+    unclean = rng.integers(0, 5, ratios.size)
+    # 절반은 시맨틱 결과 없음(None)
+    missing = np.arange(ratios.size) % 2 == 1
+    ratio_args = [None if m else float(r) for r, m in zip(ratios, missing)]
+
+    result = score_batch(0.0, 0.0, 0.0, clean, unclean, np.where(missing, np.nan, ratios))
+
+    np.testing.assert_array_equal(
+        result["puddle_score"], [calculate_puddle_score(r) for r in ratio_args]
+    )
+    np.testing.assert_array_equal(
+        result["drain_score"],
+        [calculate_drain_score(int(c), int(u), r) for c, u, r in zip(clean, unclean, ratio_args)],
+    )
+
+
+def test_compile_rejects_unsorted_thresholds():
+    table = {**SCORE_TABLE, "rain": {**SCORE_TABLE["rain"], "rn_hr1": {"thresholds": [30, 15], "values": [0, 1, 2]}}}
+    with pytest.raises(ValueError):
+        compile_score_table(table)
+
+
+def test_compute_risk_wrappers_delegate_to_table():
+    assert compute_risk.calculate_rain_score(30, 100, 20) == calculate_rain_score(30, 100, 20)
+    assert compute_risk.calculate_puddle_score(None) == calculate_puddle_score(None)
+    assert compute_risk.calculate_puddle_score(0.2) == calculate_puddle_score(0.2)
+    assert compute_risk.calculate_drain_score(0, 0, 0.6) == calculate_drain_score(0, 0, 0.6)
+    assert compute_risk.calculate_drain_score(1, 3) == calculate_drain_score(1, 3)
+    assert isinstance(compute_risk.calculate_rain_score(0, 0, 0), float)
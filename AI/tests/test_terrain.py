@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from scoring.terrain import (
+    NO_FLOW,
+    analyze_terrain,
+    compute_slope_aspect,
+    d8_flow_direction,
+    fill_depressions,
+    flow_accumulation,
+)
+
+
+def test_slope_and_aspect_on_plane():
+    # 동쪽으로 0.5 m/m 올라가는 평면 → 경사 atan(0.5), 내리막은 서쪽(270도)
+    cols = np.arange(6, dtype=float)
+    dem = np.tile(0.5 * cols * 2.0, (5, 1))
+    slope, aspect = compute_slope_aspect(dem, cell_size=2.0)
+    np.testing.assert_allclose(slope, np.degrees(np.arctan(0.5)))
+    np.testing.assert_allclose(aspect, 270.0)
+
+
+def test_accumulation_on_v_valley():
+    # 가운데 열로 모여 남쪽 끝 한 셀로 빠지는 V 자 계곡
+    rows, cols = np.mgrid[0:10, 0:5]
+    dem = np.abs(cols - 2) + 0.1 * (9 - rows)
+    acc = flow_accumulation(d8_flow_direction(dem))
+    # 양쪽 사면은 같은 행의 계곡 셀로 들어가므로 r 행까지의 셀 전부가 누적
+    np.testing.assert_array_equal(acc[:, 2], 5 * np.arange(1, 11))
+    assert acc[9, 2] == dem.size
+
+
+def test_fill_depth_on_pit():
+    dem = np.full((5, 5), 10.0)
+    dem[2, 2] = 8.0
+    filled = fill_depressions(dem)
+    assert filled[2, 2] == 10.0
+    layers = analyze_terrain(dem, cell_size=1.0)
+    assert layers["depression_depth"][2, 2] == pytest.approx(2.0)
+
+
+def test_no_depression_on_flat_or_sloping_ground():
+    rows, cols = np.mgrid[0:6, 0:6]
+    for dem in (np.full((6, 6), 10.0), 0.3 * rows + 0.1 * cols):
+        layers = analyze_terrain(dem.astype(float), cell_size=1.0)
+        assert (layers["depression_depth"] == 0).all()
+        np.testing.assert_array_equal(fill_depressions(dem.astype(float)), dem)
+
+
+def test_flow_crosses_pits_and_flats():
+    # 잡음 웅덩이와 평지가 있어도 배수망이 경계까지 이어져야 함
+    rng = np.random.default_rng(0)
+    rows, _ = np.mgrid[0:60, 0:60]
+    dem = 0.01 * rows + rng.normal(0, 0.5, rows.shape)
+    dem[20:30, 20:30] = dem[20:30, 20:30].mean()
+
+    layers = analyze_terrain(dem, cell_size=1.0)
+    direction = layers["flow_direction"]
+    interior = direction[1:-1, 1:-1]
+    assert (interior != NO_FLOW).all()
+    assert layers["flow_accumulation"].max() > dem.size / 10
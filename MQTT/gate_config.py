@@ -0,0 +1,98 @@
+import json
+import os
+
+from gate_controller import Gate
+
+# 게이트 설정 (JSON)
+# {
+#   "current_budget": 동시에 구동할 수 있는 모터 전류 합 (A),
+#   "gates": [
+#     {"id": 명령에서 쓰는 고정 id, "key": 상태 발행 키,
+#      "pins": {"in1", "in2", "led", "buzzer"(선택)},
+#      "close_time", "open_time": 구동 시간(초),
+#      "current": 구동 전류 (A),
+#      "danger_delay": Danger 경고음 후 닫기 시작 지연(초),
+#      "groups": 소속 그룹 이름 목록}
+#   ]
+# }
+# 명령 대상은 게이트 id, 그룹 이름, 또는 ALL
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gates.json")
+ALL = "ALL"
+
+REQUIRED_GATE_FIELDS = ("id", "key", "pins", "close_time", "open_time")
+REQUIRED_PINS = ("in1", "in2", "led")
+
+
+def load_gate_config(path=None):
+    """게이트 설정 로드 + 검증 (path 미지정 시 GATE_CONFIG 환경변수, 기본 gates.json)"""
+    path = path or os.getenv("GATE_CONFIG", DEFAULT_CONFIG_PATH)
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+    validate_gate_config(config)
+    return config
+
+
+def validate_gate_config(config):
+    gates = config.get("gates")
+    if not gates:
+        raise ValueError("게이트 설정에 gates 가 없습니다.")
+
+    ids, pins = set(), set()
+    for gate in gates:
+        missing = [field for field in REQUIRED_GATE_FIELDS if field not in gate]
+        missing += [f"pins.{pin}" for pin in REQUIRED_PINS if pin not in gate.get("pins", {})]
+        if missing:
+            raise ValueError(f"게이트 {gate.get('id')} 설정 누락: {', '.join(missing)}")
+        if gate["id"] in ids or gate["id"] == ALL:
+            raise ValueError(f"게이트 id 중복/예약어: {gate['id']}")
+        ids.add(gate["id"])
+
+        for pin in gate["pins"].values():
+            if pin in pins:
+                raise ValueError(f"핀 {pin} 이 여러 게이트에 할당되었습니다.")
+            pins.add(pin)
+
+    budget = config.get("current_budget")
+    if budget is not None:
+        too_big = [g["id"] for g in gates if g.get("current", 0.0) > budget]
+        if too_big:
+            raise ValueError(f"전류 예산보다 큰 게이트: {', '.join(too_big)}")
+
+
+def setup_gate_pins(config, gpio):
+    """설정된 모든 핀을 출력/LOW 로 초기화하고 부저 PWM 생성 {id: pwm}"""
+    buzzers = {}
+    for gate in config["gates"]:
+        for name, pin in gate["pins"].items():
+            gpio.setup(pin, gpio.OUT)
+            if name != "buzzer":
+                gpio.output(pin, gpio.LOW)
+        if "buzzer" in gate["pins"]:
+            buzzers[gate["id"]] = gpio.PWM(gate["pins"]["buzzer"], 1000)
+    return buzzers
+
+
+def build_gates(config, gpio, buzzers):
+    """설정 순서대로 {id: Gate}"""
+    return {
+        cfg["id"]: Gate(
+            cfg["id"], cfg["key"], gpio,
+            (cfg["pins"]["in1"], cfg["pins"]["in2"]), cfg["pins"]["led"],
+            buzzers.get(cfg["id"]),
+            close_time=cfg["close_time"],
+            open_time=cfg["open_time"],
+            current=cfg.get("current", 0.0),
+            danger_delay=cfg.get("danger_delay", 0.0),
+            groups=cfg.get("groups", []),
+        )
+        for cfg in config["gates"]
+    }
+
+
+def resolve_targets(gates, target):
+    """명령 대상(게이트 id / 그룹 / ALL) → Gate 목록 (없으면 빈 목록)"""
+    if target == ALL:
+        return list(gates.values())
+    if target in gates:
+        return [gates[target]]
+    return [gate for gate in gates.values() if target in gate.groups]
@@ -0,0 +1,250 @@
+import heapq
+import itertools
+
+# 게이트 상태 (발행 값은 기존과 동일하게 OPEN / CLOSED, 이동 시작 시점에 목표 상태로 변경)
+OPEN, CLOSED = "OPEN", "CLOSED"
+IDLE, OPENING, CLOSING = "IDLE", "OPENING", "CLOSING"
+
+# 명령 우선순위 (작을수록 먼저 실행)
+PRIORITY_MANUAL = 0
+PRIORITY_JETSON = 1
+
+# 부저 음 길이 = 박자 * NOTE_UNIT, 음 사이 쉼 NOTE_GAP (초)
+NOTE_UNIT = 0.4
+NOTE_GAP = 0.05
+
+
+class Gate:
+    """게이트 1개의 상태 머신: IDLE ↔ OPENING / CLOSING
+
+    핀 출력과 상태 변경은 모두 스케줄러 스레드에서만 호출된다.
+    """
+
+    def __init__(self, name, key, gpio, in_pins, led, buzzer=None,
+                 close_time=0.0, open_time=0.0, current=0.0, danger_delay=0.0, groups=()):
+        self.name = name          # 설정의 고정 id ('A', 'B', ...)
+        self.key = key            # 발행 키 (gate_a, gate_b)
+        self.gpio = gpio
+        self.in_pins = in_pins
+        self.led = led
+        self.buzzer = buzzer      # PWM 객체 (없으면 부저 없음)
+        self.close_time = close_time
+        self.open_time = open_time
+        self.current = current    # 구동 전류 (A), 전류 예산 계산용
+        self.danger_delay = danger_delay
+        self.groups = set(groups)
+        self.state = OPEN
+        self.motion = IDLE
+
+    def travel_time(self, direction):
+        return self.open_time if direction == "forward" else self.close_time
+
+    def drive(self, direction):
+        gpio, (in1, in2) = self.gpio, self.in_pins
+        if direction == "forward":     # 열기 방향
+            gpio.output(in1, gpio.LOW)
+            gpio.output(in2, gpio.HIGH)
+            gpio.output(self.led, gpio.HIGH)
+            self.state, self.motion = OPEN, OPENING
+        elif direction == "backward":  # 닫기 방향
+            gpio.output(in1, gpio.HIGH)
+            gpio.output(in2, gpio.LOW)
+            gpio.output(self.led, gpio.HIGH)
+            self.state, self.motion = CLOSED, CLOSING
+        else:  # stop
+            gpio.output(in1, gpio.LOW)
+            gpio.output(in2, gpio.LOW)
+            gpio.output(self.led, gpio.LOW)
+            self.motion = IDLE
+
+    def buzz(self, freq):
+        if self.buzzer is not None:
+            self.buzzer.ChangeFrequency(freq)
+            self.buzzer.start(50)
+
+    def quiet(self):
+        if self.buzzer is not None:
+            self.buzzer.stop()
+
+    def halt(self):
+        """안전 정지: 모터 정지 + 부저 끔"""
+        self.drive("stop")
+        self.quiet()
+
+
+class Sequence:
+    """시작 시점 기준 오프셋(초)으로 나열한 게이트 동작 단계 목록"""
+
+    def __init__(self, name, priority, preemptive=False):
+        self.name = name
+        self.priority = priority
+        self.preemptive = preemptive  # 실행 중인 같은/낮은 우선순위 시퀀스를 중단시키고 시작
+        self.steps = []               # (offset, callback, args)
+        self.gates = set()
+
+    @property
+    def duration(self):
+        return max((offset for offset, _, _ in self.steps), default=0.0)
+
+    def at(self, offset, callback, *args):
+        self.steps.append((offset, callback, args))
+        return self
+
+    def move(self, gate, direction, duration, at=0.0):
+        """at 에 구동 시작, duration 후 정지. 정지 시각 반환"""
+        self.gates.add(gate)
+        self.at(at, gate.drive, direction)
+        self.at(at + duration, gate.drive, "stop")
+        return at + duration
+
+    def move_group(self, moves, current_budget=None):
+        """여러 게이트를 동시에 구동하되 동시 구동 전류 합이 예산을 넘지 않게 배치
+
+        Args:
+            moves: [(gate, direction, earliest)] - earliest 이후 가능한 가장 이른 시각에 시작
+            current_budget: 동시 구동 전류 상한 (None 이면 제한 없음)
+
+        Returns:
+            마지막 게이트가 멈추는 시각
+        """
+        planned = []  # (start, end, current)
+        end = 0.0
+        for gate, direction, earliest in sorted(moves, key=lambda m: m[2]):
+            duration = gate.travel_time(direction)
+            start = _earliest_start(planned, earliest, duration, gate.current, current_budget)
+            planned.append((start, start + duration, gate.current))
+            end = max(end, self.move(gate, direction, duration, at=start))
+        return end
+
+    def melody(self, gate, melody, frequencies, at=0.0):
+        """부저로 멜로디 연주. 연주가 끝나는 시각 반환"""
+        self.gates.add(gate)
+        t = at
+        for note, length in melody:
+            freq = frequencies.get(note)
+            if not freq:
+                continue
+            self.at(t, gate.buzz, freq)
+            t += NOTE_UNIT * length
+            self.at(t, gate.quiet)
+            t += NOTE_GAP
+        return t
+
+
+def _load_at(planned, t):
+    return sum(current for start, end, current in planned if start <= t < end)
+
+
+def _earliest_start(planned, earliest, duration, current, budget):
+    """planned 구동들과 겹쳐도 전류 합이 budget 이하가 되는 가장 이른 시작 시각"""
+    if budget is None:
+        return earliest
+    # 후보: 요청 시각 또는 다른 구동이 끝나는 시각 (부하는 그때만 줄어듦)
+    candidates = sorted({earliest, *(end for _, end, _ in planned if end > earliest)})
+    for t in candidates:
+        # 구간 [t, t + duration) 의 부하는 시작 시각 t 와 그 안에서 시작하는 구동 시점에서만 커짐
+        checkpoints = [t] + [start for start, _, _ in planned if t < start < t + duration]
+        if all(_load_at(planned, c) + current <= budget for c in checkpoints):
+            return t
+    return candidates[-1]
+
+
+class GateController:
+    """게이트 시퀀스 스케줄러
+
+    - 시퀀스의 각 단계는 Scheduler 에 시각별 콜백으로 예약 (단계마다 스레드/ sleep 없음)
+    - 실행 중 들어온 명령은 버리지 않고 (우선순위, 도착 순) 대기열에 보관
+    - preemptive 시퀀스(수동 명령)는 실행 중인 시퀀스의 남은 단계를 취소하고
+      관련 게이트를 안전 정지시킨 뒤 바로 시작
+    - 모든 상태 변경은 스케줄러 스레드에서만 일어나므로 별도 락이 필요 없음
+    """
+
+    def __init__(self, gates, scheduler, on_idle=None):
+        self.gates = gates            # {name: Gate}
+        self.scheduler = scheduler
+        self.on_idle = on_idle        # 시퀀스 종료/중단 후 호출 (상태 발행 등)
+        self.current = None
+        self._handles = []
+        self._pending = []
+        self._counter = itertools.count()
+
+    # ─────────────────────────────────────
+    # 조회
+    @property
+    def busy(self):
+        return self.current is not None
+
+    @property
+    def pending(self):
+        """대기 중인 시퀀스 수"""
+        return len(self._pending)
+
+    def states(self):
+        return {gate.key: gate.state for gate in self.gates.values()}
+
+    # ─────────────────────────────────────
+    # 명령
+    def submit(self, sequence):
+        """시퀀스 실행 요청 (어느 스레드에서든 즉시 반환)"""
+        self.scheduler.call_soon(self._submit, sequence)
+
+    def _submit(self, sequence):
+        current = self.current
+        if current is None:
+            self._start(sequence)
+        elif sequence.preemptive and sequence.priority <= current.priority:
+            print(f"[SEQ] '{sequence.name}' preempts '{current.name}'")
+            self._cancel_current()
+            self._start(sequence)
+        else:
+            print(f"[SEQ] Busy ({current.name}). Queued '{sequence.name}'")
+            heapq.heappush(self._pending, (sequence.priority, next(self._counter), sequence))
+
+    def _start(self, sequence):
+        print(f"[SEQ] Start '{sequence.name}' ({sequence.duration:.2f}s)")
+        self.current = sequence
+        t0 = self.scheduler.clock()
+        self._handles = [
+            self.scheduler.call_at(t0 + offset, callback, *args)
+            for offset, callback, args in sequence.steps
+        ]
+        self._handles.append(self.scheduler.call_at(t0 + sequence.duration, self._finish, sequence))
+
+    def _cancel_current(self):
+        for handle in self._handles:
+            handle.cancel()
+        self._handles = []
+        for gate in self.current.gates:
+            gate.halt()
+        self.current = None
+        self._notify_idle()
+
+    def _finish(self, sequence):
+        if sequence is not self.current:
+            return
+        for gate in sequence.gates:
+            gate.halt()
+        print(f"[SEQ] '{sequence.name}' finished.")
+        self.current = None
+        self._handles = []
+        self._notify_idle()
+        if self._pending:
+            _, _, sequence = heapq.heappop(self._pending)
+            self._start(sequence)
+
+    def _notify_idle(self):
+        if self.on_idle is not None:
+            try:
+                self.on_idle()
+            except Exception as e:
+                print(f"[SEQ] on_idle error: {e}")
+
+    def halt_all(self):
+        """대기열을 비우고 모든 게이트 안전 정지 (종료 시)"""
+        for handle in self._handles:
+            handle.cancel()
+        self._handles = []
+        self._pending = []
+        self.current = None
+        for gate in self.gates.values():
+            gate.halt()
@@ -0,0 +1,148 @@
+import os
+import threading
+import time
+
+# GPIO 백엔드
+# - RealGPIO: 라즈베리파이 RPi.GPIO (Pi 에서만 import 가능)
+# - SimulatedGPIO: 핀 출력 변화를 시각과 함께 기록 (x86 CI / 타이밍 테스트용)
+# 환경변수 GATE_GPIO_BACKEND=rpi|sim 으로 선택 (기본 rpi)
+
+
+class RealGPIO:
+    """RPi.GPIO 를 감싼 백엔드"""
+
+    def __init__(self):
+        import RPi.GPIO as GPIO  # Pi 가 아니면 여기서 실패
+
+        self._gpio = GPIO
+        self.LOW, self.HIGH = GPIO.LOW, GPIO.HIGH
+        self.OUT, self.BCM = GPIO.OUT, GPIO.BCM
+
+    def setmode(self, mode):
+        self._gpio.setmode(mode)
+
+    def setwarnings(self, flag):
+        self._gpio.setwarnings(flag)
+
+    def setup(self, pin, mode):
+        self._gpio.setup(pin, mode)
+
+    def output(self, pin, value):
+        self._gpio.output(pin, value)
+
+    def PWM(self, pin, freq):
+        return self._gpio.PWM(pin, freq)
+
+    def cleanup(self):
+        self._gpio.cleanup()
+
+
+class SimulatedPWM:
+    """부저 PWM 시뮬레이션: 켜짐/꺼짐을 주파수 값으로 기록 (꺼짐은 0)"""
+
+    def __init__(self, gpio, pin, freq):
+        self.gpio = gpio
+        self.pin = pin
+        self.freq = freq
+        self.running = False
+
+    def ChangeFrequency(self, freq):
+        self.freq = freq
+        if self.running:
+            self.gpio._record(self.pin, freq)
+
+    def start(self, duty):
+        self.running = True
+        self.gpio._record(self.pin, self.freq)
+
+    def stop(self):
+        self.running = False
+        self.gpio._record(self.pin, 0)
+
+
+class SimulatedGPIO:
+    """핀 전이를 (시각, 핀, 값) 으로 기록하는 가상 GPIO
+
+    Args:
+        clock: 기록에 쓸 시계 (스케줄러와 같은 시계를 넘기면 시퀀스 시간 기준으로 기록)
+    """
+
+    LOW, HIGH = 0, 1
+    OUT, BCM = "OUT", "BCM"
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.levels = {}
+        self.transitions = []   # (t, pin, value) - 값이 바뀐 경우만
+        self._lock = threading.Lock()
+
+    def _record(self, pin, value):
+        with self._lock:
+            if self.levels.get(pin) == value:
+                return
+            self.levels[pin] = value
+            self.transitions.append((self.clock(), pin, value))
+
+    def setmode(self, mode):
+        pass
+
+    def setwarnings(self, flag):
+        pass
+
+    def setup(self, pin, mode):
+        with self._lock:
+            self.levels.setdefault(pin, self.LOW)
+
+    def output(self, pin, value):
+        self._record(pin, value)
+
+    def PWM(self, pin, freq):
+        return SimulatedPWM(self, pin, freq)
+
+    def cleanup(self):
+        pass
+
+    # ─────────────────────────────────────
+    # 기록 조회
+    def history(self, pin, since=None):
+        with self._lock:
+            return [
+                (t, value) for t, p, value in self.transitions
+                if p == pin and (since is None or t >= since)
+            ]
+
+    def high_intervals(self, pin, since=None):
+        """핀이 켜져 있던 구간 [(시작, 끝)], 아직 켜져 있으면 끝은 None"""
+        intervals, start = [], None
+        for t, value in self.history(pin, since):
+            if value and start is None:
+                start = t
+            elif not value and start is not None:
+                intervals.append((start, t))
+                start = None
+        if start is not None:
+            intervals.append((start, None))
+        return intervals
+
+    def clear(self):
+        with self._lock:
+            self.transitions = []
+
+
+GPIO_BACKENDS = {
+    "rpi": RealGPIO,
+    "sim": SimulatedGPIO,
+}
+
+
+def create_gpio(backend=None, **kwargs):
+    """GPIO 백엔드 생성 (backend 미지정 시 GATE_GPIO_BACKEND 환경변수, 기본 rpi)
+
+    kwargs 는 시뮬레이션 백엔드에만 전달 (clock 등)
+    """
+    name = (backend or os.getenv("GATE_GPIO_BACKEND", "rpi")).lower()
+    if name not in GPIO_BACKENDS:
+        raise ValueError(f"Unknown GPIO backend: {name} (choose from {', '.join(GPIO_BACKENDS)})")
+    if name == "rpi":
+        return RealGPIO()
+    return SimulatedGPIO(**kwargs)
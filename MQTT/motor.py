@@ -1,9 +1,13 @@
-import RPi.GPIO as GPIO
-import time
-import threading
+import os
 import paho.mqtt.client as mqtt
 import json
 
+from gate_config import build_gates, load_gate_config, resolve_targets, setup_gate_pins
+from gate_controller import GateController, Sequence, PRIORITY_JETSON, PRIORITY_MANUAL
+from gpio_backend import create_gpio
+from scheduler import Scheduler
+from status_publisher import StatusPublisher
+
 # --- 설정 ---
 BROKER = "192.168.100.92"
 PORT = 1883
@@ -12,14 +16,9 @@ PUB_TOPIC_STATUS = "topic/rpi_work"
 SUB_TOPIC_JETSON = "topic/jetson_score"
 SUB_TOPIC_MANUAL = "topic/backend_command"
 
-# 모터 제어 GPIO 핀 (BCM 모드)
-IN1, IN2 = 6, 26   # Gate A
-IN4, IN3 = 23, 24  # Gate B
-
-# LED 및 부저 GPIO 핀 (세트별)
-LED1, BUZZ1 = 27, 21
-LED2, BUZZ2 = 17, 20
-
+# 게이트 구성 (핀, 동작 시간, 그룹, 전류 예산) - gates.json 또는 GATE_CONFIG 경로
+GATE_CONFIG = load_gate_config()
+CURRENT_BUDGET = GATE_CONFIG.get("current_budget")  # 없으면 동시 구동 제한 없음
 
 # 음계별 주파수
 NOTE_FREQUENCIES = {
@@ -34,191 +33,93 @@ MELODY = [
     ('A4', 0.7), ('A4', 0.7), ('E4', 0.7), ('E4', 0.7), ('G4', 1.2)
 ]
 
-# --- 동작 시간(초) ---
-A_CLOSE_TIME = 5.05
-B_CLOSE_TIME = 3.70
-# 수동 open 시간은 닫힘과 동일하게 가정 (필요시 조정)
-A_OPEN_TIME  = 5.25
-B_OPEN_TIME  = 3.70
-
-# Jetson Danger일 때 A 시작 기준으로 B를 시작할 지연(초)
-A_DELAY_AFTER_B_START = 5.00
+# GPIO 백엔드 (rpi: 실제 핀, sim: 핀 전이 기록) / 시간 배속 (시뮬레이션 전용)
+GPIO_BACKEND = os.getenv("GATE_GPIO_BACKEND", "rpi")
+TIME_SCALE = float(os.getenv("GATE_TIME_SCALE", "1.0"))
 
 # --- GPIO 초기화 ---
-GPIO.setmode(GPIO.BCM)
-GPIO.setwarnings(False)
+def init_gpio(backend, clock):
+    gpio = create_gpio(backend, clock=clock)  # 실제 핀은 clock 미사용
+    gpio.setmode(gpio.BCM)
+    gpio.setwarnings(False)
+
+    # 모터/LED 핀은 LOW 로, 부저는 PWM 으로 초기화 (Danger 경고음)
+    return gpio, setup_gate_pins(GATE_CONFIG, gpio)
+
+# --- 게이트 / 스케줄러 ---
+# 게이트별 상태 머신 + 힙 기반 스케줄러 (시퀀스 단계를 시각별 콜백으로 예약)
+# paho 네트워크 루프 스레드는 시퀀스를 넣기만 하고 즉시 반환하므로
+# 동작 중에도 keepalive / QoS1 PUBACK / 상태 발행이 계속 처리된다.
+scheduler = Scheduler(time_scale=TIME_SCALE)
+GPIO, buzzers = init_gpio(GPIO_BACKEND, scheduler.clock)
 
-pins = [IN1, IN2, IN4, IN3, LED1, LED2]
-for p in pins:
-    GPIO.setup(p, GPIO.OUT)
-    GPIO.output(p, GPIO.LOW)
+gates = build_gates(GATE_CONFIG, GPIO, buzzers)  # {id: Gate}, 설정 순서
 
-# 부저 PWM 초기화 (현재 미사용)
-GPIO.setup(BUZZ1, GPIO.OUT)
-GPIO.setup(BUZZ2, GPIO.OUT)
-pwm_b1 = GPIO.PWM(BUZZ1, 1000)
-pwm_b2 = GPIO.PWM(BUZZ2, 1000)
+controller = GateController(gates, scheduler)
 
 # --- 상태 관리 변수 ---
-gate_states = {"gate_a": "OPEN", "gate_b": "OPEN"}
 jetson_data = {}
-is_motor_running = False
-busy_reason = None
 danger_sequence_activated = False  # Danger 최초 1회만 동작
 
-# ─────────────────────────────────────
-# 유틸: 모터 제어
-def control_motor(gate, direction):
-    if gate == 'A':
-        in_pins, led_pin, key = (IN1, IN2), LED1, "gate_a"
-    else:  # gate == 'B'
-        in_pins, led_pin, key = (IN4, IN3), LED2, "gate_b"
-
-    if direction == "forward":     # 열기 방향
-        GPIO.output(in_pins[0], GPIO.LOW)
-        GPIO.output(in_pins[1], GPIO.HIGH)
-        GPIO.output(led_pin, GPIO.HIGH)
-        gate_states[key] = "OPEN"
-    elif direction == "backward":  # 닫기 방향
-        GPIO.output(in_pins[0], GPIO.HIGH)
-        GPIO.output(in_pins[1], GPIO.LOW)
-        GPIO.output(led_pin, GPIO.HIGH)
-        gate_states[key] = "CLOSED"
-    else:  # stop
-        GPIO.output(in_pins[0], GPIO.LOW)
-        GPIO.output(in_pins[1], GPIO.LOW)
-        GPIO.output(led_pin, GPIO.LOW)
-
-def stop_all_motors():
-    control_motor('A', 'stop')
-    control_motor('B', 'stop')
-
-def move_gate_for(gate, direction, duration_s):
-    """gate('A'|'B'), direction('forward'|'backward'), duration in seconds"""
-    control_motor(gate, direction)
-    time.sleep(duration_s)
-    control_motor(gate, 'stop')
-
-# 멜로디 연주 함수
-def play_melody(pwm):
-    for note, length in MELODY:
-        freq = NOTE_FREQUENCIES.get(note)
-        if freq:
-            pwm.ChangeFrequency(freq)
-            pwm.start(50)
-            time.sleep(0.4 * length)
-            pwm.stop()
-            time.sleep(0.05)
+def gate_states():
+    return controller.states()
 
 # ─────────────────────────────────────
-# 시퀀스: Jetson Danger 전용 (B 먼저, B 시작 5초 뒤 A 시작)
+# 시퀀스: Jetson Danger 전용
+# 부저가 있는 모든 게이트에서 경고음 → 각 게이트는 경고음 종료 + danger_delay 에 닫기 시작
+# (전류 예산을 넘으면 앞 게이트가 멈출 때까지 시작을 미룸)
 def danger_close_sequence():
-    print("[SEQ] Danger: Close B immediately, start A after 5s")
-
-    melody_thread1 = threading.Thread(target=play_melody, args=(pwm_b1,))
-    melody_thread2 = threading.Thread(target=play_melody, args=(pwm_b2,))
-    melody_thread1.start()
-    melody_thread2.start()
-    melody_thread1.join()
-
-    # B 닫기 즉시 시작 → 3.75초 후 반드시 정지
-    control_motor('B', 'backward')
-
-    # B는 A 시작 기준 5초 지연 후 5초간 동작
-    def start_a_after_delay():
-        time.sleep(A_DELAY_AFTER_B_START)
-        control_motor('A', 'backward')
-        time.sleep(A_CLOSE_TIME)
-        control_motor('A', 'stop')
-        print("[SEQ] Gate A closed.")
-
-    t_b = threading.Thread(target=start_a_after_delay, daemon=True)
-    t_b.start()
-
-    # B는 3.75초 후 정지 (A와 무관하게 정해진 시간만 작동)
-    time.sleep(B_CLOSE_TIME)
-    control_motor('B', 'stop')
-    print("[SEQ] Gate B closed.")
-
-    # A 종료까지 대기 (A는 시작 후 5초만 작동)
-    t_b.join()
-    print("[SEQ] Danger close sequence finished.")
-
-# 수동: ALL close  **동시 작동(지연 없음)**
-def manual_close_all_sequence():
-    print("[SEQ] Manual: Close ALL (simultaneous, no delay)")
-    t_a = threading.Thread(target=move_gate_for, args=('A', 'backward', A_CLOSE_TIME), daemon=True)
-    t_b = threading.Thread(target=move_gate_for, args=('B', 'backward', B_CLOSE_TIME), daemon=True)
-    t_a.start(); t_b.start()
-    t_a.join(); t_b.join()
-    print("[SEQ] Manual ALL close sequence finished.")
-
-# 수동: ALL open  동시에 오픈
-def manual_open_all_sequence():
-    print("[SEQ] Manual: Open ALL (simultaneous)")
-    t_a = threading.Thread(target=move_gate_for, args=('A', 'forward', A_OPEN_TIME), daemon=True)
-    t_b = threading.Thread(target=move_gate_for, args=('B', 'forward', B_OPEN_TIME), daemon=True)
-    t_a.start(); t_b.start()
-    t_a.join(); t_b.join()
-    print("[SEQ] Manual ALL open sequence finished.")
-
-# === [ADD] 수동 명령 워커 ===
-def manual_worker(client, gate, command):
-    global is_motor_running, busy_reason
-    try:
-        if command == "close":
-            if gate == "ALL":
-                manual_close_all_sequence()
-            elif gate == "A":
-                move_gate_for('A', 'backward', A_CLOSE_TIME)
-                print("[MANUAL] Gate A closed.")
-            elif gate == "B":
-                move_gate_for('B', 'backward', B_CLOSE_TIME)
-                print("[MANUAL] Gate B closed.")
-        elif command == "open":
-            if gate == "ALL":
-                manual_open_all_sequence()
-            elif gate == "A":
-                move_gate_for('A', 'forward', A_OPEN_TIME)
-                print("[MANUAL] Gate A opened.")
-            elif gate == "B":
-                move_gate_for('B', 'forward', B_OPEN_TIME)
-                print("[MANUAL] Gate B opened.")
-    except Exception as e:
-        print(f"[MANUAL] Worker error: {e}")
-    finally:
-        stop_all_motors()
-        publish_status(client)  # 수동 끝난 직후 현재 상태 publish
-        is_motor_running = False
-        busy_reason = None
-        print("[MANUAL] Finished. System idle -> Jetson messages will be handled again.")
-
+    seq = Sequence("danger-close", PRIORITY_JETSON)
+    t = max(
+        (seq.melody(gate, MELODY, NOTE_FREQUENCIES) for gate in gates.values() if gate.buzzer),
+        default=0.0,
+    )
+    seq.move_group(
+        [(gate, 'backward', t + gate.danger_delay) for gate in gates.values()],
+        CURRENT_BUDGET,
+    )
+    return seq
+
+# 수동 명령: 실행 중인 시퀀스를 중단시키고 바로 실행 (그룹/ALL 은 전류 예산 내에서 동시 작동)
+def manual_sequence(target, command):
+    seq = Sequence(f"manual-{command}-{target}", PRIORITY_MANUAL, preemptive=True)
+    direction = 'backward' if command == "close" else 'forward'
+    seq.move_group(
+        [(gate, direction, 0.0) for gate in resolve_targets(gates, target)],
+        CURRENT_BUDGET,
+    )
+    return seq
 
 # ─────────────────────────────────────
 # MQTT
-def publish_status(client):
-    combined_status = {**jetson_data, **gate_states}
-    payload = json.dumps(combined_status)
-    result = client.publish(PUB_TOPIC_STATUS, payload, qos=1)
-    if result.rc == mqtt.MQTT_ERR_SUCCESS:
-        print(f"[MQTT] Published status: {payload}")
-    else:
-        print(f"[MQTT] Publish failed. RC: {result.rc}")
+# 게이트 상태 / risk_level 이 바뀌면 즉시, 나머지(final_score 등)는 하트비트 주기로 묶어서 발행
+STATUS_HEARTBEAT_INTERVAL = 5.0   # 초
+STATUS_MAX_SILENCE = 30.0         # 변화가 없어도 이 시간마다 한 번은 발행 (초)
+
+status_publisher = StatusPublisher(
+    PUB_TOPIC_STATUS,
+    scheduler,
+    state_keys=["risk_level", *(gate.key for gate in gates.values())],
+    heartbeat_interval=STATUS_HEARTBEAT_INTERVAL,
+    max_silence=STATUS_MAX_SILENCE,
+)
+
+def publish_status(force=False):
+    status_publisher.submit({**jetson_data, **gate_states()}, force=force)
+
+# 시퀀스 종료/중단 직후 현재 상태 publish
+controller.on_idle = publish_status
 
 def on_connect(client, userdata, flags, rc):
     if rc == 0:
         print("Connected to MQTT Broker!")
         client.subscribe([(SUB_TOPIC_JETSON, 1), (SUB_TOPIC_MANUAL, 1)])
+        publish_status(force=True)  # (재)연결 시 현재 상태를 바로 알림
     else:
         print(f"Failed to connect, return code {rc}")
 
 def on_message(client, userdata, msg):
-    global is_motor_running, busy_reason, jetson_data, danger_sequence_activated
-
-    # 모터 동작 중에는 두 토픽 모두 무시
-    if is_motor_running:
-        print(f"[MQTT] Busy ({busy_reason}). Ignoring message from {msg.topic}.")
-        return
+    global jetson_data, danger_sequence_activated
 
     try:
         message_str = msg.payload.decode('utf-8').strip()
@@ -231,26 +132,16 @@ def on_message(client, userdata, msg):
                 gate = payload.get("gate")
                 command = payload.get("command")
 
-                if gate not in ("ALL", "A", "B") or command not in ("open", "close"):
+                if not resolve_targets(gates, gate) or command not in ("open", "close"):
                     print("[MANUAL] Invalid command format.")
-                    publish_status(client)
                     return
 
                 print(f"[MANUAL] Executing: gate={gate}, command={command}")
-                is_motor_running = True
-                busy_reason = "manual"
-
-                # === [CHANGE] 블로킹 실행 -> 비동기 워커로 실행 후 즉시 반환
-                threading.Thread(
-                    target=manual_worker,
-                    args=(client, gate, command),
-                    daemon=True
-                ).start()
+                controller.submit(manual_sequence(gate, command))
                 return
 
             except json.JSONDecodeError:
                 print(f"[MANUAL] Invalid JSON: {message_str}")
-                publish_status(client)
                 return
 
         # ---------- jetson_score ----------
@@ -261,47 +152,32 @@ def on_message(client, userdata, msg):
                 risk_level = payload.get("risk_level")
             except json.JSONDecodeError:
                 print(f"[JETSON] Invalid JSON: {message_str}")
-                publish_status(client)
                 return
 
             # Danger: 최초 1회만 실행
             if str(risk_level).lower() == "danger":
                 if danger_sequence_activated:
                     print("[JETSON] Danger already handled before. Ignoring.")
-                    publish_status(client)
+                    publish_status()
                     return
 
-                print("[JETSON] Danger detected (first time). Starting close sequence.")
+                print("[JETSON] Danger detected (first time). Scheduling close sequence.")
                 danger_sequence_activated = True
-                is_motor_running = True
-                busy_reason = "jetson"
-                try:
-                    danger_close_sequence()
-                finally:
-                    stop_all_motors()
-                    publish_status(client)
-                    is_motor_running = False
-                    busy_reason = None
+                publish_status()
+                # 수동 동작 중이면 대기열에서 기다렸다가 실행 (버려지지 않음)
+                controller.submit(danger_close_sequence())
                 return
             else:
                 print("[JETSON] No action needed for current risk level.")
-                publish_status(client)
+                publish_status()
                 return
 
         # ---------- 기타 ----------
         else:
             print(f"[MQTT] Unhandled topic: {msg.topic}")
-            publish_status(client)
 
     except Exception as e:
         print(f"[ERROR] on_message exception: {e}")
-        try:
-            stop_all_motors()
-        except:
-            pass
-        publish_status(client)
-        is_motor_running = False
-        busy_reason = None
 
 # --- 메인 ---
 if __name__ == "__main__":
@@ -309,20 +185,24 @@ if __name__ == "__main__":
     client.on_connect = on_connect
     client.on_message = on_message
 
+    status_publisher.attach(client)
+    status_publisher.start()
+    scheduler.start()
+
     try:
         client.connect(BROKER, PORT, 60)
-        time.sleep(1)
-        client.publish(PUB_TOPIC_STATUS, json.dumps(gate_states), qos=1)
         client.loop_forever()
     except KeyboardInterrupt:
         print("\nProgram interrupted by user. Cleaning up...")
     finally:
-        stop_all_motors()
-        pwm_b1.stop()
-        pwm_b2.stop()
+        status_publisher.stop()
+        scheduler.stop(timeout=1.0)
+        controller.halt_all()
+        for pwm in buzzers.values():
+            pwm.stop()
         GPIO.cleanup()
         try:
             client.disconnect()
         except:
             pass
-        print("GPIO cleaned up and MQTT client disconnected. Exiting.")
\ No newline at end of file
+        print("GPIO cleaned up and MQTT client disconnected. Exiting.")
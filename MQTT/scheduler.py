@@ -0,0 +1,102 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class TimerHandle:
+    """예약된 콜백 1개 (cancel() 로 취소)"""
+
+    __slots__ = ("when", "callback", "args", "cancelled")
+
+    def __init__(self, when, callback, args):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Scheduler:
+    """힙 기반 단일 스레드 타이머
+
+    - 모든 콜백은 스케줄러 스레드 하나에서 시각 순서대로 실행 (단계마다 스레드/ sleep 없음)
+    - 같은 시각에 예약된 콜백은 예약한 순서대로 실행
+    - call_* 는 어느 스레드에서 호출해도 안전 (MQTT 콜백 스레드 등)
+    - time_scale > 1 이면 시퀀스 시간이 그만큼 빨리 흐름 (시뮬레이션/테스트용)
+    """
+
+    def __init__(self, time_scale=1.0):
+        self.time_scale = time_scale
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def clock(self):
+        """스케줄러 기준 시각 (초, time_scale 적용)"""
+        return time.monotonic() * self.time_scale
+
+    # ─────────────────────────────────────
+    # 예약
+    def call_at(self, when, callback, *args):
+        handle = TimerHandle(when, callback, args)
+        with self._cond:
+            heapq.heappush(self._heap, (when, next(self._counter), handle))
+            self._cond.notify()
+        return handle
+
+    def call_later(self, delay, callback, *args):
+        return self.call_at(self.clock() + delay, callback, *args)
+
+    def call_soon(self, callback, *args):
+        return self.call_at(self.clock(), callback, *args)
+
+    # ─────────────────────────────────────
+    # 실행
+    def _wait(self, timeout):
+        self._cond.wait(None if timeout is None else timeout / self.time_scale)
+
+    def _next_ready(self):
+        with self._cond:
+            while self._running:
+                if self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                    continue
+                if not self._heap:
+                    self._wait(None)
+                    continue
+                delay = self._heap[0][0] - self.clock()
+                if delay <= 0:
+                    return heapq.heappop(self._heap)[2]
+                self._wait(delay)
+            return None
+
+    def run(self):
+        while True:
+            handle = self._next_ready()
+            if handle is None:
+                break
+            try:
+                handle.callback(*handle.args)
+            except Exception as e:
+                print(f"[SCHED] Callback error: {e}")
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self.run, name="gate-scheduler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,157 @@
+import argparse
+import importlib
+import json
+import os
+import statistics
+import sys
+import time
+
+# 시뮬레이션 GPIO 로 게이트 컨트롤러를 돌려보는 하네스 (x86 에서 실행 가능)
+# - MQTT 브로커 없이 on_message 에 메시지를 직접 넣어 버스트 상황을 재현
+# - 명령 → 핀 구동까지 지연 측정, Danger 시퀀스 핀 스케줄을 설정 시간과 비교
+#
+# 사용: GATE_TIME_SCALE 배속으로 실행 (예: python sim_harness.py --time-scale 20)
+
+MQTT_DIR = os.path.dirname(os.path.abspath(__file__))
+if MQTT_DIR not in sys.path:
+    sys.path.append(MQTT_DIR)
+
+
+class FakeMessage:
+    def __init__(self, topic, payload):
+        self.topic = topic
+        self.payload = json.dumps(payload).encode("utf-8")
+
+
+class FakeResult:
+    rc = 0  # MQTT_ERR_SUCCESS
+
+
+class FakeClient:
+    """publish 만 기록하는 MQTT 클라이언트 대역"""
+
+    def __init__(self):
+        self.published = []
+
+    def publish(self, topic, payload, qos=0):
+        self.published.append((topic, payload))
+        return FakeResult()
+
+
+def load_motor(time_scale=1.0):
+    """시뮬레이션 백엔드로 motor 모듈을 새로 로드하고 스케줄러 시작"""
+    os.environ["GATE_GPIO_BACKEND"] = "sim"
+    os.environ["GATE_TIME_SCALE"] = str(time_scale)
+    if "motor" in sys.modules:
+        sys.modules["motor"].scheduler.stop()
+        motor = importlib.reload(sys.modules["motor"])
+    else:
+        motor = importlib.import_module("motor")
+
+    client = FakeClient()
+    motor.status_publisher.attach(client)
+    motor.status_publisher.start()
+    motor.scheduler.start()
+    return motor, client
+
+
+def wait_idle(controller, timeout=30.0):
+    """대기열까지 모두 끝날 때까지 대기 (실제 시간 기준)"""
+    deadline = time.monotonic() + timeout
+    time.sleep(0.01)
+    while controller.busy or controller.pending:
+        if time.monotonic() > deadline:
+            raise TimeoutError("controller did not become idle")
+        time.sleep(0.005)
+
+
+def send(motor, client, topic, payload):
+    motor.on_message(client, None, FakeMessage(topic, payload))
+
+
+def measure_danger_schedule(motor, client):
+    """Danger 1회 실행 후 게이트별 핀 스케줄 측정 (스케줄러 시간 기준, 초)
+
+    close_start 는 경고음 종료 시점 기준 닫기 시작 지연 (설정의 danger_delay 와 비교)
+    """
+    gpio = motor.GPIO
+    t_cmd = motor.scheduler.clock()
+    send(motor, client, motor.SUB_TOPIC_JETSON, {"risk_level": "Danger", "final_score": 0.9})
+    wait_idle(motor.controller)
+
+    closes = {}
+    for gate_id, gate in motor.gates.items():
+        (start, end), = gpio.high_intervals(gate.in_pins[0], since=t_cmd)  # 닫기 방향
+        closes[gate_id] = (start, end)
+    melody_end = min(start - motor.gates[gate_id].danger_delay for gate_id, (start, _) in closes.items())
+
+    buzzers = [gate.buzzer.pin for gate in motor.gates.values() if gate.buzzer is not None]
+    return {
+        "melody": melody_end - t_cmd,
+        "notes": sum(1 for _, freq in gpio.history(buzzers[0], since=t_cmd) if freq) if buzzers else 0,
+        "gates": {
+            gate_id: {"close_start": start - melody_end, "close": end - start}
+            for gate_id, (start, end) in closes.items()
+        },
+    }
+
+
+def measure_burst_latency(motor, client, commands=50, noise_per_command=20, gate_id=None):
+    """수동 명령 + Jetson 메시지 버스트에서 명령 → 모터 핀 구동 지연(실제 ms)
+
+    수동 명령은 매번 실행 중인 시퀀스를 선점하므로 열기/닫기를 번갈아 보낸다.
+    """
+    gpio = motor.GPIO
+    gate_id = gate_id or next(iter(motor.gates))
+    in1, in2 = motor.gates[gate_id].in_pins
+    latencies = []
+    for i in range(commands):
+        for _ in range(noise_per_command):
+            send(motor, client, motor.SUB_TOPIC_JETSON, {"risk_level": "Safe", "final_score": 0.1})
+
+        command = "close" if i % 2 == 0 else "open"
+        pin = in1 if command == "close" else in2
+        t_cmd = motor.scheduler.clock()
+        send(motor, client, motor.SUB_TOPIC_MANUAL, {"gate": gate_id, "command": command})
+
+        deadline = time.monotonic() + 1.0
+        while not gpio.history(pin, since=t_cmd):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"gate {gate_id} did not start for command #{i}")
+            time.sleep(0.0002)
+        t_act = gpio.history(pin, since=t_cmd)[0][0]
+        latencies.append((t_act - t_cmd) / motor.TIME_SCALE * 1000.0)
+
+    wait_idle(motor.controller)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulated gate controller timing harness")
+    parser.add_argument("--time-scale", type=float, default=20.0)
+    parser.add_argument("--commands", type=int, default=50)
+    parser.add_argument("--noise", type=int, default=20, help="jetson messages per manual command")
+    args = parser.parse_args()
+
+    motor, client = load_motor(args.time_scale)
+    try:
+        schedule = measure_danger_schedule(motor, client)
+        print(f"[SIM] Danger schedule (s): melody {schedule['melody']:.3f}, notes {schedule['notes']}")
+        for gate_id, measured in schedule["gates"].items():
+            gate = motor.gates[gate_id]
+            print(f"  {gate_id}: close_start {measured['close_start']:.3f} (configured {gate.danger_delay:.2f}), "
+                  f"close {measured['close']:.3f} (configured {gate.close_time:.2f})")
+
+        latencies = measure_burst_latency(motor, client, args.commands, args.noise)
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"[SIM] Command → actuation latency over {len(latencies)} commands: "
+              f"p50 {statistics.median(latencies):.2f} ms, p99 {p99:.2f} ms, max {latencies[-1]:.2f} ms")
+        received = 1 + args.commands * (args.noise + 1)
+        print(f"[SIM] Status messages published: {len(client.published)} for {received} received")
+    finally:
+        motor.scheduler.stop()
+
+
+if __name__ == "__main__":
+    main()
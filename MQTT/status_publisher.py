@@ -0,0 +1,84 @@
+import json
+import threading
+
+import paho.mqtt.client as mqtt
+
+
+class StatusPublisher:
+    """상태 발행기: 상태 변화는 즉시, 나머지는 하트비트로 묶어서 발행
+
+    - state_keys (게이트 상태, risk_level 등) 값이 바뀌면 즉시 발행
+    - 그 외 변화(final_score 등)는 최신 값만 보관했다가 heartbeat_interval 마다 한 번 발행
+    - 아무 변화가 없어도 max_silence 동안 발행이 없으면 현재 상태를 한 번 발행 (생존 신호)
+    - 모든 메시지에 seq(1부터 증가)를 붙여 수신 측이 누락/순서를 확인할 수 있게 함
+
+    submit() 은 어느 스레드에서 호출해도 안전하며, 하트비트는 Scheduler 에서 실행된다.
+    """
+
+    def __init__(self, topic, scheduler, state_keys, heartbeat_interval=5.0, max_silence=30.0, qos=1):
+        self.topic = topic
+        self.scheduler = scheduler
+        self.state_keys = tuple(state_keys)
+        self.heartbeat_interval = heartbeat_interval
+        self.max_silence = max_silence
+        self.qos = qos
+
+        self.client = None
+        self.seq = 0
+        self._lock = threading.Lock()
+        self._latest = None
+        self._last_state = None
+        self._last_published_at = None
+        self._dirty = False
+        self._heartbeat = None
+
+    def attach(self, client):
+        self.client = client
+
+    def start(self):
+        self._heartbeat = self.scheduler.call_later(self.heartbeat_interval, self._on_heartbeat)
+        return self
+
+    def stop(self):
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+
+    # ─────────────────────────────────────
+    def submit(self, status, force=False):
+        """최신 상태 전달. 상태 변화가 있거나 force 면 즉시 발행"""
+        with self._lock:
+            self._latest = status
+            state = tuple(status.get(key) for key in self.state_keys)
+            if force or state != self._last_state:
+                self._publish_locked()
+            else:
+                self._dirty = True
+
+    def _on_heartbeat(self):
+        with self._lock:
+            silent_for = (
+                None if self._last_published_at is None
+                else self.scheduler.clock() - self._last_published_at
+            )
+            if self._latest is not None and (
+                self._dirty or silent_for is None or silent_for >= self.max_silence
+            ):
+                self._publish_locked()
+        self._heartbeat = self.scheduler.call_later(self.heartbeat_interval, self._on_heartbeat)
+
+    def _publish_locked(self):
+        if self.client is None:
+            return
+        self.seq += 1
+        status = self._latest
+        payload = json.dumps({**status, "seq": self.seq})
+        result = self.client.publish(self.topic, payload, qos=self.qos)
+        if result.rc == mqtt.MQTT_ERR_SUCCESS:
+            print(f"[MQTT] Published status: {payload}")
+        else:
+            print(f"[MQTT] Publish failed. RC: {result.rc}")
+
+        self._last_state = tuple(status.get(key) for key in self.state_keys)
+        self._last_published_at = self.scheduler.clock()
+        self._dirty = False
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# motor.py 는 MQTT 디렉토리 기준 import 를 사용하므로 경로에 추가
+MQTT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if MQTT_DIR not in sys.path:
+    sys.path.insert(0, MQTT_DIR)
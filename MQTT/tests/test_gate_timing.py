@@ -0,0 +1,118 @@
+import pytest
+
+from gate_config import (
+    ALL, DEFAULT_CONFIG_PATH, build_gates, load_gate_config, resolve_targets, setup_gate_pins, validate_gate_config,
+)
+from gate_controller import GateController, Gate, Sequence, PRIORITY_JETSON, PRIORITY_MANUAL
+from gpio_backend import SimulatedGPIO
+from scheduler import Scheduler
+from sim_harness import load_motor, measure_burst_latency, measure_danger_schedule, wait_idle
+
+TIME_SCALE = 20.0
+TOLERANCE = 0.05 * TIME_SCALE  # 실제 50ms 지터 허용 (스케줄러 시간 기준)
+
+
+@pytest.fixture
+def motor():
+    motor, client = load_motor(TIME_SCALE)
+    yield motor, client
+    motor.scheduler.stop()
+
+
+def test_danger_schedule_matches_configured_times(motor):
+    motor, client = motor
+    schedule = measure_danger_schedule(motor, client)
+
+    assert schedule["notes"] == len(motor.MELODY)
+    assert set(schedule["gates"]) == set(motor.gates)
+    for gate_id, measured in schedule["gates"].items():
+        gate = motor.gates[gate_id]
+        assert measured["close"] == pytest.approx(gate.close_time, abs=TOLERANCE)
+        assert measured["close_start"] == pytest.approx(gate.danger_delay, abs=TOLERANCE)
+
+
+def test_manual_burst_actuates_every_command(motor):
+    motor, client = motor
+    latencies = measure_burst_latency(motor, client, commands=10, noise_per_command=10)
+
+    assert len(latencies) == 10
+    assert max(latencies) < 50.0  # ms
+    first = next(iter(motor.gates.values()))
+    assert motor.controller.states()[first.key] == "OPEN"  # 마지막 명령은 열기
+
+
+def test_commands_queue_while_busy_and_manual_preempts():
+    scheduler = Scheduler(time_scale=TIME_SCALE).start()
+    gpio = SimulatedGPIO(clock=scheduler.clock)
+    gate = Gate("A", "gate_a", gpio, (1, 2), 3)
+    controller = GateController({"A": gate}, scheduler)
+    try:
+        t0 = scheduler.clock()
+        first = Sequence("close", PRIORITY_JETSON)
+        first.move(gate, "backward", 2.0)
+        queued = Sequence("open", PRIORITY_JETSON)
+        queued.move(gate, "forward", 1.0)
+        controller.submit(first)
+        controller.submit(queued)  # 실행 중이므로 대기
+        wait_idle(controller)
+
+        # close 2초 → 이어서 open 1초, 버려진 명령 없음
+        (close_start, close_end), = gpio.high_intervals(1, since=t0)
+        (open_start, open_end), = gpio.high_intervals(2, since=t0)
+        assert close_end - close_start == pytest.approx(2.0, abs=TOLERANCE)
+        assert open_start == pytest.approx(close_end, abs=TOLERANCE)
+
+        # 수동 명령은 실행 중인 시퀀스를 바로 중단
+        t1 = scheduler.clock()
+        controller.submit(first)
+        manual = Sequence("manual-open", PRIORITY_MANUAL, preemptive=True)
+        manual.move(gate, "forward", 1.0)
+        scheduler.call_later(0.5, controller.submit, manual)
+        wait_idle(controller)
+
+        (close_start, close_end), = gpio.high_intervals(1, since=t1)
+        assert close_end - close_start == pytest.approx(0.5, abs=TOLERANCE)
+        assert gate.state == "OPEN"
+    finally:
+        scheduler.stop()
+
+
+
+def test_group_moves_stay_within_current_budget():
+    gpio = SimulatedGPIO(clock=lambda: 0.0)
+    gates = [
+        Gate(name, f"gate_{name.lower()}", gpio, (i * 3, i * 3 + 1), i * 3 + 2,
+             close_time=2.0, open_time=1.0, current=1.0, groups=["underpass-1"])
+        for i, name in enumerate("ABC")
+    ]
+
+    # 예산 2A: 2개 동시, 3번째는 먼저 끝나는 게이트가 멈춘 뒤 시작
+    seq = Sequence("close", PRIORITY_MANUAL)
+    end = seq.move_group([(gate, "backward", 0.0) for gate in gates], current_budget=2.0)
+    starts = sorted(offset for offset, callback, args in seq.steps if args == ("backward",))
+    assert starts == [0.0, 0.0, 2.0]
+    assert end == pytest.approx(4.0)
+
+    # 예산 1A: 완전히 순차
+    seq = Sequence("open", PRIORITY_MANUAL)
+    assert seq.move_group([(gate, "forward", 0.0) for gate in gates], current_budget=1.0) == pytest.approx(3.0)
+
+    # 예산 없음: 요청 시각 그대로
+    seq = Sequence("open", PRIORITY_MANUAL)
+    assert seq.move_group([(gate, "forward", 0.5) for gate in gates]) == pytest.approx(1.5)
+
+
+def test_gate_config_resolves_ids_groups_and_all():
+    config = load_gate_config(DEFAULT_CONFIG_PATH)
+    gpio = SimulatedGPIO(clock=lambda: 0.0)
+    gates = build_gates(config, gpio, setup_gate_pins(config, gpio))
+
+    assert list(gates) == [cfg["id"] for cfg in config["gates"]]
+    assert resolve_targets(gates, "A") == [gates["A"]]
+    assert resolve_targets(gates, "underpass-1") == list(gates.values())
+    assert resolve_targets(gates, ALL) == list(gates.values())
+    assert resolve_targets(gates, "unknown") == []
+
+    duplicate = {"gates": [config["gates"][0], {**config["gates"][1], "pins": config["gates"][0]["pins"]}]}
+    with pytest.raises(ValueError):
+        validate_gate_config(duplicate)
@@ -0,0 +1,71 @@
+import heapq
+import json
+
+from scheduler import Scheduler
+from sim_harness import FakeClient
+from status_publisher import StatusPublisher
+
+
+class ManualScheduler(Scheduler):
+    """수동으로 시간을 진행시키는 스케줄러 (스레드 없이 테스트)"""
+
+    def __init__(self):
+        super().__init__()
+        self.now = 0.0
+
+    def clock(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+        while self._heap and self._heap[0][0] <= self.now:
+            handle = heapq.heappop(self._heap)[2]
+            if not handle.cancelled:
+                handle.callback(*handle.args)
+
+
+def _publisher():
+    scheduler = ManualScheduler()
+    client = FakeClient()
+    publisher = StatusPublisher(
+        "topic/status", scheduler, state_keys=["risk_level", "gate_a"],
+        heartbeat_interval=1.0, max_silence=5.0,
+    )
+    publisher.attach(client)
+    publisher.start()
+    return scheduler, client, publisher
+
+
+def _payloads(client):
+    return [json.loads(payload) for _, payload in client.published]
+
+
+def test_state_changes_publish_immediately_and_scores_coalesce():
+    scheduler, client, publisher = _publisher()
+
+    publisher.submit({"risk_level": "Safe", "final_score": 0.1, "gate_a": "OPEN"})
+    for i in range(100):  # 프레임마다 점수만 바뀜
+        publisher.submit({"risk_level": "Safe", "final_score": 0.1 + i / 1000, "gate_a": "OPEN"})
+    assert len(client.published) == 1
+
+    scheduler.advance(1.0)  # 하트비트: 최신 점수 1건
+    assert len(client.published) == 2
+    assert _payloads(client)[-1]["final_score"] == 0.1 + 99 / 1000
+
+    publisher.submit({"risk_level": "Danger", "final_score": 0.9, "gate_a": "OPEN"})
+    publisher.submit({"risk_level": "Danger", "final_score": 0.9, "gate_a": "CLOSED"})
+    assert len(client.published) == 4
+
+    assert [p["seq"] for p in _payloads(client)] == [1, 2, 3, 4]
+
+
+def test_heartbeat_keeps_alive_without_changes():
+    scheduler, client, publisher = _publisher()
+    publisher.submit({"risk_level": "Safe", "gate_a": "OPEN"})
+
+    for _ in range(4):
+        scheduler.advance(1.0)
+    assert len(client.published) == 1  # 변화 없음 → 발행 없음
+
+    scheduler.advance(1.0)  # max_silence 경과
+    assert len(client.published) == 2
@@ -0,0 +1,49 @@
+"""add rainfall table
+
+Revision ID: 3b9c1f2a7d4e
+Revises: efd95df66b30
+Create Date: 2025-08-24 10:12:03.481522
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9c1f2a7d4e"
+down_revision: Union[str, None] = "efd95df66b30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rainfall",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("stn", sa.Integer(), nullable=False),
+        sa.Column("observed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("rn_hr1", sa.Numeric(precision=6, scale=1), nullable=False),
+        sa.Column("rn_day", sa.Numeric(precision=6, scale=1), nullable=False),
+        sa.Column("rn_15m_max", sa.Numeric(precision=6, scale=1), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("stn", "observed_at", name="uq_rainfall_stn_observed_at"),
+    )
+    op.create_index(op.f("ix_rainfall_id"), "rainfall", ["id"], unique=False)
+    op.create_index(
+        "ix_rainfall_observed_at", "rainfall", ["observed_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rainfall_observed_at", table_name="rainfall")
+    op.drop_index(op.f("ix_rainfall_id"), table_name="rainfall")
+    op.drop_table("rainfall")
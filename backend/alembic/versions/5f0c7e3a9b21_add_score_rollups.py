@@ -0,0 +1,67 @@
+"""add score rollups
+
+Revision ID: 5f0c7e3a9b21
+Revises: 8d2e4a6c1b90
+Create Date: 2025-08-27 10:41:12.508316
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5f0c7e3a9b21"
+down_revision: Union[str, None] = "8d2e4a6c1b90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "score_rollups",
+        sa.Column("resolution", sa.String(length=8), nullable=False),
+        sa.Column("bucket", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("min_score", sa.Float(), nullable=False),
+        sa.Column("max_score", sa.Float(), nullable=False),
+        sa.Column("sum_score", sa.Float(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("last_score", sa.Float(), nullable=False),
+        sa.Column("last_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("resolution", "bucket", name="pk_score_rollups"),
+    )
+
+    # score_data predates the migration history; skip databases that don't have it yet
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table("score_data"):
+        return
+    op.create_index(
+        "ix_score_data_timestamp", "score_data", ["timestamp"], unique=False
+    )
+
+    # Backfill rollups from the existing history
+    if bind.dialect.name == "postgresql":
+        for resolution, unit in (("1m", "minute"), ("1h", "hour")):
+            op.execute(
+                f"""
+                INSERT INTO score_rollups
+                    (resolution, bucket, min_score, max_score, sum_score, count,
+                     last_score, last_at)
+                SELECT '{resolution}', date_trunc('{unit}', timestamp),
+                       min(final_score), max(final_score), sum(final_score),
+                       count(*),
+                       (array_agg(final_score ORDER BY timestamp DESC))[1],
+                       max(timestamp)
+                FROM score_data
+                WHERE timestamp IS NOT NULL
+                GROUP BY date_trunc('{unit}', timestamp)
+            """
+            )
+
+
+def downgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("score_data"):
+        op.drop_index("ix_score_data_timestamp", table_name="score_data")
+    op.drop_table("score_rollups")
@@ -0,0 +1,34 @@
+"""add gate device_id
+
+Revision ID: 8d2e4a6c1b90
+Revises: 3b9c1f2a7d4e
+Create Date: 2025-08-25 14:03:47.219835
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2e4a6c1b90"
+down_revision: Union[str, None] = "3b9c1f2a7d4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # gates predates the migration history; skip databases that don't have it yet
+    if not sa.inspect(op.get_bind()).has_table("gates"):
+        return
+    op.add_column("gates", sa.Column("device_id", sa.String(length=50), nullable=True))
+    op.create_index("ix_gates_device_id", "gates", ["device_id"], unique=True)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("gates"):
+        return
+    op.drop_index("ix_gates_device_id", table_name="gates")
+    op.drop_column("gates", "device_id")
@@ -0,0 +1,69 @@
+"""add score camera and component columns
+
+Revision ID: a4d81c6e2f53
+Revises: 5f0c7e3a9b21
+Create Date: 2025-08-29 16:22:05.913470
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d81c6e2f53"
+down_revision: Union[str, None] = "5f0c7e3a9b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCORE_COLUMNS = [
+    sa.Column("camera_id", sa.String(length=50), nullable=True),
+    sa.Column("lat", sa.Numeric(precision=8, scale=6), nullable=True),
+    sa.Column("lng", sa.Numeric(precision=9, scale=6), nullable=True),
+    sa.Column("dem_score", sa.Float(), nullable=True),
+    sa.Column("rain_score", sa.Float(), nullable=True),
+    sa.Column("drain_score", sa.Float(), nullable=True),
+    sa.Column("puddle_score", sa.Float(), nullable=True),
+]
+
+
+def upgrade() -> None:
+    # Existing rollups become the all-cameras rollup (camera_id '')
+    # (batch mode: sqlite can only change a primary key by recreating the table)
+    with op.batch_alter_table("score_rollups") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "camera_id", sa.String(length=50), nullable=False, server_default=""
+            )
+        )
+        batch_op.drop_constraint("pk_score_rollups", type_="primary")
+        batch_op.create_primary_key(
+            "pk_score_rollups", ["camera_id", "resolution", "bucket"]
+        )
+
+    # score_data predates the migration history; skip databases that don't have it yet
+    if not sa.inspect(op.get_bind()).has_table("score_data"):
+        return
+    for column in SCORE_COLUMNS:
+        op.add_column("score_data", column)
+    op.create_index(
+        "ix_score_data_camera_id_timestamp",
+        "score_data",
+        ["camera_id", "timestamp"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("score_data"):
+        op.drop_index("ix_score_data_camera_id_timestamp", table_name="score_data")
+        for column in reversed(SCORE_COLUMNS):
+            op.drop_column("score_data", column.name)
+
+    op.execute("DELETE FROM score_rollups WHERE camera_id <> ''")
+    with op.batch_alter_table("score_rollups") as batch_op:
+        batch_op.drop_constraint("pk_score_rollups", type_="primary")
+        batch_op.drop_column("camera_id")
+        batch_op.create_primary_key("pk_score_rollups", ["resolution", "bucket"])
@@ -0,0 +1,41 @@
+"""add log query indexes
+
+Revision ID: c7e25b9d4a18
+Revises: a4d81c6e2f53
+Create Date: 2025-09-01 11:08:37.640192
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e25b9d4a18"
+down_revision: Union[str, None] = "a4d81c6e2f53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOG_INDEXES = {
+    "ix_logs_created_at_id": ["created_at", "id"],
+    "ix_logs_action_created_at_id": ["action", "created_at", "id"],
+    "ix_logs_gate_id_created_at_id": ["gate_id", "created_at", "id"],
+    "ix_logs_user_id_created_at_id": ["user_id", "created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    # logs predates the migration history; skip databases that don't have it yet
+    if not sa.inspect(op.get_bind()).has_table("logs"):
+        return
+    for name, columns in LOG_INDEXES.items():
+        op.create_index(name, "logs", columns, unique=False)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("logs"):
+        return
+    for name in LOG_INDEXES:
+        op.drop_index(name, table_name="logs")
@@ -7,11 +7,22 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Hero API"
     DATABASE_URL: str
     DEBUG: bool = False
+    # Check/upgrade the schema in each worker's startup (off when a pre-start
+    # step runs `python -m api.utils.migrations`)
+    migrate_on_startup: bool = True
 
     # JWT Settings
     JWT_SECRET: str  # Change in production
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION: int = 30  # minutes
+    # Authenticated principals are cached instead of queried on every request
+    auth_token_cache_size: int = 4096  # decoded tokens kept until they expire
+    auth_user_cache_size: int = 1024
+    auth_user_cache_ttl: float = 60.0  # seconds; bounds staleness across workers
+    auth_user_cache_redis: bool = False  # share loaded users between workers
+    # bcrypt runs on a thread pool off the event loop
+    password_hash_workers: int = 2
+    password_hash_concurrency: int = 8  # hashes running or queued at once; others wait
 
     # MQTT Settings
     mqtt_broker: str
@@ -19,11 +30,61 @@ class Settings(BaseSettings):
     mqtt_client_id: str
     sub_topic_rpi: str
     pub_topic_jetson: str
+    mqtt_max_queued_messages: int = 1000  # incoming queue bound (0 = unbounded)
+    mqtt_backlog_warning: int = 100  # warn when this many messages are waiting
+    mqtt_reconnect_interval: float = 5.0  # seconds
+    # With several workers/replicas only the lock holder subscribes to controller status
+    mqtt_leader_election: bool = True
+    mqtt_leader_key: str = "mqtt:leader"
+    mqtt_leader_ttl: float = 10.0  # seconds; failover happens within this time
+
+    # Score write-behind buffer (flush every N rows or T seconds, whichever first)
+    score_flush_rows: int = 500
+    score_flush_interval: float = 0.5
+    # Oldest rows are dropped beyond this while the DB is down
+    score_buffer_limit: int = 50000
+
+    # WebSocket fan-out (per-client bounded send queue)
+    ws_send_queue_size: int = 100
+    ws_slow_client_policy: str = "drop_oldest"  # or "disconnect"
+    ws_send_timeout: float = 5.0  # seconds; a client stuck longer is dropped
+
+    # Batched log writer
+    log_batch_size: int = 200
+
+    # Streaming exports: rows fetched from the server-side cursor per chunk
+    export_batch_size: int = 1000
 
     # Redis Settings
     redis_host: str
     redis_port: int
     redis_gate_status_key: str
+    redis_rainfall_key: str = "rainfall:latest"
+    redis_gate_history_key: str = "gate_status:history"
+    redis_auth_user_prefix: str = "auth:user:"
+    # Version counters of the projected camera/gate positions
+    redis_positions_prefix: str = "positions:version:"
+    gate_status_history_len: int = 60  # entries kept (one per flush at most)
+    gate_status_flush_interval: float = 1.0  # seconds between Redis writes
+    # WebSocket events are relayed between workers over Redis pub/sub
+    redis_pubsub_enabled: bool = True
+    redis_channel_prefix: str = "events:"
+
+    # Rainfall (KMA AWS) Settings
+    kma_api_key: str = ""  # ingestion is disabled when empty
+    kma_aws_url: str = "https://apihub.kma.go.kr/api/typ01/url/awsh.php"
+    rainfall_poll_interval: float = 60.0  # KMA AWS update cadence (seconds)
+    rainfall_publish_delay: float = 15.0  # wait after each cadence boundary
+    rainfall_stations: str = "401"  # comma-separated STN ids persisted to the DB
+    # With several workers/replicas only the lock holder polls KMA
+    rainfall_leader_election: bool = True
+    rainfall_leader_key: str = "rainfall:leader"
+    rainfall_leader_ttl: float = 30.0  # seconds
+
+    # Risk map tiles: {tile_dir}/{layer}/{z}/{x}/{y}.png,
+    # rendered by AI/scoring/risk_tiles.py
+    tile_dir: str = "./tiles"
+    tile_max_age: int = 60  # Cache-Control max-age (seconds)
 
     model_config = SettingsConfigDict(
         env_file=".env",
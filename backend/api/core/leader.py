@@ -0,0 +1,103 @@
+import asyncio
+import os
+import socket
+from collections.abc import Awaitable, Callable
+
+from redis.exceptions import RedisError
+
+from api.core.logging import get_logger
+from api.core.redis import redis_client
+
+logger = get_logger(__name__)
+
+# Unique per worker process (also across containers sharing a broker)
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}"
+
+# Renew / release only while the key still holds our id
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderLock:
+    """Redis lease electing one worker for a singleton job.
+
+    The holder renews the lease every ``ttl / 3`` seconds; if it dies the key
+    expires and another worker takes over within ``ttl``. A worker that cannot
+    renew (Redis error or lease lost) steps down before anyone else can acquire.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        ttl: float,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]],
+    ):
+        self.key = key
+        self.ttl = ttl
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.is_leader = False
+        self._task: asyncio.Task | None = None
+
+    async def _try_acquire(self) -> bool:
+        return bool(
+            await redis_client.set(
+                self.key, WORKER_ID, nx=True, px=int(self.ttl * 1000)
+            )
+        )
+
+    async def _renew(self) -> bool:
+        return bool(
+            await redis_client.eval(
+                _RENEW_SCRIPT, 1, self.key, WORKER_ID, int(self.ttl * 1000)
+            )
+        )
+
+    async def _set_leader(self, leader: bool) -> None:
+        if leader == self.is_leader:
+            return
+        self.is_leader = leader
+        logger.info(
+            f"Worker {WORKER_ID} {'acquired' if leader else 'lost'} lock '{self.key}'"
+        )
+        await (self.on_elected() if leader else self.on_demoted())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                held = await (self._renew() if self.is_leader else self._try_acquire())
+            except RedisError as e:
+                logger.warning(f"Leader lock '{self.key}' check failed: {e}")
+                held = False
+            await self._set_leader(held)
+            await asyncio.sleep(self.ttl / 3)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.is_leader:
+            try:
+                await redis_client.eval(_RELEASE_SCRIPT, 1, self.key, WORKER_ID)
+            except RedisError as e:
+                logger.warning(f"Leader lock '{self.key}' release failed: {e}")
+            await self._set_leader(False)
@@ -0,0 +1,10 @@
+import redis.asyncio as redis
+
+from api.core.config import settings
+
+# Shared async Redis client (connection pool) for the whole process
+redis_client = redis.Redis(
+    host=settings.redis_host,
+    port=settings.redis_port,
+    decode_responses=True,
+)
@@ -1,3 +1,6 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from fastapi import Depends, HTTPException, status
@@ -6,6 +9,7 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from api.core.config import settings
+from api.utils.cache import TTLCache
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -13,6 +17,20 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Decoded tokens: token -> user id, kept until the token's exp
+token_cache: TTLCache[str, int] = TTLCache(
+    settings.auth_token_cache_size, settings.JWT_EXPIRATION * 60
+)
+
+
+# bcrypt is deliberately slow (tens to hundreds of ms) and releases the GIL, so
+# it runs on a small dedicated pool; the semaphore bounds queued work so a
+# login burst waits its turn instead of piling up in the executor.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers, thread_name_prefix="bcrypt"
+)
+_hash_slots = asyncio.Semaphore(settings.password_hash_concurrency)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -24,6 +42,23 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def _run_hash(func, *args):
+    async with _hash_slots:
+        return await asyncio.get_running_loop().run_in_executor(
+            _hash_executor, func, *args
+        )
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """``verify_password`` on the bcrypt pool (never blocks the event loop)."""
+    return await _run_hash(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """``get_password_hash`` on the bcrypt pool (never blocks the event loop)."""
+    return await _run_hash(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create JWT access token."""
     to_encode = data.copy()
@@ -34,6 +69,26 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
+def decode_token(token: str) -> int | None:
+    """User id of a valid token, memoized by token until the token expires."""
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+    try:
+        payload = jwt.decode(
+            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+        )
+        user_id = int(payload["sub"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        return None
+
+    expires_at = None
+    if "exp" in payload:  # remaining lifetime on the monotonic clock
+        expires_at = time.monotonic() + (payload["exp"] - time.time())
+    token_cache.set(token, user_id, expires_at=expires_at)
+    return user_id
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     """Dependency to get current authenticated user."""
     credentials_exception = HTTPException(
@@ -42,22 +97,14 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+    user_id = decode_token(token)
+    if user_id is None:
         raise credentials_exception
 
     # Import here to avoid circular imports
-    from api.core.database import get_session
-    from api.src.users.service import UserService
-
-    async for session in get_session():
-        user = await UserService(session).get_user(int(user_id))
-        if user is None:
-            raise credentials_exception
-        return user
+    from api.src.users.cache import user_cache
+
+    user = await user_cache.get(user_id)
+    if user is None:
+        raise credentials_exception
+    return user
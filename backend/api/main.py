@@ -1,47 +1,75 @@
+import time
+from contextlib import asynccontextmanager
+
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI
 
 from api.core.config import settings
 from api.core.logging import get_logger, setup_logging
 from api.src.users.routes import router as auth_router
+from api.src.users.cache import user_cache  # also registers invalidation hooks on User
 from api.src.cameras.routes import router as cameras_router
 from api.src.gates.routes import router as gates_router
 from api.src.logs.routes import router as logs_router
-from api.src.websockets.routes import (
-    router as websockets_router,
-    setup_mqtt_client,
-    shutdown_mqtt_client,
-)
+from api.src.logs.writer import log_writer
+from api.src.websockets.relay import event_relay
+from api.src.websockets.status_cache import gate_status_cache
+from api.src.websockets.routes import router as websockets_router, mqtt_bridge
 from api.src.scores.routes import router as scores_router
+from api.src.scores.writer import score_buffer
+from api.src.rainfall.routes import router as rainfall_router
+from api.src.rainfall.ingest import rainfall_ingestor
+from api.src.tiles.routes import router as tiles_router
 
-from api.utils.migrations import run_migrations
+from api.utils.migrations import migrate
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI(title=settings.PROJECT_NAME, debug=settings.DEBUG, root_path="/api")
-
 
-@app.on_event("startup")
-def startup_event():
-    print("Application startup: Setting up MQTT client.")
-    try:
-        setup_mqtt_client()
-    except TimeoutError:
-        print("WARNING: MQTT client connection timed out. MQTT features will not be available.")
-    except Exception as e:
-        print(f"WARNING: An unexpected error occurred during MQTT client setup: {e}")
-
-
-@app.on_event("shutdown")
-def shutdown_event():
-    print("Application shutdown: Shutting down MQTT client.")
-    shutdown_mqtt_client()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup_started = time.perf_counter()
+    import_ms = (startup_started - _import_started) * 1000.0
+    migrate_ms = 0.0
+    if settings.migrate_on_startup:
+        # Up to date: one version query. Otherwise one worker upgrades, the rest wait.
+        await migrate()
+        migrate_ms = (time.perf_counter() - startup_started) * 1000.0
+
+    print("Application startup: Starting MQTT bridge.")
+    event_relay.start()
+    gate_status_cache.start()
+    score_buffer.start()
+    log_writer.start()
+    mqtt_bridge.start()  # connects (and reconnects) in the background
+    rainfall_ingestor.start()
+    ready_ms = (time.perf_counter() - _import_started) * 1000.0
+    logger.info(
+        f"Worker ready in {ready_ms:.0f} ms "
+        f"(imports {import_ms:.0f} ms, migration check {migrate_ms:.0f} ms)"
+    )
+    yield
+    print("Application shutdown: Stopping MQTT bridge.")
+    await mqtt_bridge.stop()
+    await score_buffer.stop()  # flushes scores still buffered
+    await log_writer.stop()  # writes and broadcasts logs still queued
+    await gate_status_cache.stop()  # writes the last status to Redis
+    await event_relay.stop()
+    await rainfall_ingestor.stop()
+    await user_cache.drain()  # Redis invalidations still in flight
+
+
+app = FastAPI(
+    title=settings.PROJECT_NAME,
+    debug=settings.DEBUG,
+    root_path="/api",
+    lifespan=lifespan,
+)
 
 
 # Set up logging configuration
 setup_logging()
 
-# Optional: Run migrations on startup
-run_migrations()
-
 # Set up logger for this module
 logger = get_logger(__name__)
 
@@ -65,6 +93,8 @@ app.include_router(gates_router)
 app.include_router(logs_router)
 app.include_router(websockets_router)
 app.include_router(scores_router)
+app.include_router(rainfall_router)
+app.include_router(tiles_router)
 
 
 @app.get("/health")
@@ -54,6 +54,22 @@ class CameraRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_by_ids(self, camera_ids: list[int]) -> list[Camera]:
+        """Get cameras by ID, in the order of ``camera_ids``.
+
+        Args:
+            camera_ids: Camera IDs
+
+        Returns:
+            list[Camera]: Found cameras (unknown IDs are skipped)
+        """
+        if not camera_ids:
+            return []
+        query = select(Camera).where(Camera.id.in_(camera_ids))
+        result = await self.session.execute(query)
+        by_id = {camera.id: camera for camera in result.scalars().all()}
+        return [by_id[camera_id] for camera_id in camera_ids if camera_id in by_id]
+
     async def update(self, camera_id: int, camera_data: CameraUpdate) -> Camera:
         """Update camera by ID.
 
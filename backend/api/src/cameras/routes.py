@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_session
@@ -9,7 +9,7 @@ from api.src.cameras.schemas import (
     CameraUpdate,
 )
 from api.src.cameras.service import CameraService
-from api.src.users.models import User
+from api.src.users.schemas import UserResponse
 
 router = APIRouter(prefix="/cameras", tags=["cameras"])
 
@@ -26,7 +26,7 @@ def get_camera_service(
 async def create_camera(
     camera_data: CameraCreate,
     service: CameraService = Depends(get_camera_service),
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
 ) -> CameraResponse:
     """Create a new camera."""
     return await service.create_camera(camera_data)
@@ -40,6 +40,17 @@ async def get_all_cameras(
     return await service.get_all_cameras()
 
 
+@router.get("/nearby", response_model=list[CameraResponse])
+async def get_nearby_cameras(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius: float = Query(500.0, gt=0, le=20000, description="Search radius (meters)"),
+    service: CameraService = Depends(get_camera_service),
+) -> list[CameraResponse]:
+    """Get cameras within ``radius`` meters of a point, nearest first."""
+    return await service.get_nearby_cameras(lat, lon, radius)
+
+
 @router.get("/{camera_id}", response_model=CameraResponse)
 async def get_camera(
     camera_id: int,
@@ -54,7 +65,7 @@ async def update_camera(
     camera_id: int,
     camera_data: CameraUpdate,
     service: CameraService = Depends(get_camera_service),
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
 ) -> CameraResponse:
     """Update a camera."""
     return await service.update_camera(camera_id, camera_data)
@@ -64,7 +75,7 @@ async def update_camera(
 async def delete_camera(
     camera_id: int,
     service: CameraService = Depends(get_camera_service),
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
 ) -> None:
     """Delete a camera."""
     await service.delete_camera(camera_id)
\ No newline at end of file
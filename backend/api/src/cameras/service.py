@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.cameras.models import Camera
 from api.src.cameras.repository import CameraRepository
 from api.src.cameras.schemas import CameraCreate, CameraUpdate
+from api.utils.projection import camera_positions
 
 
 class CameraService:
@@ -13,7 +14,9 @@ class CameraService:
 
     async def create_camera(self, camera_data: CameraCreate) -> Camera:
         """Create a new camera."""
-        return await self.repository.create(camera_data)
+        camera = await self.repository.create(camera_data)
+        await camera_positions.invalidate()
+        return camera
 
     async def get_camera(self, camera_id: int) -> Camera:
         """Get camera by ID."""
@@ -27,8 +30,18 @@ class CameraService:
         self, camera_id: int, camera_data: CameraUpdate
     ) -> Camera:
         """Update camera by ID."""
-        return await self.repository.update(camera_id, camera_data)
+        camera = await self.repository.update(camera_id, camera_data)
+        await camera_positions.invalidate()
+        return camera
 
     async def delete_camera(self, camera_id: int) -> None:
         """Delete camera by ID."""
-        await self.repository.delete(camera_id)
\ No newline at end of file
+        await self.repository.delete(camera_id)
+        await camera_positions.invalidate()
+
+    async def get_nearby_cameras(
+        self, lat: float, lon: float, radius_m: float
+    ) -> list[Camera]:
+        """Get cameras within radius_m meters of a point, nearest first."""
+        positions = await camera_positions.current(self.repository.get_all)
+        return await self.repository.get_by_ids(positions.within(lat, lon, radius_m))
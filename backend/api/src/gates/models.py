@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, Numeric, String
+from sqlalchemy import Boolean, Column, Index, Integer, Numeric, String
 
 from api.core.database import Base
 
@@ -8,5 +8,9 @@ class Gate(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, unique=True)
+    # Stable id of the gate in the controller's gate config (e.g. "A", "B")
+    device_id = Column(String(50), nullable=True)
     lat = Column(Numeric(precision=8, scale=6), nullable=False)
     lon = Column(Numeric(precision=9, scale=6), nullable=False)
+
+    __table_args__ = (Index("ix_gates_device_id", "device_id", unique=True),)
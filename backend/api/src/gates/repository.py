@@ -54,6 +54,22 @@ class GateRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_by_ids(self, gate_ids: list[int]) -> list[Gate]:
+        """Get gates by ID, in the order of ``gate_ids``.
+
+        Args:
+            gate_ids: Gate IDs
+
+        Returns:
+            list[Gate]: Found gates (unknown IDs are skipped)
+        """
+        if not gate_ids:
+            return []
+        query = select(Gate).where(Gate.id.in_(gate_ids))
+        result = await self.session.execute(query)
+        by_id = {gate.id: gate for gate in result.scalars().all()}
+        return [by_id[gate_id] for gate_id in gate_ids if gate_id in by_id]
+
     async def update(self, gate_id: int, gate_data: GateUpdate) -> Gate:
         """Update gate by ID.
 
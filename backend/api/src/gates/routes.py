@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Query, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 import json
 
@@ -13,8 +13,8 @@ from api.src.gates.schemas import (
 from api.src.gates.service import GateService
 from api.src.logs import service as log_service
 from api.src.logs.schemas import LogCreate
-from api.src.users.models import User
-from api.src.websockets.routes import mqtt_client
+from api.src.users.schemas import UserResponse
+from api.src.websockets.routes import mqtt_bridge
 from api.core.config import settings
 
 router = APIRouter(prefix="/gates", tags=["gates"])
@@ -26,39 +26,59 @@ def get_gate_service(
     return GateService(session)
 
 
-def publish_mqtt_command(payload: dict) -> bool:
+async def publish_mqtt_command(payload: dict) -> bool:
     """Publishes a JSON command to the MQTT broker."""
-    try:
-        json_payload = json.dumps(payload)
-        result = mqtt_client.publish(settings.pub_topic_jetson, payload=json_payload, qos=1)
-        if result.rc == 0: # MQTT_ERR_SUCCESS
-            print(f"[API] Published command '{json_payload}' to topic '{settings.pub_topic_jetson}'")
-            return True
-        else:
-            print(f"[API] Failed to publish command. RC: {result.rc}")
-            return False
-    except Exception as e:
-        print(f"[API] Error publishing MQTT message: {e}")
-        return False
+    json_payload = json.dumps(payload)
+    if await mqtt_bridge.publish(
+        settings.pub_topic_jetson, payload=json_payload, qos=1
+    ):
+        print(
+            f"[API] Published command '{json_payload}' "
+            f"to topic '{settings.pub_topic_jetson}'"
+        )
+        return True
+    print(f"[API] Failed to publish command '{json_payload}'")
+    return False
+
+
+def resolve_device_id(gate) -> str:
+    """Get the controller-side id of a gate.
+
+    Gates registered before device ids existed fall back to guessing
+    "A" or "B" from the gate name.
+    """
+    if gate.device_id:
+        return gate.device_id
+    if "a" in gate.name.lower():
+        return "A"
+    if "b" in gate.name.lower():
+        return "B"
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=(
+            f"Gate '{gate.name}' has no device_id "
+            "and none could be derived from its name"
+        ),
+    )
 
 
 @router.post("/control", status_code=status.HTTP_202_ACCEPTED)
 async def control_all_gates(
     control_data: GateControl,
     service: GateService = Depends(get_gate_service),
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
 ) -> dict:
     """Control ALL gates simultaneously (open/close). Requires authentication."""
     command = control_data.command.lower()
     payload = {"gate": "ALL", "command": command}
     
-    if publish_mqtt_command(payload):
+    if await publish_mqtt_command(payload):
         log_data = LogCreate(
             user_id=current_user.id,
             action=f"All Gates {command}",
             details=f"User {current_user.email} sent command '{command}' to all gates."
         )
-        await log_service.create_log(service.repository.session, log_data)
+        await log_service.create_log(log_data)
         return {"status": "success", "message": f"Command '{command}' sent to all gates."}
     else:
         raise HTTPException(
@@ -71,34 +91,24 @@ async def control_single_gate(
     gate_id: int,
     control_data: GateControl,
     service: GateService = Depends(get_gate_service),
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
 ) -> dict:
     """Control a single gate by its ID. Requires authentication."""
     gate = await service.get_gate(gate_id)
     command = control_data.command.lower()
 
-    # Determine which physical gate (A or B) this ID corresponds to.
-    # This is a simple assumption based on the gate name.
-    if "a" in gate.name.lower():
-        target_gate = "A"
-    elif "b" in gate.name.lower():
-        target_gate = "B"
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Could not determine physical gate (A or B) from name '{gate.name}'",
-        )
+    target_gate = resolve_device_id(gate)
 
     payload = {"gate": target_gate, "command": command}
 
-    if publish_mqtt_command(payload):
+    if await publish_mqtt_command(payload):
         log_data = LogCreate(
             gate_id=gate_id,
             user_id=current_user.id,
             action=f"Gate {command}",
             details=f"User {current_user.email} sent command '{command}' to gate {gate_id} ({target_gate})."
         )
-        await log_service.create_log(service.repository.session, log_data)
+        await log_service.create_log(log_data)
         return {"status": "success", "message": f"Command '{command}' sent to gate {gate_id} ({target_gate})."}
     else:
         raise HTTPException(
@@ -113,7 +123,7 @@ async def control_single_gate(
 async def create_gate(
     gate_data: GateCreate,
     service: GateService = Depends(get_gate_service),
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
 ) -> GateResponse:
     """Create a new gate."""
     return await service.create_gate(gate_data)
@@ -127,6 +137,17 @@ async def get_all_gates(
     return await service.get_all_gates()
 
 
+@router.get("/nearby", response_model=list[GateResponse])
+async def get_nearby_gates(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius: float = Query(500.0, gt=0, le=20000, description="Search radius (meters)"),
+    service: GateService = Depends(get_gate_service),
+) -> list[GateResponse]:
+    """Get gates within ``radius`` meters of a point, nearest first."""
+    return await service.get_nearby_gates(lat, lon, radius)
+
+
 @router.get("/{gate_id}", response_model=GateResponse)
 async def get_gate(
     gate_id: int,
@@ -141,7 +162,7 @@ async def update_gate(
     gate_id: int,
     gate_data: GateUpdate,
     service: GateService = Depends(get_gate_service),
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
 ) -> GateResponse:
     """Update a gate."""
     return await service.update_gate(gate_id, gate_data, current_user.id)
@@ -151,7 +172,7 @@ async def update_gate(
 async def delete_gate(
     gate_id: int,
     service: GateService = Depends(get_gate_service),
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
 ) -> None:
     """Delete a gate."""
     await service.delete_gate(gate_id)
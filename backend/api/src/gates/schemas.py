@@ -10,7 +10,8 @@ class GateBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     lat: float = Field(..., ge=-90, le=90)
     lon: float = Field(..., ge=-180, le=180)
-    
+    device_id: str | None = Field(None, min_length=1, max_length=50)
+
 
 
 class GateCreate(GateBase):
@@ -26,6 +27,7 @@ class GateUpdate(BaseModel):
     name: str | None = Field(None, min_length=1, max_length=100)
     lat: float | None = Field(None, ge=-90, le=90)
     lon: float | None = Field(None, ge=-180, le=180)
+    device_id: str | None = Field(None, min_length=1, max_length=50)
 
 
 class GateResponse(GateBase):
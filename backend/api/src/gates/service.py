@@ -5,6 +5,7 @@ from api.src.gates.repository import GateRepository
 from api.src.gates.schemas import GateCreate, GateUpdate
 from api.src.logs import service as log_service
 from api.src.logs.schemas import LogCreate
+from api.utils.projection import gate_positions
 
 
 class GateService:
@@ -15,7 +16,9 @@ class GateService:
 
     async def create_gate(self, gate_data: GateCreate) -> Gate:
         """Create a new gate."""
-        return await self.repository.create(gate_data)
+        gate = await self.repository.create(gate_data)
+        await gate_positions.invalidate()
+        return gate
 
     async def get_gate(self, gate_id: int) -> Gate:
         """Get gate by ID."""
@@ -34,6 +37,7 @@ class GateService:
             return None
 
         updated_gate = await self.repository.update(gate_id, gate_data)
+        await gate_positions.invalidate()
 
         # Log the gate update action
         log_data = LogCreate(
@@ -42,10 +46,18 @@ class GateService:
             action="Gate Updated",
             details=f"Gate {gate.name} updated. Changes: {gate_data.dict(exclude_unset=True)}"
         )
-        await log_service.create_log(self.repository.session, log_data)
+        await log_service.create_log(log_data)
 
         return updated_gate
 
     async def delete_gate(self, gate_id: int) -> None:
         """Delete gate by ID."""
         await self.repository.delete(gate_id)
+        await gate_positions.invalidate()
+
+    async def get_nearby_gates(
+        self, lat: float, lon: float, radius_m: float
+    ) -> list[Gate]:
+        """Get gates within radius_m meters of a point, nearest first."""
+        positions = await gate_positions.current(self.repository.get_all)
+        return await self.repository.get_by_ids(positions.within(lat, lon, radius_m))
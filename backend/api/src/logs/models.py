@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 
 from api.core.database import Base
@@ -13,3 +13,11 @@ class Log(Base):
     action = Column(String, nullable=False)
     details = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Keyset pages are ordered by (created_at, id); each filter gets its own prefix
+    __table_args__ = (
+        Index("ix_logs_created_at_id", "created_at", "id"),
+        Index("ix_logs_action_created_at_id", "action", "created_at", "id"),
+        Index("ix_logs_gate_id_created_at_id", "gate_id", "created_at", "id"),
+        Index("ix_logs_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
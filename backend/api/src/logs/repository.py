@@ -1,26 +1,38 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
+from sqlalchemy import Select, insert, select, tuple_
 from datetime import datetime, timedelta
 
 from . import models, schemas
 
 
-async def create_log(db: AsyncSession, log: schemas.LogCreate):
-    db_log = models.Log(**log.dict())
-    db.add(db_log)
+async def bulk_create_logs(
+    db: AsyncSession, logs: list[schemas.LogCreate]
+) -> list[models.Log]:
+    """Insert many log rows in one statement.
+
+    Ids and created_at come back via RETURNING.
+    """
+    result = await db.scalars(
+        insert(models.Log).returning(models.Log, sort_by_parameter_order=True),
+        [log.model_dump() for log in logs],
+    )
+    db_logs = list(result)
     await db.commit()
-    await db.refresh(db_log)
-    return db_log
+    return db_logs
 
-async def get_logs_by_period(db: AsyncSession, period: schemas.LogPeriod):
-    end_date = datetime.utcnow()
+
+def period_start(period: schemas.LogPeriod, end_date: datetime) -> datetime | None:
     if period == schemas.LogPeriod.DAY:
-        start_date = end_date - timedelta(days=1)
-    elif period == schemas.LogPeriod.WEEK:
-        start_date = end_date - timedelta(weeks=1)
-    elif period == schemas.LogPeriod.MONTH:
-        start_date = end_date - timedelta(days=30) # Approximation for a month
-    else:
+        return end_date - timedelta(days=1)
+    if period == schemas.LogPeriod.WEEK:
+        return end_date - timedelta(weeks=1)
+    if period == schemas.LogPeriod.MONTH:
+        return end_date - timedelta(days=30) # Approximation for a month
+    return None
+
+async def get_logs_by_period(db: AsyncSession, period: schemas.LogPeriod):
+    start_date = period_start(period, datetime.utcnow())
+    if start_date is None:
         return []
 
     result = await db.execute(
@@ -29,3 +41,53 @@ async def get_logs_by_period(db: AsyncSession, period: schemas.LogPeriod):
         .order_by(models.Log.created_at.desc())
     )
     return result.scalars().all()
+
+def filter_logs(
+    query: Select,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    action: str | None = None,
+    gate_id: int | None = None,
+    user_id: int | None = None,
+) -> Select:
+    if start is not None:
+        query = query.filter(models.Log.created_at >= start)
+    if end is not None:
+        query = query.filter(models.Log.created_at < end)
+    if action is not None:
+        query = query.filter(models.Log.action == action)
+    if gate_id is not None:
+        query = query.filter(models.Log.gate_id == gate_id)
+    if user_id is not None:
+        query = query.filter(models.Log.user_id == user_id)
+    return query
+
+async def get_logs_page(
+    db: AsyncSession,
+    limit: int,
+    after: tuple[datetime, int] | None = None,
+    **filters,
+) -> list[models.Log]:
+    """Up to ``limit`` logs, newest first, strictly older than the ``after`` key.
+
+    ``after`` is the (created_at, id) of the last row of the previous page, so
+    every page is one index range scan no matter how deep it is.
+    """
+    query = (
+        select(models.Log)
+        .order_by(models.Log.created_at.desc(), models.Log.id.desc())
+        .limit(limit)
+    )
+    if after is not None:
+        query = query.filter(
+            tuple_(models.Log.created_at, models.Log.id) < tuple_(*after)
+        )
+    query = filter_logs(query, **filters)
+
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+def export_logs_query(**filters) -> Select:
+    """Matching logs oldest first, for streaming exports."""
+    query = select(models.Log).order_by(models.Log.created_at, models.Log.id)
+    return filter_logs(query, **filters)
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_session
+from api.utils.export import ExportFormat
 from . import service, schemas
 
 router = APIRouter(prefix="/logs", tags=["logs"])
@@ -12,4 +13,50 @@ async def read_logs(
     db: AsyncSession = Depends(get_session),
     period: schemas.LogPeriod = Query(schemas.LogPeriod.DAY, description="Time period to filter logs")
 ):
-    return await service.get_logs(db=db, period=period)
\ No newline at end of file
+    return await service.get_logs(db=db, period=period)
+
+
+@router.get("/page", response_model=schemas.LogPage)
+async def read_log_page(
+    db: AsyncSession = Depends(get_session),
+    limit: int = Query(100, ge=1, le=500, description="Logs per page"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    period: schemas.LogPeriod | None = Query(
+        None, description="Only logs from this period"
+    ),
+    action: str | None = Query(
+        None, description="Filter by action (gate, camera, alarm, ...)"
+    ),
+    gate_id: int | None = Query(None, description="Filter by gate"),
+    user_id: int | None = Query(None, description="Filter by user"),
+):
+    """Logs newest first, one bounded page at a time (keyset pagination)."""
+    return await service.get_log_page(
+        db=db,
+        limit=limit,
+        cursor=cursor,
+        period=period,
+        action=action,
+        gate_id=gate_id,
+        user_id=user_id,
+    )
+
+
+@router.get("/export")
+async def export_logs(
+    fmt: ExportFormat = Query(
+        ExportFormat.NDJSON, alias="format", description="ndjson or csv"
+    ),
+    period: schemas.LogPeriod | None = Query(
+        None, description="Only logs from this period"
+    ),
+    action: str | None = Query(
+        None, description="Filter by action (gate, camera, alarm, ...)"
+    ),
+    gate_id: int | None = Query(None, description="Filter by gate"),
+    user_id: int | None = Query(None, description="Filter by user"),
+):
+    """Download matching logs, oldest first, streamed in constant memory."""
+    return service.export_logs(
+        fmt=fmt, period=period, action=action, gate_id=gate_id, user_id=user_id
+    )
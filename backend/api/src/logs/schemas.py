@@ -26,3 +26,8 @@ class Log(LogBase):
 
     class Config:
         from_attributes = True
+
+
+class LogPage(BaseModel):
+    items: list[Log]
+    next_cursor: str | None = None  # pass back as ?cursor= for the next (older) page
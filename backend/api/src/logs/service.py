@@ -1,16 +1,69 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+import base64
+import binascii
 import json
+from datetime import datetime
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.core.exceptions import BadRequestException
+from api.utils.export import ExportFormat, export_response
 from . import repository, schemas
-from api.src.websockets.log_manager import log_manager
+from .writer import log_writer
 
 
-async def create_log(db: AsyncSession, log: schemas.LogCreate):
-    new_log = await repository.create_log(db=db, log=log)
-    log_dict = schemas.Log.from_orm(new_log).dict()
-    log_dict["created_at"] = log_dict["created_at"].isoformat()
-    log_manager.broadcast(json.dumps(log_dict))
-    return new_log
+async def create_log(log: schemas.LogCreate):
+    """Queue a log entry on the batched writer and wait for it to commit."""
+    return await log_writer.write(log)
 
 async def get_logs(db: AsyncSession, period: schemas.LogPeriod):
-    return await repository.get_logs_by_period(db=db, period=period)
\ No newline at end of file
+    return await repository.get_logs_by_period(db=db, period=period)
+
+def encode_cursor(log) -> str:
+    """Opaque page cursor holding the (created_at, id) key of ``log``."""
+    key = json.dumps([log.created_at.isoformat(), log.id])
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, log_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(log_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise BadRequestException("Invalid cursor")
+
+async def get_log_page(
+    db: AsyncSession,
+    limit: int,
+    cursor: str | None = None,
+    period: schemas.LogPeriod | None = None,
+    action: str | None = None,
+    gate_id: int | None = None,
+    user_id: int | None = None,
+) -> schemas.LogPage:
+    after = decode_cursor(cursor) if cursor else None
+    start = repository.period_start(period, datetime.utcnow()) if period else None
+    # One extra row tells whether another page exists
+    logs = await repository.get_logs_page(
+        db,
+        limit=limit + 1,
+        after=after,
+        start=start,
+        action=action,
+        gate_id=gate_id,
+        user_id=user_id,
+    )
+    next_cursor = encode_cursor(logs[limit - 1]) if len(logs) > limit else None
+    return schemas.LogPage(items=logs[:limit], next_cursor=next_cursor)
+
+def export_logs(
+    fmt: ExportFormat,
+    period: schemas.LogPeriod | None = None,
+    action: str | None = None,
+    gate_id: int | None = None,
+    user_id: int | None = None,
+) -> StreamingResponse:
+    start = repository.period_start(period, datetime.utcnow()) if period else None
+    query = repository.export_logs_query(
+        start=start, action=action, gate_id=gate_id, user_id=user_id
+    )
+    return export_response("logs", query, schemas.Log, fmt)
@@ -0,0 +1,123 @@
+import asyncio
+
+from api.core.config import settings
+from api.core.database import async_session
+from api.core.logging import get_logger
+from api.src.logs import repository, schemas
+from api.src.logs.models import Log
+from api.src.websockets.relay import LOGS, event_relay
+
+logger = get_logger(__name__)
+
+_STOP = (None, None)  # queued by stop(); everything ahead of it is still written
+
+
+def serialize_log(db_log: Log) -> str:
+    return schemas.Log.model_validate(db_log).model_dump_json()
+
+
+class LogWriter:
+    """Queue-backed log ingestion.
+
+    Entries are queued and written by one task in batches of up to
+    ``batch_size`` rows: a single INSERT ... RETURNING per batch gives back
+    the server-assigned ids and timestamps. Each batch is published to
+    ``/ws/logs`` (on every worker) only after it commits, in insertion order.
+    """
+
+    def __init__(self, batch_size: int | None = None):
+        self.batch_size = batch_size or settings.log_batch_size
+        self._queue: asyncio.Queue[tuple[schemas.LogCreate, asyncio.Future | None]] = (
+            asyncio.Queue()
+        )
+        self._task: asyncio.Task | None = None
+
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+    def submit(self, log: schemas.LogCreate) -> None:
+        """Queue a log entry without waiting for it to be written."""
+        self._queue.put_nowait((log, None))
+
+    async def write(self, log: schemas.LogCreate) -> Log:
+        """Queue a log entry and wait until its batch has committed."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((log, future))
+        if not self.running:
+            await self.flush()
+        return await future
+
+    def _take_batch(
+        self, limit: int
+    ) -> list[tuple[schemas.LogCreate, asyncio.Future | None]]:
+        batch = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _write_batch(self, batch) -> None:
+        try:
+            async with async_session() as session:
+                db_logs = await repository.bulk_create_logs(
+                    session, [log for log, _ in batch]
+                )
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"Log batch of {len(batch)} rows failed: {e}")
+            for _, future in batch:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        self.written += len(db_logs)
+        self.batches += 1
+        for (_, future), db_log in zip(batch, db_logs):
+            if future is not None and not future.done():
+                future.set_result(db_log)
+        for db_log in db_logs:
+            await event_relay.publish(LOGS, serialize_log(db_log))
+
+    async def flush(self) -> None:
+        """Write everything queued so far."""
+        while batch := self._take_batch(self.batch_size):
+            await self._write_batch(batch)
+
+    async def _run(self) -> None:
+        while True:
+            # Wait for one entry, then take whatever piled up behind it
+            first = await self._queue.get()
+            if first is _STOP:
+                return
+            batch = [first, *self._take_batch(self.batch_size - 1)]
+            stop = any(entry is _STOP for entry in batch)
+            await self._write_batch([entry for entry in batch if entry is not _STOP])
+            if stop:
+                return
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write out everything queued before the call, then stop the writer task."""
+        if self._task is not None:
+            self._queue.put_nowait(_STOP)
+            await self._task
+            self._task = None
+        await self.flush()
+
+
+log_writer = LogWriter()
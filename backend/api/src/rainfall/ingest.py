@@ -0,0 +1,161 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from api.core.config import settings
+from api.core.database import async_session
+from api.core.leader import LeaderLock
+from api.core.logging import get_logger
+from api.src.rainfall.schemas import RainfallReading
+from api.src.rainfall.service import RainfallService, cache_readings
+
+logger = get_logger(__name__)
+
+KST = timezone(timedelta(hours=9), "KST")
+
+# awsh.php (help=1) column layout
+RAIN_COLUMNS = [
+    "YYMMDDHHMI", "STN", "RE_SUM", "RE_QCM",
+    "RN_DAY", "RN_DAY_MI", "RN_HR1", "RN_HR1_MI",
+    "RN_60M_MAX", "RN_60M_MAX_MI", "RN_60M_QCM",
+    "RN_15M_MAX", "RN_15M_MAX_MI", "RN_15M_QCM",
+]  # fmt: skip
+_TM = RAIN_COLUMNS.index("YYMMDDHHMI")
+_STN = RAIN_COLUMNS.index("STN")
+_RN_DAY = RAIN_COLUMNS.index("RN_DAY")
+_RN_HR1 = RAIN_COLUMNS.index("RN_HR1")
+_RN_15M_MAX = RAIN_COLUMNS.index("RN_15M_MAX")
+
+
+def parse_rain_table(raw_text: str) -> dict[int, RainfallReading]:
+    """Parse the whole AWS response once into readings keyed by station.
+
+    Same rules as AI/scoring/get_rainfall.parse_rain_table (comment and short
+    lines skipped, first row per station wins). The detector and the backend
+    ship as separate images with no shared package, so the column layout is
+    kept in both; tests/test_rainfall.py pins this copy to the AI fixture rows.
+    """
+    readings: dict[int, RainfallReading] = {}
+    for line in raw_text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        values = line.split()
+        if len(values) < len(RAIN_COLUMNS):
+            continue
+        try:
+            stn = int(values[_STN])
+            reading = RainfallReading(
+                stn=stn,
+                observed_at=datetime.strptime(values[_TM], "%Y%m%d%H%M").replace(
+                    tzinfo=KST
+                ),
+                rn_hr1=float(values[_RN_HR1]),
+                rn_day=float(values[_RN_DAY]),
+                rn_15m_max=float(values[_RN_15M_MAX]),
+            )
+        except ValueError:
+            continue
+        readings.setdefault(stn, reading)
+    return readings
+
+
+class RainfallIngestor:
+    """Periodic KMA AWS poll shared by every rainfall consumer.
+
+    One poll per update cadence refreshes the Redis hash that detectors read
+    and appends the configured stations to the ``rainfall`` table. With
+    several workers only the holder of the rainfall leader lock polls.
+    """
+
+    def __init__(self):
+        self._task: asyncio.Task | None = None
+        self._client: httpx.AsyncClient | None = None
+        self.is_leader = False
+        self._leader_lock = LeaderLock(
+            settings.rainfall_leader_key,
+            settings.rainfall_leader_ttl,
+            on_elected=self._on_elected,
+            on_demoted=self._on_demoted,
+        )
+
+    async def _on_elected(self) -> None:
+        self.is_leader = True
+
+    async def _on_demoted(self) -> None:
+        self.is_leader = False
+
+    async def poll_once(self) -> bool:
+        """Fetch, parse and store one AWS snapshot. Returns True on success."""
+        try:
+            response = await self._client.get(
+                settings.kma_aws_url,
+                params={
+                    "var": "RN",
+                    "tm": datetime.now(KST).strftime("%Y%m%d%H%M"),
+                    "help": "1",
+                    "authKey": settings.kma_api_key,
+                },
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Rainfall poll failed: {e}")
+            return False
+
+        readings = parse_rain_table(response.text)
+        if not readings:
+            logger.warning("Rainfall poll returned no readings")
+            return False
+
+        await cache_readings(readings)
+        async with async_session() as session:
+            await RainfallService(session).save_readings(readings)
+        logger.info(f"Rainfall ingested for {len(readings)} stations")
+        return True
+
+    def _seconds_until_next_poll(self) -> float:
+        interval = settings.rainfall_poll_interval
+        now = time.time()
+        next_tick = (now // interval + 1) * interval + settings.rainfall_publish_delay
+        if next_tick - now > interval:
+            next_tick -= interval
+        return next_tick - now
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self.is_leader:
+                    await self.poll_once()
+            except Exception as e:
+                logger.error(f"Rainfall ingestion error: {e}")
+            await asyncio.sleep(self._seconds_until_next_poll())
+
+    def start(self) -> None:
+        if not settings.kma_api_key:
+            logger.info("KMA_API_KEY not set; rainfall ingestion disabled")
+            return
+        if self._task is not None:
+            return
+        if settings.rainfall_leader_election:
+            self._leader_lock.start()
+        else:
+            self.is_leader = True  # single worker: always poll
+        self._client = httpx.AsyncClient(timeout=10.0)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        await self._leader_lock.stop()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+rainfall_ingestor = RainfallIngestor()
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, Index, Integer, Numeric, UniqueConstraint
+from sqlalchemy.sql import func
+
+from api.core.database import Base
+
+
+class Rainfall(Base):
+    __tablename__ = "rainfall"
+
+    id = Column(Integer, primary_key=True, index=True)
+    stn = Column(Integer, nullable=False)
+    observed_at = Column(DateTime(timezone=True), nullable=False)
+    rn_hr1 = Column(Numeric(precision=6, scale=1), nullable=False)
+    rn_day = Column(Numeric(precision=6, scale=1), nullable=False)
+    rn_15m_max = Column(Numeric(precision=6, scale=1), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("stn", "observed_at", name="uq_rainfall_stn_observed_at"),
+        Index("ix_rainfall_observed_at", "observed_at"),
+    )
@@ -0,0 +1,33 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.src.rainfall.models import Rainfall
+from api.src.rainfall.schemas import RainfallReading
+
+
+class RainfallRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def bulk_create(self, readings: list[RainfallReading]) -> None:
+        """Insert readings in one statement, skipping already stored observations."""
+        if not readings:
+            return
+        query = (
+            insert(Rainfall)
+            .values([reading.model_dump() for reading in readings])
+            .on_conflict_do_nothing(index_elements=["stn", "observed_at"])
+        )
+        await self.session.execute(query)
+        await self.session.commit()
+
+    async def get_latest(self, stn: int) -> Rainfall | None:
+        query = (
+            select(Rainfall)
+            .where(Rainfall.stn == stn)
+            .order_by(Rainfall.observed_at.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.database import get_session
+from api.core.exceptions import NotFoundException
+from api.src.rainfall.schemas import RainfallResponse
+from api.src.rainfall.service import RainfallService
+
+router = APIRouter(prefix="/rainfall", tags=["rainfall"])
+
+
+def get_rainfall_service(
+    session: AsyncSession = Depends(get_session),
+) -> RainfallService:
+    return RainfallService(session)
+
+
+@router.get("/latest", response_model=RainfallResponse)
+async def get_latest_rainfall(
+    stn: int = Query(..., description="KMA AWS station id"),
+    service: RainfallService = Depends(get_rainfall_service),
+):
+    """Get the latest ingested rainfall reading of a station."""
+    reading = await service.get_latest(stn)
+    if reading is None:
+        raise NotFoundException(f"No rainfall data for station {stn}")
+    return reading
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RainfallReading(BaseModel):
+    """One station's rainfall reading as parsed from the KMA AWS response."""
+
+    stn: int
+    observed_at: datetime
+    rn_hr1: float
+    rn_day: float
+    rn_15m_max: float
+
+
+class RainfallResponse(RainfallReading):
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,74 @@
+import json
+import time
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.config import settings
+from api.core.redis import redis_client
+from api.src.rainfall.repository import RainfallRepository
+from api.src.rainfall.schemas import RainfallReading
+
+UPDATED_AT_FIELD = "updated_at"
+
+
+def _to_cache_value(reading: RainfallReading) -> str:
+    # Field names follow the KMA columns so detectors can use them as-is
+    return json.dumps(
+        {
+            "RN_HR1": reading.rn_hr1,
+            "RN_DAY": reading.rn_day,
+            "RN_15M_MAX": reading.rn_15m_max,
+            "observed_at": reading.observed_at.isoformat(),
+        }
+    )
+
+
+def _from_cache_value(stn: int, value: str) -> RainfallReading:
+    data = json.loads(value)
+    return RainfallReading(
+        stn=stn,
+        observed_at=datetime.fromisoformat(data["observed_at"]),
+        rn_hr1=data["RN_HR1"],
+        rn_day=data["RN_DAY"],
+        rn_15m_max=data["RN_15M_MAX"],
+    )
+
+
+async def cache_readings(readings: dict[int, RainfallReading]) -> None:
+    """Replace the shared latest-readings hash in a single Redis round trip."""
+    mapping = {str(stn): _to_cache_value(reading) for stn, reading in readings.items()}
+    mapping[UPDATED_AT_FIELD] = str(time.time())
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(settings.redis_rainfall_key)
+        pipe.hset(settings.redis_rainfall_key, mapping=mapping)
+        await pipe.execute()
+
+
+async def get_cached_reading(stn: int) -> RainfallReading | None:
+    value = await redis_client.hget(settings.redis_rainfall_key, str(stn))
+    return _from_cache_value(stn, value) if value else None
+
+
+class RainfallService:
+    def __init__(self, session: AsyncSession):
+        self.repository = RainfallRepository(session)
+
+    async def save_readings(self, readings: dict[int, RainfallReading]) -> None:
+        """Persist the readings of the configured stations."""
+        stations = {
+            int(stn) for stn in settings.rainfall_stations.split(",") if stn.strip()
+        }
+        selected = [
+            reading
+            for stn, reading in readings.items()
+            if not stations or stn in stations
+        ]
+        await self.repository.bulk_create(selected)
+
+    async def get_latest(self, stn: int):
+        """Get the latest reading of a station, from Redis first, then the DB."""
+        reading = await get_cached_reading(stn)
+        if reading is not None:
+            return reading
+        return await self.repository.get_latest(stn)
@@ -1,4 +1,13 @@
-from sqlalchemy import Column, Integer, Numeric, DateTime
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    Numeric,
+    PrimaryKeyConstraint,
+    String,
+)
 from sqlalchemy.sql import func
 
 from api.core.database import Base
@@ -9,4 +18,44 @@ class ScoreData(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     final_score = Column(Numeric(precision=5, scale=3), nullable=False)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    # Source camera and location (NULL for scores from single-camera detectors)
+    camera_id = Column(String(50), nullable=True)
+    lat = Column(Numeric(precision=8, scale=6), nullable=True)
+    lng = Column(Numeric(precision=9, scale=6), nullable=True)
+    # Components of final_score
+    dem_score = Column(Float, nullable=True)
+    rain_score = Column(Float, nullable=True)
+    drain_score = Column(Float, nullable=True)
+    puddle_score = Column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("ix_score_data_camera_id_timestamp", "camera_id", "timestamp"),
+    )
+
+
+class ScoreRollup(Base):
+    """Per-bucket score aggregates, updated with every score batch.
+
+    resolution is one of ROLLUP_RESOLUTIONS ("1m", "1h"); bucket is the UTC
+    start of the interval. avg = sum_score / count. Every score counts toward
+    the all-cameras rollup (camera_id "") and, if it has one, its camera's.
+    """
+
+    __tablename__ = "score_rollups"
+
+    camera_id = Column(String(50), nullable=False, server_default="")
+    resolution = Column(String(8), nullable=False)
+    bucket = Column(DateTime(timezone=True), nullable=False)
+    min_score = Column(Float, nullable=False)
+    max_score = Column(Float, nullable=False)
+    sum_score = Column(Float, nullable=False)
+    count = Column(Integer, nullable=False)
+    last_score = Column(Float, nullable=False)
+    last_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "camera_id", "resolution", "bucket", name="pk_score_rollups"
+        ),
+    )
@@ -1,9 +1,71 @@
-from sqlalchemy import select
+from sqlalchemy import Select, case, func, insert, select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 
-from api.src.scores.models import ScoreData
-from api.src.scores.schemas import ScoreDataCreate
+from api.src.scores.models import ScoreData, ScoreRollup
+from api.src.scores.schemas import ScoreDataCreate, ScoreResolution
+
+# Rollup bucket sizes maintained on every insert
+ROLLUP_RESOLUTIONS = {
+    ScoreResolution.MINUTE: timedelta(minutes=1),
+    ScoreResolution.HOUR: timedelta(hours=1),
+}
+# Rollup key aggregating every camera
+ALL_CAMERAS = ""
+
+
+def truncate(timestamp: datetime, resolution: ScoreResolution) -> datetime:
+    """Start of the rollup bucket containing ``timestamp``."""
+    if resolution == ScoreResolution.MINUTE:
+        return timestamp.replace(second=0, microsecond=0)
+    if resolution == ScoreResolution.HOUR:
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    raise ValueError(f"Not a rollup resolution: {resolution}")
+
+
+def aggregate_rollups(rows: list[dict]) -> list[dict]:
+    """Fold score rows into one aggregate per (camera, resolution, bucket)."""
+    buckets: dict[tuple, dict] = {}
+    for row in rows:
+        timestamp, score = row["timestamp"], float(row["final_score"])
+        cameras = {ALL_CAMERAS, row.get("camera_id") or ALL_CAMERAS}
+        for camera_id in cameras:
+            for resolution in ROLLUP_RESOLUTIONS:
+                key = (camera_id, resolution.value, truncate(timestamp, resolution))
+                agg = buckets.get(key)
+                if agg is None:
+                    buckets[key] = {
+                        "camera_id": camera_id,
+                        "resolution": key[1],
+                        "bucket": key[2],
+                        "min_score": score,
+                        "max_score": score,
+                        "sum_score": score,
+                        "count": 1,
+                        "last_score": score,
+                        "last_at": timestamp,
+                    }
+                    continue
+                agg["min_score"] = min(agg["min_score"], score)
+                agg["max_score"] = max(agg["max_score"], score)
+                agg["sum_score"] += score
+                agg["count"] += 1
+                if timestamp >= agg["last_at"]:
+                    agg["last_score"], agg["last_at"] = score, timestamp
+    return list(buckets.values())
+
+
+def range_query(start: datetime, end: datetime, camera_id: str | None = None) -> Select:
+    """Raw score rows in [start, end), oldest first."""
+    query = (
+        select(ScoreData)
+        .where(ScoreData.timestamp >= start, ScoreData.timestamp < end)
+        .order_by(ScoreData.timestamp, ScoreData.id)
+    )
+    if camera_id is not None:
+        query = query.where(ScoreData.camera_id == camera_id)
+    return query
 
 
 class ScoreDataRepository:
@@ -17,7 +79,68 @@ class ScoreDataRepository:
         await self.session.refresh(db_score_data)
         return db_score_data
 
-    async def get_latest_scores(self) -> list[ScoreData]:
+    async def bulk_create(self, rows: list[dict]) -> None:
+        """Insert many score rows and fold them into the rollups in one transaction."""
+        await self.session.execute(insert(ScoreData), rows)
+        await self._upsert_rollups(aggregate_rollups(rows))
+        await self.session.commit()
+
+    async def _upsert_rollups(self, rollups: list[dict]) -> None:
+        if not rollups:
+            return
+        query = postgresql.insert(ScoreRollup).values(rollups)
+        new = query.excluded
+        newer = new.last_at >= ScoreRollup.last_at
+        query = query.on_conflict_do_update(
+            index_elements=["camera_id", "resolution", "bucket"],
+            set_={
+                "min_score": func.least(ScoreRollup.min_score, new.min_score),
+                "max_score": func.greatest(ScoreRollup.max_score, new.max_score),
+                "sum_score": ScoreRollup.sum_score + new.sum_score,
+                "count": ScoreRollup.count + new.count,
+                "last_score": case(
+                    (newer, new.last_score), else_=ScoreRollup.last_score
+                ),
+                "last_at": case((newer, new.last_at), else_=ScoreRollup.last_at),
+            },
+        )
+        await self.session.execute(query)
+
+    async def get_latest_scores(self, camera_id: str | None = None) -> list[ScoreData]:
         query = select(ScoreData).order_by(ScoreData.timestamp.desc()).limit(100)
+        if camera_id is not None:
+            query = query.where(ScoreData.camera_id == camera_id)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_range(
+        self, start: datetime, end: datetime, limit: int, camera_id: str | None = None
+    ) -> list[ScoreData]:
+        """Raw rows in [start, end), oldest first.
+
+        Served by the timestamp index, or by (camera_id, timestamp) for one camera.
+        """
+        query = range_query(start, end, camera_id).limit(limit)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_rollups(
+        self,
+        resolution: ScoreResolution,
+        start: datetime,
+        end: datetime,
+        camera_id: str | None = None,
+    ) -> list[ScoreRollup]:
+        """Buckets overlapping [start, end), oldest first (all cameras by default)."""
+        query = (
+            select(ScoreRollup)
+            .where(
+                ScoreRollup.camera_id == (camera_id or ALL_CAMERAS),
+                ScoreRollup.resolution == resolution.value,
+                ScoreRollup.bucket >= truncate(start, resolution),
+                ScoreRollup.bucket < end,
+            )
+            .order_by(ScoreRollup.bucket)
+        )
         result = await self.session.execute(query)
         return list(result.scalars().all())
@@ -1,12 +1,36 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime, timedelta, timezone
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_session
-from api.src.scores.schemas import ScoreDataResponse
-from api.src.scores.service import ScoreDataService
+from api.core.exceptions import BadRequestException
+from api.src.scores.schemas import (
+    ScoreDataResponse,
+    ScoreResolution,
+    ScoreSeriesResponse,
+)
+from api.src.scores.service import ScoreDataService, export_scores_stream
+from api.utils.export import ExportFormat
 
 router = APIRouter(prefix="/scores", tags=["scores"])
 
+
+def time_range(
+    start: datetime | None, end: datetime | None
+) -> tuple[datetime, datetime]:
+    """Default to the last day; naive datetimes are taken as UTC."""
+    end = end or datetime.now(timezone.utc)
+    start = start or end - timedelta(days=1)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    if start >= end:
+        raise BadRequestException("start must be before end")
+    return start, end
+
+
 def get_score_service(
     session: AsyncSession = Depends(get_session),
 ) -> ScoreDataService:
@@ -15,6 +39,48 @@ def get_score_service(
 
 @router.get("/history", response_model=list[ScoreDataResponse])
 async def get_score_history(
+    camera_id: str | None = Query(None, description="Only this camera's scores"),
     service: ScoreDataService = Depends(get_score_service),
 ):
-    return await service.get_scores()
+    return await service.get_scores(camera_id)
+
+
+@router.get("/series", response_model=ScoreSeriesResponse)
+async def get_score_series(
+    start: datetime | None = Query(
+        None, description="Range start (default: end - 1 day)"
+    ),
+    end: datetime | None = Query(
+        None, description="Range end, exclusive (default: now)"
+    ),
+    resolution: ScoreResolution = Query(
+        ScoreResolution.AUTO, description="raw rows, 1m/1h rollups, or auto by range"
+    ),
+    camera_id: str | None = Query(
+        None, description="One camera (default: all cameras)"
+    ),
+    service: ScoreDataService = Depends(get_score_service),
+):
+    """Get min/max/avg/last score per point over a time range."""
+    start, end = time_range(start, end)
+    return await service.get_series(start, end, resolution, camera_id)
+
+
+@router.get("/export")
+async def export_scores(
+    start: datetime | None = Query(
+        None, description="Range start (default: end - 1 day)"
+    ),
+    end: datetime | None = Query(
+        None, description="Range end, exclusive (default: now)"
+    ),
+    camera_id: str | None = Query(
+        None, description="One camera (default: all cameras)"
+    ),
+    fmt: ExportFormat = Query(
+        ExportFormat.NDJSON, alias="format", description="ndjson or csv"
+    ),
+):
+    """Download raw scores, oldest first, streamed in constant memory."""
+    start, end = time_range(start, end)
+    return export_scores_stream(start, end, camera_id, fmt)
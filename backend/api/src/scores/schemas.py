@@ -1,9 +1,18 @@
+from enum import Enum
+
 from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
 class ScoreDataCreate(BaseModel):
     final_score: float = Field(..., ge=0.0, le=1.0)
+    camera_id: str | None = Field(None, max_length=50)
+    lat: float | None = None
+    lng: float | None = None
+    dem_score: float | None = None
+    rain_score: float | None = None
+    drain_score: float | None = None
+    puddle_score: float | None = None
 
 
 class ScoreDataResponse(BaseModel):
@@ -12,3 +21,36 @@ class ScoreDataResponse(BaseModel):
     id: int
     final_score: float
     timestamp: datetime
+    camera_id: str | None = None
+    lat: float | None = None
+    lng: float | None = None
+    dem_score: float | None = None
+    rain_score: float | None = None
+    drain_score: float | None = None
+    puddle_score: float | None = None
+
+
+class ScoreResolution(str, Enum):
+    AUTO = "auto"
+    RAW = "raw"
+    MINUTE = "1m"
+    HOUR = "1h"
+
+
+class ScorePoint(BaseModel):
+    """One point of a score series; raw rows have min = max = avg = last."""
+
+    timestamp: datetime
+    min: float
+    max: float
+    avg: float
+    last: float
+    count: int
+
+
+class ScoreSeriesResponse(BaseModel):
+    camera_id: str | None = None
+    resolution: ScoreResolution
+    start: datetime
+    end: datetime
+    points: list[ScorePoint]
@@ -1,7 +1,39 @@
+from datetime import datetime, timedelta
+
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.src.scores.repository import ScoreDataRepository
-from api.src.scores.schemas import ScoreDataCreate
+from api.src.scores.repository import ScoreDataRepository, range_query
+from api.src.scores.schemas import (
+    ScoreDataCreate,
+    ScoreDataResponse,
+    ScorePoint,
+    ScoreResolution,
+    ScoreSeriesResponse,
+)
+from api.utils.export import ExportFormat, export_response
+
+# resolution=auto: the finest resolution whose span limit covers the range
+AUTO_RESOLUTION_SPANS = [
+    (timedelta(hours=1), ScoreResolution.RAW),
+    (timedelta(days=2), ScoreResolution.MINUTE),
+]
+RAW_POINT_LIMIT = 10000
+
+
+def pick_resolution(start: datetime, end: datetime) -> ScoreResolution:
+    span = end - start
+    for max_span, resolution in AUTO_RESOLUTION_SPANS:
+        if span <= max_span:
+            return resolution
+    return ScoreResolution.HOUR
+
+
+def export_scores_stream(
+    start: datetime, end: datetime, camera_id: str | None, fmt: ExportFormat
+) -> StreamingResponse:
+    query = range_query(start, end, camera_id)
+    return export_response("scores", query, ScoreDataResponse, fmt)
 
 
 class ScoreDataService:
@@ -11,5 +43,54 @@ class ScoreDataService:
     async def create_score_data(self, score_data: ScoreDataCreate):
         return await self.repository.create(score_data)
 
-    async def get_scores(self):
-        return await self.repository.get_latest_scores()
+    async def get_scores(self, camera_id: str | None = None):
+        return await self.repository.get_latest_scores(camera_id)
+
+    async def get_series(
+        self,
+        start: datetime,
+        end: datetime,
+        resolution: ScoreResolution,
+        camera_id: str | None = None,
+    ) -> ScoreSeriesResponse:
+        """Score series over [start, end) read from raw rows or the matching rollup."""
+        if resolution == ScoreResolution.AUTO:
+            resolution = pick_resolution(start, end)
+
+        if resolution == ScoreResolution.RAW:
+            rows = await self.repository.get_range(
+                start, end, RAW_POINT_LIMIT, camera_id
+            )
+            points = [
+                ScorePoint(
+                    timestamp=row.timestamp,
+                    min=row.final_score,
+                    max=row.final_score,
+                    avg=row.final_score,
+                    last=row.final_score,
+                    count=1,
+                )
+                for row in rows
+            ]
+        else:
+            rollups = await self.repository.get_rollups(
+                resolution, start, end, camera_id
+            )
+            points = [
+                ScorePoint(
+                    timestamp=rollup.bucket,
+                    min=rollup.min_score,
+                    max=rollup.max_score,
+                    avg=rollup.sum_score / rollup.count,
+                    last=rollup.last_score,
+                    count=rollup.count,
+                )
+                for rollup in rollups
+            ]
+        return ScoreSeriesResponse(
+            camera_id=camera_id,
+            resolution=resolution,
+            start=start,
+            end=end,
+            points=points,
+        )
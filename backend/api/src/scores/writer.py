@@ -0,0 +1,123 @@
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+from api.core.config import settings
+from api.core.database import async_session
+from api.core.logging import get_logger
+from api.src.scores.repository import ScoreDataRepository
+from api.src.scores.schemas import ScoreDataCreate
+
+logger = get_logger(__name__)
+
+
+class ScoreWriteBuffer:
+    """Write-behind buffer for detector scores.
+
+    Scores are stamped on arrival and kept in memory, then written with one
+    multi-row INSERT when ``flush_rows`` are waiting or ``flush_interval``
+    seconds have passed, whichever comes first. Rows from a failed flush go
+    back to the front of the buffer; past ``limit`` rows the oldest are dropped.
+    """
+
+    def __init__(
+        self,
+        flush_rows: int | None = None,
+        flush_interval: float | None = None,
+        limit: int | None = None,
+    ):
+        self.flush_rows = flush_rows or settings.score_flush_rows
+        self.flush_interval = flush_interval or settings.score_flush_interval
+        self.limit = limit or settings.score_buffer_limit
+
+        self._rows: deque[dict] = deque()
+        self._full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+        self.written = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.last_flush_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def stats(self) -> dict:
+        return {
+            "buffered": len(self._rows),
+            "written": self.written,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+        }
+
+    def add(self, score: ScoreDataCreate, timestamp: datetime | None = None) -> None:
+        """Queue one score row (never blocks on the database)."""
+        row = score.model_dump()
+        row["timestamp"] = timestamp or datetime.now(timezone.utc)
+        self._rows.append(row)
+        self._trim()
+        if len(self._rows) >= self.flush_rows:
+            self._full.set()
+
+    def _trim(self) -> None:
+        overflow = len(self._rows) - self.limit
+        if overflow > 0:
+            for _ in range(overflow):
+                self._rows.popleft()
+            self.dropped += overflow
+            logger.warning(f"Score buffer full; dropped {overflow} oldest rows")
+
+    async def flush(self) -> int:
+        """Write everything buffered so far. Returns the number of rows written."""
+        async with self._flush_lock:
+            if not self._rows:
+                return 0
+            rows = list(self._rows)
+            self._rows.clear()
+            self._full.clear()
+
+            started = time.perf_counter()
+            try:
+                async with async_session() as session:
+                    await ScoreDataRepository(session).bulk_create(rows)
+            except BaseException as e:
+                self._rows.extendleft(reversed(rows))
+                self._trim()
+                if not isinstance(e, Exception):  # cancelled: keep rows for stop()
+                    raise
+                logger.error(f"Score flush of {len(rows)} rows failed: {e}")
+                return 0
+
+            self.last_flush_ms = (time.perf_counter() - started) * 1000.0
+            self.written += len(rows)
+            self.flushes += 1
+            return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write out whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+score_buffer = ScoreWriteBuffer()
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from fastapi import APIRouter, Path as PathParam
+from fastapi.responses import FileResponse
+
+from api.core.config import settings
+from api.core.exceptions import NotFoundException
+
+router = APIRouter(prefix="/tiles", tags=["tiles"])
+
+
+@router.get("/{layer}/{z}/{x}/{y}.png", response_class=FileResponse)
+async def get_tile(
+    layer: str = PathParam(..., pattern=r"^[A-Za-z0-9_-]+$"),
+    z: int = PathParam(..., ge=0, le=22),
+    x: int = PathParam(..., ge=0),
+    y: int = PathParam(..., ge=0),
+):
+    """Serve one pre-rendered risk map tile.
+
+    Tiles are only rewritten when their scores change, so the file's mtime
+    doubles as the ETag/Last-Modified validator for conditional requests.
+    """
+    path = Path(settings.tile_dir) / layer / str(z) / str(x) / f"{y}.png"
+    if not path.is_file():
+        raise NotFoundException("Tile not found")
+    return FileResponse(
+        path,
+        media_type="image/png",
+        headers={"Cache-Control": f"public, max-age={settings.tile_max_age}"},
+    )
@@ -0,0 +1,161 @@
+import asyncio
+
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from api.core.config import settings
+from api.core.database import async_session
+from api.core.exceptions import NotFoundException
+from api.core.logging import get_logger
+from api.core.redis import redis_client
+from api.src.users.models import User
+from api.src.users.repository import UserRepository
+from api.src.users.schemas import UserResponse
+from api.utils.cache import TTLCache
+
+logger = get_logger(__name__)
+
+# Session.info key for ids of users changed in the current transaction
+PENDING_INVALIDATIONS = "user_cache_invalidate"
+REDIS_DELETE_ATTEMPTS = 3
+
+
+class UserCache:
+    """Authenticated principals by user id, so a request needs no DB query.
+
+    Lookups go to an in-process TTL/LRU first, then (if ``redis`` is on) to a
+    shared Redis entry, and only then to the database. Updating or deleting a
+    ``User`` through the ORM drops the entry here and in Redis once the
+    transaction commits; other workers' in-process copies expire within
+    ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        redis: bool | None = None,
+    ):
+        self.ttl = ttl or settings.auth_user_cache_ttl
+        self.redis = settings.auth_user_cache_redis if redis is None else redis
+        self._local: TTLCache[int, UserResponse] = TTLCache(
+            maxsize or settings.auth_user_cache_size, self.ttl
+        )
+        self._pending: set[asyncio.Task] = set()
+
+    @staticmethod
+    def key(user_id: int) -> str:
+        return f"{settings.redis_auth_user_prefix}{user_id}"
+
+    def stats(self) -> dict:
+        return self._local.stats()
+
+    async def get(self, user_id: int) -> UserResponse | None:
+        """Principal for ``user_id``, or None if the user does not exist."""
+        user = self._local.get(user_id)
+        if user is not None:
+            return user
+
+        user = await self._read_redis(user_id)
+        if user is None:
+            user = await self._load(user_id)
+            if user is None:
+                return None
+            await self._write_redis(user)
+        self._local.set(user_id, user)
+        return user
+
+    async def _load(self, user_id: int) -> UserResponse | None:
+        async with async_session() as session:
+            try:
+                user = await UserRepository(session).get_by_id(user_id)
+            except NotFoundException:
+                return None
+            return UserResponse.model_validate(user)
+
+    async def _read_redis(self, user_id: int) -> UserResponse | None:
+        if not self.redis:
+            return None
+        try:
+            cached = await redis_client.get(self.key(user_id))
+        except RedisError as e:
+            logger.warning(f"User cache read failed: {e}")
+            return None
+        return UserResponse.model_validate_json(cached) if cached else None
+
+    async def _write_redis(self, user: UserResponse) -> None:
+        if not self.redis:
+            return
+        try:
+            await redis_client.set(
+                self.key(user.id), user.model_dump_json(), ex=int(self.ttl)
+            )
+        except RedisError as e:
+            logger.warning(f"User cache write failed: {e}")
+
+    async def _delete_redis(self, user_ids: list[int]) -> None:
+        keys = [self.key(user_id) for user_id in user_ids]
+        for attempt in range(REDIS_DELETE_ATTEMPTS):
+            try:
+                await redis_client.delete(*keys)
+                return
+            except RedisError as e:
+                logger.warning(
+                    f"User cache invalidation failed for users {user_ids}: {e}"
+                )
+                await asyncio.sleep(0.1 * 2**attempt)
+        logger.error(
+            f"User cache entries for users {user_ids} stay until their TTL expires"
+        )
+
+    def invalidate(self, *user_ids: int) -> None:
+        """Forget ``user_ids`` locally now and in Redis in a tracked task.
+
+        The Redis delete is awaited by ``drain``.
+        """
+        for user_id in user_ids:
+            self._local.pop(user_id)
+        if not self.redis or not user_ids:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(
+                self._delete_redis(list(user_ids))
+            )
+        except RuntimeError:  # no loop (sync scripts): Redis entry expires by TTL
+            return
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        """Wait for Redis invalidations still in flight (called on shutdown)."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def clear(self) -> None:
+        self._local.clear()
+
+
+user_cache = UserCache()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _collect_user(mapper, connection, target: User) -> None:
+    # Invalidated after commit: a rolled-back change must not evict, and a
+    # concurrent reader must not reload the old row before the commit lands
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(PENDING_INVALIDATIONS, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    user_ids = session.info.pop(PENDING_INVALIDATIONS, None)
+    if user_ids:
+        user_cache.invalidate(*user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(PENDING_INVALIDATIONS, None)
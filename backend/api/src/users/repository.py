@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.exceptions import AlreadyExistsException, NotFoundException
 from api.core.logging import get_logger
-from api.core.security import get_password_hash
+from api.core.security import get_password_hash_async
 from api.src.users.models import User
 from api.src.users.schemas import UserCreate
 
@@ -35,7 +35,8 @@ class UserRepository:
 
         # Create user
         user = User(
-            email=user_data.email, hashed_password=get_password_hash(user_data.password)
+            email=user_data.email,
+            hashed_password=await get_password_hash_async(user_data.password),
         )
         self.session.add(user)
         await self.session.commit()
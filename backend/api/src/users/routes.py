@@ -7,7 +7,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api.core.database import get_session
 from api.core.logging import get_logger
 from api.core.security import get_current_user
-from api.src.users.models import User
 from api.src.users.schemas import LoginData, Token, UserCreate, UserResponse
 from api.src.users.service import UserService
 
@@ -40,6 +39,6 @@ async def login(
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(user: User = Depends(get_current_user)) -> UserResponse:
+async def get_me(user: UserResponse = Depends(get_current_user)) -> UserResponse:
     """Get current authenticated user."""
     return user
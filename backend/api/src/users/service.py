@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api.core.config import settings
 from api.core.exceptions import UnauthorizedException
 from api.core.logging import get_logger
-from api.core.security import create_access_token, verify_password
+from api.core.security import create_access_token, verify_password_async
 from api.src.users.models import User
 from api.src.users.repository import UserRepository
 from api.src.users.schemas import LoginData, Token, UserCreate
@@ -30,7 +30,7 @@ class UserService:
         user = await self.repository.get_by_email(login_data.email)
 
         # Verify credentials
-        if not user or not verify_password(
+        if not user or not await verify_password_async(
             login_data.password, str(user.hashed_password)
         ):
             raise UnauthorizedException(detail="Incorrect email or password")
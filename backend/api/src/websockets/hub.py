@@ -0,0 +1,197 @@
+import asyncio
+from collections.abc import Iterable
+
+from fastapi import WebSocket
+
+from api.core.config import settings
+from api.core.logging import get_logger
+from api.src.websockets.protocol import DeltaSession
+
+logger = get_logger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+# 1013 "Try Again Later": the client could not keep up with the broadcast rate
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class _Client:
+    """One WebSocket with its own bounded send queue and writer task."""
+
+    def __init__(
+        self, websocket: WebSocket, queue_size: int, session: DeltaSession | None
+    ):
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.session = session
+        self.task: asyncio.Task | None = None
+        self.dropped = 0
+
+    def next_frame(self, message: str) -> str | bytes | None:
+        if self.session is None:
+            return message
+        # Messages are full states: only the newest one matters for the next delta
+        while not self.queue.empty():
+            message = self.queue.get_nowait()
+        return self.session.encode(message)
+
+
+class BroadcastHub:
+    """Fan-out of already-serialized messages to many WebSocket clients.
+
+    ``broadcast`` only enqueues: every client has a bounded queue drained by its
+    own writer task, so clients are written to concurrently and a slow or dead
+    dashboard never delays the others. When a client's queue is full the
+    ``policy`` decides: ``drop_oldest`` discards its oldest pending message,
+    ``disconnect`` closes it. A send that takes longer than ``send_timeout``
+    seconds also drops the client.
+
+    Clients connected with a ``DeltaSession`` get the v2 protocol instead:
+    messages are full states, so their queue only keeps the newest one (a
+    throttled client is never dropped or disconnected for falling behind),
+    and their writer waits ``1 / max_rate`` seconds between delta frames.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        queue_size: int | None = None,
+        policy: str | None = None,
+        send_timeout: float | None = None,
+    ):
+        self.name = name
+        self.queue_size = queue_size or settings.ws_send_queue_size
+        self.policy = policy or settings.ws_slow_client_policy
+        self.send_timeout = send_timeout or settings.ws_send_timeout
+        if self.policy not in (DROP_OLDEST, DISCONNECT):
+            raise ValueError(f"Unknown slow client policy: {self.policy}")
+
+        self._clients: dict[WebSocket, _Client] = {}
+        self._closing: set[asyncio.Task] = set()
+        self.latest: str | None = None  # last broadcast message
+        self.dropped = 0
+        self.disconnected_slow = 0
+
+    @property
+    def active_connections(self) -> list[WebSocket]:
+        return list(self._clients)
+
+    def stats(self) -> dict:
+        return {
+            "clients": len(self._clients),
+            "queued": sum(client.queue.qsize() for client in self._clients.values()),
+            "dropped": self.dropped,
+            "disconnected_slow": self.disconnected_slow,
+        }
+
+    # --- Connections ---
+    async def connect(
+        self,
+        websocket: WebSocket,
+        initial: Iterable[str] = (),
+        session: DeltaSession | None = None,
+    ) -> None:
+        """Accept and register a client; ``initial`` messages are queued first.
+
+        They go through the slow-client policy like any broadcast, so a backlog
+        longer than the queue is trimmed or closes the client instead of raising.
+        """
+        await websocket.accept()
+        client = _Client(websocket, self.queue_size, session)
+        client.task = asyncio.create_task(self._writer(client))
+        self._clients[websocket] = client
+        for message in initial:
+            if websocket not in self._clients:  # closed by the disconnect policy
+                break
+            self._enqueue(client, message)
+
+    def disconnect(self, websocket: WebSocket) -> None:
+        client = self._clients.pop(websocket, None)
+        if client is not None and client.task is not asyncio.current_task():
+            client.task.cancel()
+
+    async def _close(self, client: _Client, code: int) -> None:
+        self.disconnect(client.websocket)
+        try:
+            await client.websocket.close(code=code)
+        except Exception:
+            pass  # already gone
+
+    def _close_later(self, client: _Client, code: int) -> None:
+        self.disconnect(client.websocket)  # stop queueing for it right away
+        task = asyncio.create_task(self._close(client, code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _writer(self, client: _Client) -> None:
+        while True:
+            message = await client.queue.get()
+            try:
+                frame = client.next_frame(message)
+            except ValueError as e:
+                logger.warning(f"[{self.name}] could not encode message: {e}")
+                continue
+            if frame is None:
+                continue
+            send = (
+                client.websocket.send_bytes
+                if isinstance(frame, bytes)
+                else client.websocket.send_text
+            )
+            try:
+                await asyncio.wait_for(send(frame), self.send_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"[{self.name}] send timed out; dropping {client.websocket.client}"
+                )
+                await self._close(client, SLOW_CONSUMER_CLOSE_CODE)
+                return
+            except Exception as e:
+                logger.info(
+                    f"[{self.name}] send failed ({e}); "
+                    f"dropping {client.websocket.client}"
+                )
+                self.disconnect(client.websocket)
+                return
+            if client.session is not None and client.session.min_interval:
+                await asyncio.sleep(client.session.min_interval)
+
+    # --- Sending ---
+    def _enqueue(self, client: _Client, message: str) -> None:
+        if client.session is not None:
+            # Replace whatever is pending: the writer only encodes the newest state
+            while not client.queue.empty():
+                client.queue.get_nowait()
+            client.queue.put_nowait(message)
+            return
+
+        try:
+            client.queue.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.policy == DROP_OLDEST:
+            client.queue.get_nowait()
+            client.queue.put_nowait(message)
+            client.dropped += 1
+            self.dropped += 1
+        else:
+            logger.warning(
+                f"[{self.name}] slow consumer {client.websocket.client}; disconnecting"
+            )
+            self.disconnected_slow += 1
+            self._close_later(client, SLOW_CONSUMER_CLOSE_CODE)
+
+    def send(self, websocket: WebSocket, message: str) -> None:
+        """Queue a message for one client."""
+        client = self._clients.get(websocket)
+        if client is not None:
+            self._enqueue(client, message)
+
+    async def broadcast(self, message: str) -> None:
+        """Queue one serialized message for every client (never waits on sockets)."""
+        self.latest = message
+        for client in list(self._clients.values()):
+            self._enqueue(client, message)
@@ -0,0 +1,269 @@
+import asyncio
+import json
+import time
+from datetime import datetime
+
+import aiomqtt
+
+from api.core.config import settings
+from api.core.leader import WORKER_ID, LeaderLock
+from api.core.logging import get_logger
+from api.src.logs.schemas import LogCreate
+from api.src.logs.writer import log_writer
+from api.src.scores.schemas import ScoreDataCreate
+from api.src.scores.writer import score_buffer
+from api.src.websockets.relay import GATE_STATUS, LOGS, event_relay
+from api.src.websockets.status_cache import gate_status_cache
+
+logger = get_logger(__name__)
+
+GATE_KEY_PREFIX = "gate_"
+
+
+class MQTTBridge:
+    """Asyncio MQTT client running as a task inside the application lifespan.
+
+    Controller status messages are consumed as an async stream and each one is
+    handled by a single coroutine: the score goes to the write-behind buffer,
+    log rows go to the batched log writer, the status cache is updated in
+    memory, and the gate-status and alert events are published concurrently.
+    Messages waiting in the client queue are reported as backlog so a slow
+    handler shows up in the logs and in ``stats()``.
+
+    Every worker connects (with its own client id) so any of them can publish
+    commands, but only the holder of the leader lock subscribes to controller
+    status; its events reach the other workers through the Redis relay.
+    """
+
+    def __init__(self):
+        self._client: aiomqtt.Client | None = None
+        self._task: asyncio.Task | None = None
+        self.client_id = f"{settings.mqtt_client_id}-{WORKER_ID}"
+        self.is_leader = False
+        self._leader_lock = LeaderLock(
+            settings.mqtt_leader_key,
+            settings.mqtt_leader_ttl,
+            on_elected=self._on_elected,
+            on_demoted=self._on_demoted,
+        )
+
+        self._previous_risk_level = None
+        self._previous_gate_states: dict[str, str] = {}
+
+        self.received = 0
+        self.failed = 0
+        self.max_backlog = 0
+        self.last_handle_ms = 0.0
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None
+
+    @property
+    def backlog(self) -> int:
+        return len(self._client.messages) if self._client is not None else 0
+
+    def stats(self) -> dict:
+        return {
+            "client_id": self.client_id,
+            "leader": self.is_leader,
+            "connected": self.connected,
+            "received": self.received,
+            "failed": self.failed,
+            "backlog": self.backlog,
+            "max_backlog": self.max_backlog,
+            "last_handle_ms": round(self.last_handle_ms, 3),
+        }
+
+    # --- Outgoing ---
+    async def publish(self, topic: str, payload: str, qos: int = 1) -> bool:
+        """Publish on the live connection. Returns False while disconnected."""
+        if self._client is None:
+            logger.warning(f"MQTT not connected; dropped publish to '{topic}'")
+            return False
+        try:
+            await self._client.publish(topic, payload=payload, qos=qos)
+        except aiomqtt.MqttError as e:
+            logger.warning(f"MQTT publish to '{topic}' failed: {e}")
+            return False
+        return True
+
+    # --- Incoming ---
+    def _build_logs(self, data: dict) -> tuple[list[LogCreate], list[str]]:
+        """Log rows and log-channel alerts implied by one status message."""
+        final_score = data.get("final_score")
+        risk_level = data.get("risk_level")
+        logs, alerts = [], []
+
+        if (
+            risk_level in ["Caution", "Danger"]
+            and risk_level != self._previous_risk_level
+        ):
+            logs.append(
+                LogCreate(
+                    action="camera",
+                    details=json.dumps(
+                        {"risk_level": risk_level, "final_score": final_score}
+                    ),
+                    gate_id=None,
+                )
+            )
+
+        if risk_level == "Danger" and self._previous_risk_level != "Danger":
+            logs.append(
+                LogCreate(
+                    action="alarm",
+                    details=json.dumps(
+                        {"risk_level": risk_level, "final_score": final_score}
+                    ),
+                    gate_id=None,
+                )
+            )
+            alerts.append(
+                json.dumps(
+                    {
+                        "type": "alarm",
+                        "risk_level": risk_level,
+                        "final_score": final_score,
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                )
+            )
+        self._previous_risk_level = risk_level
+
+        # Every gate the controller reports (gate_a, gate_b, ...) is logged on change
+        for key, state in data.items():
+            if not key.startswith(GATE_KEY_PREFIX) or state is None:
+                continue
+            if state != self._previous_gate_states.get(key):
+                gate = key[len(GATE_KEY_PREFIX) :].upper()
+                logs.append(
+                    LogCreate(
+                        action="gate",
+                        details=json.dumps({"gate": gate, "status": state}),
+                        gate_id=None,
+                    )
+                )
+                logger.info(f"Gate {gate} status changed to: {state}")
+                self._previous_gate_states[key] = state
+        return logs, alerts
+
+    async def handle_message(self, payload: str) -> None:
+        data = json.loads(payload)
+        final_score = data.get("final_score")
+
+        filtered_data = json.dumps(
+            {
+                "final_score": final_score,
+                "risk_level": data.get("risk_level"),
+                "gate_A": data.get("gate_a"),
+                "gate_B": data.get("gate_b"),
+            }
+        )
+        if final_score is not None:
+            # Written in batches by the write-behind buffer, stamped on arrival
+            # Extra detector fields (camera_id, lat/lng, component scores) are optional
+            score_fields = ScoreDataCreate.model_fields.keys() & data.keys()
+            score_buffer.add(
+                ScoreDataCreate(**{key: data[key] for key in score_fields})
+            )
+        logs, alerts = self._build_logs(data)
+        for log in logs:
+            # Batched by the log writer, broadcast to /ws/logs once committed
+            log_writer.submit(log)
+
+        # Mirrored to Redis by the cache at a fixed rate, not per message
+        gate_status_cache.update(filtered_data)
+        await asyncio.gather(
+            event_relay.publish(GATE_STATUS, filtered_data),
+            *(event_relay.publish(LOGS, alert) for alert in alerts),
+        )
+
+    async def _consume(self, client: aiomqtt.Client) -> None:
+        async for message in client.messages:
+            self.received += 1
+            backlog = len(client.messages)
+            if backlog > self.max_backlog:
+                self.max_backlog = backlog
+            if backlog >= settings.mqtt_backlog_warning:
+                logger.warning(f"MQTT backlog: {backlog} messages waiting")
+
+            payload = message.payload.decode("utf-8")
+            logger.debug(f"Message received from topic '{message.topic}': {payload}")
+            started = time.perf_counter()
+            try:
+                await self.handle_message(payload)
+            except json.JSONDecodeError:
+                self.failed += 1
+                logger.warning(f"Error decoding JSON from message: {payload}")
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Error handling MQTT message: {e}")
+            self.last_handle_ms = (time.perf_counter() - started) * 1000.0
+
+    # --- Leadership ---
+    async def _subscribe(self) -> None:
+        if self._client is not None:
+            await self._client.subscribe(settings.sub_topic_rpi, qos=1)
+            logger.info(f"MQTT subscribed to {settings.sub_topic_rpi}")
+
+    async def _on_elected(self) -> None:
+        self.is_leader = True
+        try:
+            await self._subscribe()
+        except aiomqtt.MqttError as e:
+            logger.warning(f"MQTT subscribe failed; retried on reconnect: {e}")
+
+    async def _on_demoted(self) -> None:
+        self.is_leader = False
+        # The next leader starts from its own view of the controller state
+        self._previous_risk_level = None
+        self._previous_gate_states = {}
+        if self._client is not None:
+            try:
+                await self._client.unsubscribe(settings.sub_topic_rpi)
+            except aiomqtt.MqttError as e:
+                logger.warning(f"MQTT unsubscribe failed: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with aiomqtt.Client(
+                    hostname=settings.mqtt_broker,
+                    port=settings.mqtt_port,
+                    identifier=self.client_id,
+                    keepalive=60,
+                    max_queued_incoming_messages=settings.mqtt_max_queued_messages,
+                ) as client:
+                    logger.info(f"MQTT connected as {self.client_id}")
+                    self._client = client
+                    if self.is_leader:
+                        await self._subscribe()
+                    await self._consume(client)
+            except aiomqtt.MqttError as e:
+                logger.warning(
+                    f"MQTT connection lost: {e}. "
+                    f"Reconnecting in {settings.mqtt_reconnect_interval}s"
+                )
+            finally:
+                self._client = None
+            await asyncio.sleep(settings.mqtt_reconnect_interval)
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        if settings.mqtt_leader_election:
+            self._leader_lock.start()
+        else:
+            self.is_leader = True  # single worker: always subscribe
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        await self._leader_lock.stop()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
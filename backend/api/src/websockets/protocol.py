@@ -0,0 +1,97 @@
+import json
+
+try:
+    import msgpack
+except ImportError:  # binary encoding is optional; clients fall back to JSON
+    msgpack = None
+
+# /ws/gate-status protocol versions
+#   v1: the full status JSON for every MQTT message (legacy, default)
+#   v2: {"v", "type": "snapshot" | "delta", "seq", "data"} frames; a snapshot on
+#       connect (or on request), then only the fields that changed. Removed
+#       fields are sent as null. seq increases by one per frame on a connection,
+#       so a gap means the client should ask for {"type": "resync"}. The first
+#       snapshot also carries "history": recent statuses, newest first.
+PROTOCOL_V1 = 1
+PROTOCOL_V2 = 2
+
+JSON = "json"
+MSGPACK = "msgpack"
+
+
+def available_encodings() -> list[str]:
+    return [JSON, MSGPACK] if msgpack is not None else [JSON]
+
+
+def diff_state(old: dict, new: dict) -> dict:
+    """Fields of ``new`` that differ from ``old``; removed fields map to None."""
+    delta = {
+        key: value for key, value in new.items() if old.get(key, object()) != value
+    }
+    delta.update({key: None for key in old if key not in new})
+    return delta
+
+
+class DeltaSession:
+    """Per-connection v2 encoder.
+
+    Fed the latest full status, it emits a snapshot first (and after
+    ``request_snapshot``), then deltas against what this client last received.
+    A status identical to the last one sent produces no frame at all.
+
+    Args:
+        encoding: ``json`` (text frames) or ``msgpack`` (binary frames)
+        max_rate: most frames per second this client wants (None = unlimited)
+        history: recent status JSON strings (newest first) for the first snapshot
+    """
+
+    def __init__(
+        self,
+        encoding: str = JSON,
+        max_rate: float | None = None,
+        history: list[str] | None = None,
+    ):
+        if encoding == MSGPACK and msgpack is None:
+            encoding = JSON
+        if encoding not in (JSON, MSGPACK):
+            raise ValueError(f"Unknown encoding: {encoding}")
+        self.encoding = encoding
+        self.set_max_rate(max_rate)
+        self.seq = 0
+        self._sent: dict | None = None
+        self._history = history
+
+    @property
+    def binary(self) -> bool:
+        return self.encoding == MSGPACK
+
+    def set_max_rate(self, max_rate: float | None) -> None:
+        self.max_rate = max_rate if max_rate and max_rate > 0 else None
+        self.min_interval = 1.0 / self.max_rate if self.max_rate else 0.0
+
+    def request_snapshot(self) -> None:
+        self._sent = None
+
+    def _frame(self, frame_type: str, data: dict) -> str | bytes:
+        self.seq += 1
+        frame = {"v": PROTOCOL_V2, "type": frame_type, "seq": self.seq, "data": data}
+        if frame_type == "snapshot":
+            frame["encoding"] = self.encoding
+            if self._history:
+                frame["history"] = [json.loads(entry) for entry in self._history]
+                self._history = None
+        if self.binary:
+            return msgpack.packb(frame)
+        return json.dumps(frame, separators=(",", ":"))
+
+    def encode(self, message: str) -> str | bytes | None:
+        """Frame for the latest full status JSON, or None if nothing changed."""
+        state = json.loads(message)
+        if self._sent is None:
+            self._sent = state
+            return self._frame("snapshot", state)
+        delta = diff_state(self._sent, state)
+        if not delta:
+            return None
+        self._sent = state
+        return self._frame("delta", delta)
@@ -0,0 +1,87 @@
+import asyncio
+
+from redis.exceptions import RedisError
+
+from api.core.config import settings
+from api.core.logging import get_logger
+from api.core.redis import redis_client
+from api.src.websockets.hub import BroadcastHub
+
+logger = get_logger(__name__)
+
+GATE_STATUS = "gate-status"
+LOGS = "logs"
+
+
+class EventRelay:
+    """Cross-worker fan-out of WebSocket events over Redis pub/sub.
+
+    Any worker publishes an event once to Redis; every worker (the publisher
+    included) is subscribed and hands it to its local ``BroadcastHub``. With
+    ``redis_pubsub_enabled`` off, or when Redis refuses the publish, events go
+    straight to the local hub so a single worker keeps working.
+    """
+
+    def __init__(self):
+        self._hubs: dict[str, BroadcastHub] = {}
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def channel(name: str) -> str:
+        return f"{settings.redis_channel_prefix}{name}"
+
+    def register(self, name: str, hub: BroadcastHub) -> None:
+        self._hubs[name] = hub
+
+    async def publish(self, name: str, message: str) -> None:
+        if self._task is not None:
+            try:
+                await redis_client.publish(self.channel(name), message)
+                return
+            except RedisError as e:
+                logger.warning(
+                    f"Redis publish on '{name}' failed, delivering locally: {e}"
+                )
+        hub = self._hubs.get(name)
+        if hub is not None:
+            await hub.broadcast(message)
+
+    async def _listen(self) -> None:
+        channels = {self.channel(name): hub for name, hub in self._hubs.items()}
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(*channels)
+            logger.info(f"Relaying Redis channels: {', '.join(channels)}")
+            async for message in pubsub.listen():
+                hub = channels.get(message["channel"])
+                if hub is not None:
+                    await hub.broadcast(message["data"])
+        finally:
+            await pubsub.aclose()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except RedisError as e:
+                logger.warning(
+                    f"Redis pub/sub lost: {e}. "
+                    f"Resubscribing in {settings.mqtt_reconnect_interval}s"
+                )
+            await asyncio.sleep(settings.mqtt_reconnect_interval)
+
+    def start(self) -> None:
+        if settings.redis_pubsub_enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+event_relay = EventRelay()
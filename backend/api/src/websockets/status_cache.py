@@ -0,0 +1,130 @@
+import asyncio
+import json
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+from redis.exceptions import RedisError
+
+from api.core.config import settings
+from api.core.logging import get_logger
+from api.core.redis import redis_client
+
+logger = get_logger(__name__)
+
+
+class GateStatusCache:
+    """Latest gate status in process memory, mirrored to Redis at a fixed rate.
+
+    ``update`` only touches memory and ignores a status identical to the last
+    one flushed, so repeated MQTT messages add no history entries. A flush task
+    writes the newest status to Redis at most once per ``flush_interval``: one
+    pipeline that SETs the latest status and LPUSH/LTRIMs it onto a capped
+    history list. Workers that do not receive MQTT read both back with one
+    pipelined call, reused for ``flush_interval`` so a burst of new
+    connections costs a single round trip.
+    """
+
+    def __init__(
+        self,
+        key: str | None = None,
+        history_key: str | None = None,
+        history_len: int | None = None,
+        flush_interval: float | None = None,
+    ):
+        self.key = key or settings.redis_gate_status_key
+        self.history_key = history_key or settings.redis_gate_history_key
+        self.history_len = history_len or settings.gate_status_history_len
+        self.flush_interval = flush_interval or settings.gate_status_flush_interval
+
+        self.latest: str | None = None
+        self._history: deque[str] = deque(maxlen=self.history_len)  # newest first
+        self._dirty = False
+        self._flushed: str | None = None  # last status written to Redis
+        self._task: asyncio.Task | None = None
+
+        self._read_at = float("-inf")
+        self._read: tuple[str | None, list[str]] = (None, [])
+        self._read_lock = asyncio.Lock()
+
+        self.flushes = 0
+
+    def update(self, message: str) -> None:
+        """Record the newest status (no I/O)."""
+        self.latest = message
+        self._dirty = message != self._flushed
+
+    def _history_entry(self) -> str:
+        status = json.loads(self.latest)
+        return json.dumps(
+            {"timestamp": datetime.now(timezone.utc).isoformat(), **status}
+        )
+
+    async def flush(self) -> bool:
+        """Write the newest status and one history entry in a single pipeline."""
+        if not self._dirty:
+            return False
+        self._dirty = False
+        latest = self.latest
+        if latest == self._flushed:
+            return False
+        entry = self._history_entry()
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.set(self.key, latest)
+                pipe.lpush(self.history_key, entry)
+                pipe.ltrim(self.history_key, 0, self.history_len - 1)
+                await pipe.execute()
+        except RedisError as e:
+            self._dirty = True  # retried on the next tick
+            logger.warning(f"Gate status flush failed: {e}")
+            return False
+        self._flushed = latest
+        self._history.appendleft(entry)
+        self.flushes += 1
+        return True
+
+    async def recent(self) -> tuple[str | None, list[str]]:
+        """Latest status and recent history (newest first) for a new client."""
+        if self._history:  # this worker is the writer
+            return self.latest, list(self._history)
+
+        async with self._read_lock:
+            if time.monotonic() - self._read_at >= self.flush_interval:
+                await self._read_redis()
+        latest, history = self._read
+        return self.latest or latest, history
+
+    async def _read_redis(self) -> None:
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(self.key)
+                pipe.lrange(self.history_key, 0, self.history_len - 1)
+                latest, history = await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Gate status read failed: {e}")
+            return
+        self._read = (latest, history)
+        self._read_at = time.monotonic()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+gate_status_cache = GateStatusCache()
@@ -0,0 +1,92 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from enum import Enum
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+
+from api.core.config import settings
+from api.core.database import async_session
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+async def stream_query(query: Select, batch_size: int) -> AsyncIterator[list]:
+    """ORM rows of ``query`` in batches of ``batch_size``.
+
+    Rows are read through a server-side cursor.
+
+    The session lives inside the generator: a streaming response outlives the
+    request's dependency-managed session.
+    """
+    async with async_session() as session:
+        result = await session.stream_scalars(
+            query.execution_options(yield_per=batch_size)
+        )
+        # The identity map holds rows weakly: an exported batch can be collected
+        async for partition in result.partitions():
+            yield partition
+
+
+def _ndjson_chunk(rows: list[BaseModel]) -> str:
+    return "".join(row.model_dump_json() + "\n" for row in rows)
+
+
+def _csv_chunk(rows: list[BaseModel], fields: list[str], header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+    if header:
+        writer.writeheader()
+    writer.writerows(row.model_dump(mode="json") for row in rows)
+    return buffer.getvalue()
+
+
+async def encode_rows(
+    query: Select,
+    schema: type[BaseModel],
+    fmt: ExportFormat,
+    batch_size: int | None = None,
+) -> AsyncIterator[str]:
+    """Encode ``query`` results as NDJSON lines or CSV, one chunk per fetched batch."""
+    fields = list(schema.model_fields)
+    header = True
+    async for partition in stream_query(
+        query, batch_size or settings.export_batch_size
+    ):
+        rows = [schema.model_validate(row) for row in partition]
+        if fmt == ExportFormat.CSV:
+            yield _csv_chunk(rows, fields, header)
+            header = False
+        else:
+            yield _ndjson_chunk(rows)
+    if header and fmt == ExportFormat.CSV:
+        yield _csv_chunk([], fields, header)  # empty export still gets its header
+
+
+def export_response(
+    name: str,
+    query: Select,
+    schema: type[BaseModel],
+    fmt: ExportFormat,
+) -> StreamingResponse:
+    """Stream ``query`` as a downloadable ``{name}-{utc timestamp}.{fmt}`` file."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return StreamingResponse(
+        encode_rows(query, schema, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}-{stamp}.{fmt.value}"'
+        },
+    )
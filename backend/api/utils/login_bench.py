@@ -0,0 +1,85 @@
+"""Login burst benchmark: event-loop stalls with inline vs offloaded bcrypt.
+
+A ticker coroutine stands in for the live gate-status fan-out and records how
+late each 10 ms tick fires while a burst of password checks runs. Inline
+verification stalls the loop for the whole burst; the bcrypt pool should keep
+tick lateness near zero.
+
+Usage: python -m api.utils.login_bench [--logins 20] [--rounds 12]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from passlib.context import CryptContext
+
+from api.core import security
+
+TICK = 0.01  # seconds
+
+
+async def _ticker(lateness: list[float], stop: asyncio.Event) -> None:
+    expected = time.perf_counter() + TICK
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, expected - time.perf_counter()))
+        now = time.perf_counter()
+        lateness.append(now - expected)
+        expected = max(expected + TICK, now)
+
+
+async def _inline_login(password: str, hashed: str) -> bool:
+    return security.verify_password(password, hashed)
+
+
+async def _burst(login, logins: int, password: str, hashed: str) -> dict:
+    lateness: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lateness, stop))
+    await asyncio.sleep(TICK * 3)  # let the ticker settle
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(login(password, hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+    assert all(results)
+    lateness_ms = sorted(x * 1000.0 for x in lateness) or [0.0]
+    return {
+        "burst_s": elapsed,
+        "logins_per_s": logins / elapsed,
+        "tick_p50_ms": statistics.median(lateness_ms),
+        "tick_p99_ms": lateness_ms[int(len(lateness_ms) * 0.99)],
+        "tick_max_ms": lateness_ms[-1],
+    }
+
+
+async def main(logins: int, rounds: int) -> None:
+    # Same scheme as production, explicit cost so runs are comparable
+    security.pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+    password = "correct horse battery staple"
+    hashed = security.get_password_hash(password)
+
+    for name, login in (
+        ("inline", _inline_login),
+        ("offloaded", security.verify_password_async),
+    ):
+        stats = await _burst(login, logins, password, hashed)
+        print(
+            f"{name:>9}: {logins} logins in {stats['burst_s']:.2f}s "
+            f"({stats['logins_per_s']:.1f}/s), loop lateness "
+            f"p50 {stats['tick_p50_ms']:.1f}ms p99 {stats['tick_p99_ms']:.1f}ms "
+            f"max {stats['tick_max_ms']:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--logins", type=int, default=20, help="concurrent logins in the burst"
+    )
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds))
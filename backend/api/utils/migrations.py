@@ -1,39 +1,100 @@
-import os
-import subprocess
-import sys
+"""In-process Alembic migrations.
 
+Workers call ``migrate()`` at startup: one query compares the database
+revision with the script head and returns immediately when they match. When
+an upgrade is due, a Postgres advisory lock makes concurrent workers (or
+replicas) wait for the one running it, then re-check and find nothing to do.
 
-def run_migrations():
-    """
-    Runs Alembic database migrations using sys.executable and module execution.
+Run it once before starting workers with ``python -m api.utils.migrations``.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import pool, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from api.core.config import settings
+from api.core.logging import get_logger, setup_logging
+
+logger = get_logger(__name__)
 
-    This method is more compatible with environments like Vercel where direct
-    command execution might be restricted.
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+# Arbitrary app-wide key for pg_advisory_lock
+MIGRATION_LOCK_ID = 7_310_248_650
+
+
+def alembic_config(connection: Connection | None = None) -> Config:
+    """Config for ``alembic/`` that reuses ``connection`` instead of opening its own.
+
+    Built without alembic.ini so env.py leaves the app's logging alone.
     """
-    try:
-        # Ensure the current directory is in the Python path
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        sys.path.insert(0, current_dir)
-
-        # Use sys.executable to run the Alembic module
-        result = subprocess.run(
-            [sys.executable, "-m", "alembic", "upgrade", "head"],
-            capture_output=True,
-            text=True,
-            check=True,
+    config = Config()
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    config.attributes["connection"] = connection
+    return config
+
+
+def is_up_to_date(connection: Connection, script: ScriptDirectory) -> bool:
+    current = set(MigrationContext.configure(connection).get_current_heads())
+    return current == set(script.get_heads())
+
+
+def _upgrade(connection: Connection) -> bool:
+    config = alembic_config(connection)
+    script = ScriptDirectory.from_config(config)
+    if is_up_to_date(connection, script):
+        return False
+
+    postgres = connection.dialect.name == "postgresql"
+    if postgres:
+        connection.execute(
+            text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID}
         )
+    try:
+        # Another worker may have finished while we waited for the lock
+        if is_up_to_date(connection, script):
+            return False
+        command.upgrade(config, "head")
+        connection.commit()  # before unlocking, so waiters see the new revision
+        return True
+    finally:
+        if postgres:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID}
+            )
+
+
+async def migrate(url: str | None = None) -> bool:
+    """Upgrade the database to head if needed. Returns True if anything ran."""
+    engine = create_async_engine(url or settings.DATABASE_URL, poolclass=pool.NullPool)
+    try:
+        async with engine.connect() as connection:
+            upgraded = await connection.run_sync(_upgrade)
+            await connection.commit()
+    finally:
+        await engine.dispose()
+    return upgraded
+
 
-        # Print the output if there's any
-        if result.stdout:
-            print("Migration output:", result.stdout)
+def run_migrations() -> bool:
+    """Blocking ``migrate()`` for scripts and pre-start commands."""
+    started = time.perf_counter()
+    upgraded = asyncio.run(migrate())
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    if upgraded:
+        logger.info(f"Migrations applied in {elapsed_ms:.0f} ms")
+    else:
+        logger.info(f"Database already at head (checked in {elapsed_ms:.0f} ms)")
+    return upgraded
 
-        print("Migrations completed successfully!")
 
-    except subprocess.CalledProcessError as e:
-        print(f"Migration failed. Error: {e}")
-        print("Standard output:", e.stdout)
-        print("Standard error:", e.stderr)
-        raise
-    except Exception as e:
-        print(f"An error occurred while running migrations: {e}")
-        raise
+if __name__ == "__main__":
+    setup_logging()
+    run_migrations()
@@ -0,0 +1,138 @@
+from collections.abc import Awaitable, Callable, Iterable
+from functools import lru_cache
+from typing import Protocol
+
+import numpy as np
+from pyproj import Transformer
+from redis.exceptions import RedisError
+
+from api.core.config import settings
+from api.core.logging import get_logger
+from api.core.redis import redis_client
+
+logger = get_logger(__name__)
+
+WGS84 = "EPSG:4326"
+KOREA_TM = "EPSG:5186"  # Korea 2000 / Central Belt 2010, meters
+
+
+class Located(Protocol):
+    id: int
+    lat: float
+    lon: float
+
+
+@lru_cache(maxsize=None)
+def get_transformer(src_crs: str, dst_crs: str) -> Transformer:
+    """Get the process-wide transformer for a CRS pair.
+
+    Building a transformer costs far more than transforming a batch of points,
+    so every caller shares one instance per (src, dst) pair.
+    """
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
+
+def project(lat, lon) -> tuple[np.ndarray, np.ndarray]:
+    """Project WGS84 lat/lon (scalars or arrays) to EPSG:5186 x/y in one call."""
+    transformer = get_transformer(WGS84, KOREA_TM)
+    return transformer.transform(
+        np.asarray(lon, dtype=float), np.asarray(lat, dtype=float)
+    )
+
+
+def unproject(x, y) -> tuple[np.ndarray, np.ndarray]:
+    """Convert EPSG:5186 x/y (scalars or arrays) back to WGS84 (lat, lon)."""
+    transformer = get_transformer(KOREA_TM, WGS84)
+    lon, lat = transformer.transform(
+        np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    )
+    return lat, lon
+
+
+class ProjectedPositions:
+    """Precomputed EPSG:5186 positions for a set of located entities.
+
+    Positions are projected in a single batch and reused until the set
+    changes, so spatial queries never re-project or loop per point. Writers
+    call ``invalidate`` after committing, which bumps a version counter in
+    Redis; ``current`` compares it with the version it loaded, so a change made
+    through any worker is picked up by all of them. Without Redis every
+    ``current`` call reloads.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.ids = np.empty(0, dtype=np.int64)
+        self.xy = np.empty((0, 2))
+        self._index: dict[int, int] = {}
+        self.loaded = False
+        self._version: int | None = None
+
+    @property
+    def version_key(self) -> str:
+        return f"{settings.redis_positions_prefix}{self.name}"
+
+    def load(self, items: Iterable[Located]) -> None:
+        """Project all items at once and replace the cached positions."""
+        items = list(items)
+        ids = np.fromiter((item.id for item in items), dtype=np.int64, count=len(items))
+        lat = np.fromiter(
+            (float(item.lat) for item in items), dtype=float, count=len(items)
+        )
+        lon = np.fromiter(
+            (float(item.lon) for item in items), dtype=float, count=len(items)
+        )
+        x, y = project(lat, lon)
+
+        self.ids = ids
+        self.xy = np.column_stack((x, y)) if len(items) else np.empty((0, 2))
+        self._index = {int(item_id): i for i, item_id in enumerate(ids)}
+        self.loaded = True
+
+    async def _read_version(self) -> int | None:
+        try:
+            version = await redis_client.get(self.version_key)
+        except RedisError as e:
+            logger.warning(f"Position cache version read failed for {self.name}: {e}")
+            return None
+        return int(version or 0)
+
+    async def current(
+        self, load_items: Callable[[], Awaitable[Iterable[Located]]]
+    ) -> "ProjectedPositions":
+        """Get the positions, reloading them through ``load_items`` if stale."""
+        version = await self._read_version()
+        if not self.loaded or version is None or version != self._version:
+            self.load(await load_items())
+            self._version = version
+        return self
+
+    async def invalidate(self) -> None:
+        """Mark the positions stale in this worker and, through Redis, in all others."""
+        self.loaded = False
+        try:
+            await redis_client.incr(self.version_key)
+        except RedisError as e:
+            logger.warning(f"Position cache invalidation failed for {self.name}: {e}")
+
+    def get(self, item_id: int) -> tuple[float, float] | None:
+        """Get the projected (x, y) of one item, or None if unknown."""
+        i = self._index.get(item_id)
+        if i is None:
+            return None
+        return float(self.xy[i, 0]), float(self.xy[i, 1])
+
+    def within(self, lat: float, lon: float, radius_m: float) -> list[int]:
+        """Get the ids of items within radius_m meters of a WGS84 point.
+
+        Ids are ordered nearest first.
+        """
+        cx, cy = project(lat, lon)
+        distances = np.hypot(self.xy[:, 0] - cx, self.xy[:, 1] - cy)
+        inside = np.flatnonzero(distances <= radius_m)
+        inside = inside[np.argsort(distances[inside], kind="stable")]
+        return [int(item_id) for item_id in self.ids[inside]]
+
+
+camera_positions = ProjectedPositions("cameras")
+gate_positions = ProjectedPositions("gates")
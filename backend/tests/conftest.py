@@ -0,0 +1,26 @@
+"""Shared test setup.
+
+Tests run against in-memory sqlite (aiosqlite, a dev dependency) instead of
+Postgres. Production SQL is written for Postgres; the few Postgres functions
+it uses are registered on every sqlite connection here.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# Like Postgres, NULL arguments are ignored (NULL only if all are NULL)
+def _least(*values):
+    return min((value for value in values if value is not None), default=None)
+
+
+def _greatest(*values):
+    return max((value for value in values if value is not None), default=None)
+
+
+@event.listens_for(Engine, "connect")
+def _register_postgres_functions(dbapi_connection, connection_record) -> None:
+    if "sqlite" not in type(dbapi_connection).__module__:
+        return
+    dbapi_connection.create_function("least", -1, _least)
+    dbapi_connection.create_function("greatest", -1, _greatest)
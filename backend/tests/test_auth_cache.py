@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.core import security
+from api.core.security import create_access_token, get_current_user
+from api.src.users import cache as cache_module
+from api.src.users.cache import UserCache
+from api.src.users.models import User
+
+
+@pytest.fixture
+async def users_db(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.__table__.create)
+    queries = []
+
+    def session_factory():
+        return AsyncSession(engine, expire_on_commit=False)
+
+    class CountingSession(AsyncSession):
+        async def execute(self, *args, **kwargs):
+            queries.append(args[0])
+            return await super().execute(*args, **kwargs)
+
+    monkeypatch.setattr(cache_module, "async_session", lambda: CountingSession(engine))
+    cache = UserCache(maxsize=10, ttl=60, redis=False)
+    monkeypatch.setattr(cache_module, "user_cache", cache)
+    security.token_cache.clear()
+
+    async with session_factory() as session:
+        session.add(User(email="op@example.com", hashed_password="x"))
+        await session.commit()
+    yield session_factory, queries
+    await engine.dispose()
+
+
+async def test_repeat_requests_skip_the_database(users_db):
+    _, queries = users_db
+    token = create_access_token({"sub": "1"})
+
+    first = await get_current_user(token)
+    second = await get_current_user(token)
+    assert (first.id, second.email) == (1, "op@example.com")
+    assert len(queries) == 1
+
+
+async def test_update_and_delete_invalidate(users_db):
+    session_factory, queries = users_db
+    token = create_access_token({"sub": "1"})
+    await get_current_user(token)
+
+    async with session_factory() as session:
+        user = await session.scalar(select(User).where(User.id == 1))
+        user.email = "new@example.com"
+        await session.commit()
+    assert (await get_current_user(token)).email == "new@example.com"
+
+    async with session_factory() as session:
+        await session.delete(await session.get(User, 1))
+        await session.commit()
+    with pytest.raises(HTTPException) as exc:
+        await get_current_user(token)
+    assert exc.value.status_code == 401
+    assert len(queries) == 3
+
+
+async def test_invalidation_waits_for_commit(users_db, monkeypatch):
+    session_factory, queries = users_db
+    deleted = []
+
+    class FakeRedis:
+        async def delete(self, *keys):
+            deleted.extend(keys)
+
+    monkeypatch.setattr(cache_module, "redis_client", FakeRedis())
+    cache_module.user_cache.redis = True
+    monkeypatch.setattr(cache_module.user_cache, "_read_redis", lambda user_id: _none())
+    monkeypatch.setattr(cache_module.user_cache, "_write_redis", lambda user: _none())
+    token = create_access_token({"sub": "1"})
+    await get_current_user(token)
+
+    async with session_factory() as session:
+        user = await session.get(User, 1)
+        user.email = "new@example.com"
+        await session.flush()
+        assert (
+            cache_module.user_cache._local.get(1) is not None
+        )  # flushed, not committed
+        await session.rollback()
+    assert len(queries) == 1 and deleted == []
+
+    async with session_factory() as session:
+        user = await session.get(User, 1)
+        user.email = "new@example.com"
+        await session.commit()
+    assert cache_module.user_cache._local.get(1) is None
+    await cache_module.user_cache.drain()
+    assert deleted == [UserCache.key(1)]
+
+
+async def _none():
+    return None
+
+
+async def test_expired_token_is_rejected(users_db):
+    token = create_access_token({"sub": "1"}, expires_delta=timedelta(seconds=-1))
+    assert security.decode_token(token) is None
@@ -0,0 +1,105 @@
+import asyncio
+
+from api.src.websockets.hub import DISCONNECT, DROP_OLDEST, BroadcastHub
+from api.src.websockets.relay import EventRelay
+
+
+class FakeWebSocket:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+        self.closed = None
+        self.client = "fake"
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        if self.fail:
+            raise RuntimeError("connection closed")
+        await asyncio.sleep(self.delay)
+        self.sent.append(message)
+
+    async def close(self, code=1000):
+        self.closed = code
+
+
+async def test_slow_and_dead_clients_do_not_delay_others():
+    hub = BroadcastHub("test", queue_size=10, policy=DROP_OLDEST, send_timeout=5.0)
+    fast, slow, dead = (
+        FakeWebSocket(),
+        FakeWebSocket(delay=1.0),
+        FakeWebSocket(fail=True),
+    )
+    for websocket in (fast, slow, dead):
+        await hub.connect(websocket)
+
+    for i in range(5):
+        await hub.broadcast(str(i))
+    await asyncio.sleep(0.05)
+
+    assert fast.sent == ["0", "1", "2", "3", "4"]
+    assert slow.sent == []
+    assert hub.active_connections == [
+        fast,
+        slow,
+    ]  # dead client removed after its failed send
+    hub.disconnect(slow)
+
+
+async def test_full_queue_policies():
+    dropping = BroadcastHub("drop", queue_size=2, policy=DROP_OLDEST, send_timeout=5.0)
+    stuck = FakeWebSocket(delay=10.0)
+    await dropping.connect(stuck, initial=["snapshot"])
+    await asyncio.sleep(0)  # writer picks up the snapshot and blocks on it
+    for i in range(4):
+        await dropping.broadcast(str(i))
+    client = dropping._clients[stuck]
+    assert [client.queue.get_nowait() for _ in range(2)] == ["2", "3"]
+    assert dropping.stats()["dropped"] == 2
+    dropping.disconnect(stuck)
+
+    disconnecting = BroadcastHub(
+        "close", queue_size=1, policy=DISCONNECT, send_timeout=5.0
+    )
+    stuck = FakeWebSocket(delay=10.0)
+    await disconnecting.connect(stuck)
+    for i in range(3):
+        await disconnecting.broadcast(str(i))
+    await asyncio.sleep(0.01)
+    assert disconnecting.active_connections == []
+    assert stuck.closed == 1013
+
+
+async def test_initial_messages_larger_than_queue():
+    dropping = BroadcastHub("drop", queue_size=2, policy=DROP_OLDEST, send_timeout=5.0)
+    websocket = FakeWebSocket()
+    await dropping.connect(websocket, initial=[str(i) for i in range(5)])
+    await asyncio.sleep(0.01)
+    assert websocket.sent == ["3", "4"]
+    assert dropping.stats()["dropped"] == 3
+    dropping.disconnect(websocket)
+
+    disconnecting = BroadcastHub(
+        "close", queue_size=2, policy=DISCONNECT, send_timeout=5.0
+    )
+    websocket = FakeWebSocket()
+    await disconnecting.connect(websocket, initial=[str(i) for i in range(5)])
+    await asyncio.sleep(0.01)
+    assert disconnecting.active_connections == []
+    assert websocket.closed == 1013
+
+
+async def test_relay_delivers_locally_without_redis():
+    relay = EventRelay()
+    hub = BroadcastHub("relay", queue_size=10, policy=DROP_OLDEST, send_timeout=5.0)
+    relay.register("gate-status", hub)
+    websocket = FakeWebSocket()
+    await hub.connect(websocket)
+
+    await relay.publish("gate-status", "hello")
+    await relay.publish("unregistered", "ignored")
+    await asyncio.sleep(0.01)
+    assert websocket.sent == ["hello"]
+    hub.disconnect(websocket)
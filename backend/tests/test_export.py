@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.src.scores.models import ScoreData
+from api.src.scores.routes import router as scores_router
+from api.src.scores.repository import range_query
+from api.src.scores.schemas import ScoreDataResponse
+from api.utils import export
+from api.utils.export import ExportFormat, encode_rows
+
+T0 = datetime(2025, 9, 2, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def scores_db(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(ScoreData.__table__.create)
+        await conn.execute(
+            insert(ScoreData),
+            [
+                {
+                    "final_score": i / 10,
+                    "camera_id": f"cam-0{i % 2}",
+                    "timestamp": T0 + timedelta(seconds=i),
+                }
+                for i in range(5)
+            ],
+        )
+    monkeypatch.setattr(export, "async_session", lambda: AsyncSession(engine))
+    yield
+    await engine.dispose()
+
+
+async def test_ndjson_chunks_follow_cursor_batches(scores_db):
+    query = range_query(T0, T0 + timedelta(hours=1))
+    stream = encode_rows(query, ScoreDataResponse, ExportFormat.NDJSON, batch_size=2)
+    chunks = [chunk async for chunk in stream]
+    assert len(chunks) == 3
+    rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+    assert [row["final_score"] for row in rows] == [0.0, 0.1, 0.2, 0.3, 0.4]
+
+
+async def test_csv_has_one_header(scores_db):
+    query = range_query(T0, T0 + timedelta(hours=1), camera_id="cam-01")
+    stream = encode_rows(query, ScoreDataResponse, ExportFormat.CSV, batch_size=1)
+    text = "".join([chunk async for chunk in stream])
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert [row["final_score"] for row in rows] == ["0.1", "0.3"]
+    assert rows[0]["camera_id"] == "cam-01"
+
+
+async def test_export_endpoint_streams_attachment(scores_db):
+    app = FastAPI()
+    app.include_router(scores_router)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            "/scores/export",
+            params={
+                "start": T0.isoformat(),
+                "end": (T0 + timedelta(hours=1)).isoformat(),
+                "format": "csv",
+            },
+        )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"].startswith(
+        'attachment; filename="scores-'
+    )
+    assert len(response.text.strip().splitlines()) == 6
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.core.database import Base
+from api.core.exceptions import BadRequestException
+from api.src.gates.models import Gate
+from api.src.logs import service
+from api.src.logs.models import Log
+from api.src.users.models import User
+
+T0 = datetime(2025, 9, 1, 12, 0)
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[Gate.__table__, User.__table__, Log.__table__],
+        )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        # Pairs of rows share a created_at, so the id breaks ties
+        await session.execute(
+            insert(Log),
+            [
+                {
+                    "action": "gate" if i % 3 else "alarm",
+                    "gate_id": i % 2 + 1,
+                    "created_at": T0 + timedelta(minutes=i // 2),
+                }
+                for i in range(10)
+            ],
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+async def test_pages_cover_every_row_once_newest_first(db):
+    ids, cursor = [], None
+    while True:
+        page = await service.get_log_page(db, limit=3, cursor=cursor)
+        ids += [log.id for log in page.items]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert ids == list(range(10, 0, -1))
+
+
+async def test_filters_and_cursor_combine(db):
+    page = await service.get_log_page(db, limit=2, gate_id=1, action="gate")
+    assert [log.id for log in page.items] == [9, 5]
+    page = await service.get_log_page(
+        db, limit=2, cursor=page.next_cursor, gate_id=1, action="gate"
+    )
+    assert [log.id for log in page.items] == [3]
+    assert page.next_cursor is None
+
+
+async def test_invalid_cursor_is_rejected(db):
+    with pytest.raises(BadRequestException):
+        await service.get_log_page(db, limit=2, cursor="not-a-cursor")
@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.src.logs import writer as log_writer_module
+from api.src.logs.models import Log
+from api.src.logs.schemas import LogCreate
+from api.src.logs.writer import LogWriter
+
+
+class RecordingRelay:
+    def __init__(self):
+        self.messages = []
+
+    async def publish(self, name, message):
+        self.messages.append(json.loads(message))
+
+
+@pytest.fixture
+async def logs_db(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Log.__table__.create)
+    monkeypatch.setattr(
+        log_writer_module,
+        "async_session",
+        lambda: AsyncSession(engine, expire_on_commit=False),
+    )
+    relay = RecordingRelay()
+    monkeypatch.setattr(log_writer_module, "event_relay", relay)
+    yield relay
+    await engine.dispose()
+
+
+async def test_batches_and_broadcasts_after_commit(logs_db):
+    writer = LogWriter(batch_size=3)
+    for i in range(5):
+        writer.submit(LogCreate(action="gate", details=str(i)))
+    writer.start()
+
+    log = await writer.write(LogCreate(action="alarm"))
+    assert log.id == 6
+    assert log.created_at is not None
+
+    await writer.stop()
+    assert writer.stats()["batches"] == 2
+    assert [m["id"] for m in logs_db.messages] == [1, 2, 3, 4, 5, 6]
+    assert logs_db.messages[-1]["action"] == "alarm"
+
+
+async def test_write_without_running_task_flushes_inline(logs_db):
+    writer = LogWriter(batch_size=10)
+    log = await asyncio.wait_for(writer.write(LogCreate(action="gate")), timeout=5)
+    assert log.id == 1
+    assert len(logs_db.messages) == 1
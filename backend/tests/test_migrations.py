@@ -0,0 +1,17 @@
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from api.utils.migrations import migrate
+
+
+async def test_migrate_upgrades_once_then_skips(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'app.db'}"
+
+    assert await migrate(url) is True
+    assert await migrate(url) is False
+
+    engine = create_async_engine(url)
+    async with engine.connect() as connection:
+        tables = await connection.run_sync(lambda conn: inspect(conn).get_table_names())
+    await engine.dispose()
+    assert {"alembic_version", "rainfall", "score_rollups"} <= set(tables)
@@ -0,0 +1,43 @@
+import json
+
+from api.src.websockets.mqtt_bridge import MQTTBridge
+
+
+def test_status_messages_map_to_logs_on_change():
+    bridge = MQTTBridge()
+
+    logs, alerts = bridge._build_logs(
+        {"risk_level": "Safe", "final_score": 0.1, "gate_a": "OPEN", "gate_b": "OPEN"}
+    )
+    assert [log.action for log in logs] == ["gate", "gate"]
+    assert alerts == []
+
+    logs, alerts = bridge._build_logs(
+        {
+            "risk_level": "Danger",
+            "final_score": 0.9,
+            "gate_a": "OPEN",
+            "gate_b": "CLOSED",
+        }
+    )
+    assert [log.action for log in logs] == ["camera", "alarm", "gate"]
+    assert json.loads(logs[2].details) == {"gate": "B", "status": "CLOSED"}
+    assert json.loads(alerts[0])["type"] == "alarm"
+
+    # Repeated states produce no new logs
+    logs, alerts = bridge._build_logs(
+        {
+            "risk_level": "Danger",
+            "final_score": 0.95,
+            "gate_a": "OPEN",
+            "gate_b": "CLOSED",
+        }
+    )
+    assert logs == [] and alerts == []
+
+
+def test_stats_report_disconnected_bridge():
+    stats = MQTTBridge().stats()
+    assert stats["connected"] is False
+    assert stats["backlog"] == 0
+    assert stats["leader"] is False
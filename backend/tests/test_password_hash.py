@@ -0,0 +1,27 @@
+import threading
+
+from passlib.context import CryptContext
+
+from api.core import security
+
+
+async def test_hashing_runs_on_the_bcrypt_pool(monkeypatch):
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    threads = []
+
+    class RecordingContext:
+        def hash(self, password):
+            threads.append(threading.current_thread().name)
+            return context.hash(password)
+
+        def verify(self, password, hashed):
+            threads.append(threading.current_thread().name)
+            return context.verify(password, hashed)
+
+    monkeypatch.setattr(security, "pwd_context", RecordingContext())
+
+    hashed = await security.get_password_hash_async("secret")
+    assert await security.verify_password_async("secret", hashed)
+    assert not await security.verify_password_async("wrong", hashed)
+    assert all(name.startswith("bcrypt") for name in threads)
+    assert len(threads) == 3
@@ -0,0 +1,134 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.core.database import get_session
+from api.src.cameras import service as camera_service
+from api.src.cameras.models import Camera
+from api.src.cameras.routes import router as cameras_router
+from api.utils import projection
+from api.utils.projection import (
+    KOREA_TM,
+    WGS84,
+    ProjectedPositions,
+    get_transformer,
+    project,
+    unproject,
+)
+
+GANGNAM = (37.49858578128938, 127.02676215392935)
+SEOCHO = (37.5069991554355, 127.01601769968885)
+
+
+class FakeRedis:
+    def __init__(self, fail=False):
+        self.values = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise RedisConnectionError("down")
+        return self.values.get(key)
+
+    async def incr(self, key):
+        if self.fail:
+            raise RedisConnectionError("down")
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+
+
+def located(item_id, point):
+    return SimpleNamespace(id=item_id, lat=point[0], lon=point[1])
+
+
+def test_transformer_is_cached():
+    assert get_transformer(WGS84, KOREA_TM) is get_transformer(WGS84, KOREA_TM)
+
+
+def test_project_round_trip_batch():
+    lat, lon = zip(GANGNAM, SEOCHO)
+    x, y = project(lat, lon)
+    assert x.shape == (2,)
+    back_lat, back_lon = unproject(x, y)
+    assert back_lat == pytest.approx(lat, abs=1e-9)
+    assert back_lon == pytest.approx(lon, abs=1e-9)
+
+
+def test_projected_positions_within():
+    positions = ProjectedPositions("test")
+    positions.load([located(1, GANGNAM), located(2, SEOCHO)])
+    assert positions.get(1) == pytest.approx((202366.5, 544347.5), abs=1e-3)
+    assert positions.get(3) is None
+    assert positions.within(*GANGNAM, 150) == [1]
+    # nearest first
+    assert positions.within(*SEOCHO, 5000) == [2, 1]
+
+
+async def test_invalidation_reaches_other_workers(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(projection, "redis_client", redis)
+    items = [located(1, GANGNAM)]
+    loads = []
+
+    async def load_items():
+        loads.append(len(items))
+        return list(items)
+
+    writer, reader = ProjectedPositions("test"), ProjectedPositions("test")
+    await reader.current(load_items)
+    await reader.current(load_items)
+    assert loads == [1]
+
+    items.append(located(2, SEOCHO))
+    await writer.invalidate()  # another worker committed a change
+    assert (await reader.current(load_items)).within(*SEOCHO, 5000) == [2, 1]
+    assert loads == [1, 2]
+
+    redis.fail = True  # without Redis every read reloads
+    await reader.current(load_items)
+    assert loads == [1, 2, 2]
+
+
+async def test_nearby_cameras_route(monkeypatch):
+    monkeypatch.setattr(projection, "redis_client", FakeRedis())
+    monkeypatch.setattr(
+        camera_service, "camera_positions", ProjectedPositions("cameras")
+    )
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Camera.__table__.create)
+    async with AsyncSession(engine) as session:
+        session.add_all(
+            [
+                Camera(name="gangnam", lat=GANGNAM[0], lon=GANGNAM[1]),
+                Camera(name="seocho", lat=SEOCHO[0], lon=SEOCHO[1]),
+            ]
+        )
+        await session.commit()
+
+    app = FastAPI()
+    app.include_router(cameras_router)
+
+    async def session_override():
+        async with AsyncSession(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = session_override
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        near = await client.get(
+            "/cameras/nearby",
+            params={"lat": SEOCHO[0], "lon": SEOCHO[1], "radius": 200},
+        )
+        both = await client.get(
+            "/cameras/nearby",
+            params={"lat": SEOCHO[0], "lon": SEOCHO[1], "radius": 5000},
+        )
+    await engine.dispose()
+
+    assert [camera["name"] for camera in near.json()] == ["seocho"]
+    assert [camera["name"] for camera in both.json()] == ["seocho", "gangnam"]
@@ -0,0 +1,185 @@
+import asyncio
+import json
+from datetime import datetime
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.core.config import settings
+from api.core.database import get_session
+from api.src.rainfall import ingest, service as rainfall_service
+from api.src.rainfall.ingest import KST, RainfallIngestor, parse_rain_table
+from api.src.rainfall.models import Rainfall
+from api.src.rainfall.routes import router as rainfall_router
+
+# Same rows as AI/tests/kma_fixture.py (awsh.php, help=1)
+KMA_TEXT = """#START7777
+# YYMMDDHHMI STN RE_SUM RE_QCM RN_DAY RN_DAY_MI RN_HR1 RN_HR1_MI
+# RN_60M_MAX RN_60M_MAX_MI RN_60M_QCM RN_15M_MAX RN_15M_MAX_MI RN_15M_QCM
+202208082100 10 0 0 1.0 0 0.0 0 0.0 0 0 0.0 0 0
+202208082100 401 60 0 184.5 0 92.0 0 92.0 2030 0 27.0 2045 0
+202208082100 402 60 0 55.0 0 14.5 0 20.0 2030 0 9.0 2045 0
+202208082000 401 60 0 1.0 0 1.0 0 1.0 2030 0 1.0 2045 0
+202208082100 403 broken
+#7777END
+"""
+
+
+class FakePipeline:
+    def __init__(self, redis, transaction):
+        self.redis = redis
+        self.transaction = transaction
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def delete(self, key):
+        self.ops.append(("delete", key))
+
+    def hset(self, key, mapping):
+        self.ops.append(("hset", key, mapping))
+
+    async def execute(self):
+        self.redis.executed.append((self.transaction, self.ops))
+        for op in self.ops:
+            if op[0] == "delete":
+                self.redis.hashes.pop(op[1], None)
+            else:
+                self.redis.hashes.setdefault(op[1], {}).update(op[2])
+
+
+class FakeRedis:
+    """Records pipelines and serves HGET from what they wrote."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.executed = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self, transaction)
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(rainfall_service, "redis_client", fake)
+    return fake
+
+
+@pytest.fixture
+async def engine(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Rainfall.__table__.create)
+    monkeypatch.setattr(ingest, "async_session", lambda: AsyncSession(engine))
+    monkeypatch.setattr(settings, "rainfall_stations", "401,402")
+    yield engine
+    await engine.dispose()
+
+
+def test_parse_rain_table():
+    readings = parse_rain_table(KMA_TEXT)
+    assert sorted(readings) == [10, 401, 402]
+    latest = readings[401]  # the first row of a station wins
+    assert latest.observed_at == datetime(2022, 8, 8, 21, 0, tzinfo=KST)
+    assert (latest.rn_hr1, latest.rn_day, latest.rn_15m_max) == (92.0, 184.5, 27.0)
+
+
+async def test_cache_readings_replaces_hash_in_one_transaction(redis):
+    redis.hashes[settings.redis_rainfall_key] = {"999": "stale"}
+    await rainfall_service.cache_readings(parse_rain_table(KMA_TEXT))
+
+    assert len(redis.executed) == 1
+    transaction, ops = redis.executed[0]
+    assert transaction is True
+    assert [op[0] for op in ops] == ["delete", "hset"]
+    cached = redis.hashes[settings.redis_rainfall_key]
+    assert "999" not in cached and "updated_at" in cached
+    assert json.loads(cached["401"])["RN_HR1"] == 92.0
+
+
+async def test_poll_stores_configured_stations_once(redis, engine):
+    ingestor = RainfallIngestor()
+    ingestor._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=KMA_TEXT)
+        )
+    )
+    assert await ingestor.poll_once() is True
+    assert (
+        await ingestor.poll_once() is True
+    )  # same observation: skipped, not duplicated
+    await ingestor._client.aclose()
+
+    async with AsyncSession(engine) as session:
+        rows = (await session.execute(Rainfall.__table__.select())).all()
+    assert sorted(row.stn for row in rows) == [401, 402]
+
+
+async def test_latest_reads_redis_then_db(redis, engine):
+    app = FastAPI()
+    app.include_router(rainfall_router)
+
+    async def session_override():
+        async with AsyncSession(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = session_override
+
+    async with AsyncSession(engine) as session:
+        await rainfall_service.RainfallService(session).save_readings(
+            parse_rain_table(KMA_TEXT)
+        )
+    redis.hashes[settings.redis_rainfall_key] = {
+        "402": json.dumps(
+            {
+                "RN_HR1": 1.5,
+                "RN_DAY": 2.0,
+                "RN_15M_MAX": 0.5,
+                "observed_at": "2022-08-08T21:10:00+09:00",
+            }
+        )
+    }
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        cached = await client.get("/rainfall/latest", params={"stn": 402})
+        stored = await client.get("/rainfall/latest", params={"stn": 401})
+        missing = await client.get("/rainfall/latest", params={"stn": 10})
+
+    assert cached.json()["rn_hr1"] == 1.5  # from Redis
+    assert stored.json()["rn_hr1"] == 92.0  # not cached: from the DB
+    assert missing.status_code == 404
+
+
+async def test_only_the_leader_polls(monkeypatch):
+    ingestor = RainfallIngestor()
+    polls = []
+
+    async def poll_once():
+        polls.append(ingestor.is_leader)
+        return True
+
+    monkeypatch.setattr(ingestor, "poll_once", poll_once)
+    monkeypatch.setattr(ingestor, "_seconds_until_next_poll", lambda: 0.01)
+    task = asyncio.create_task(ingestor._run())
+    await asyncio.sleep(0.05)
+    assert polls == []
+
+    await ingestor._on_elected()
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert polls and all(polls)
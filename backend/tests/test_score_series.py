@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.src.scores.models import ScoreData, ScoreRollup
+from api.src.scores.schemas import ScoreResolution
+from api.src.scores.service import ScoreDataService, pick_resolution
+
+T0 = datetime(2025, 8, 27, 10, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(ScoreData.__table__.create)
+        await conn.run_sync(ScoreRollup.__table__.create)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+def rows(*points):
+    return [
+        {"final_score": score, "timestamp": T0 + timedelta(seconds=s)}
+        for s, score in points
+    ]
+
+
+async def test_rollups_merge_across_batches(session):
+    service = ScoreDataService(session)
+    await service.repository.bulk_create(rows((10, 0.5), (50, 0.2)))
+    # Same minute again, out of order, plus the next minute
+    await service.repository.bulk_create(rows((30, 0.9), (70, 0.4)))
+
+    series = await service.get_series(
+        T0, T0 + timedelta(hours=2), ScoreResolution.MINUTE
+    )
+    assert [p.count for p in series.points] == [3, 1]
+    first = series.points[0]
+    assert (first.min, first.max, first.last) == (0.2, 0.9, 0.2)
+    assert first.avg == pytest.approx(1.6 / 3)
+
+    hourly = await service.get_series(T0, T0 + timedelta(hours=2), ScoreResolution.HOUR)
+    assert len(hourly.points) == 1
+    assert (hourly.points[0].count, hourly.points[0].max) == (4, 0.9)
+
+
+async def test_raw_series(session):
+    service = ScoreDataService(session)
+    await service.repository.bulk_create(rows((10, 0.5), (3700, 0.7)))
+
+    series = await service.get_series(T0, T0 + timedelta(hours=1), ScoreResolution.AUTO)
+    assert series.resolution == ScoreResolution.RAW
+    assert [float(p.last) for p in series.points] == [0.5]
+
+
+def test_pick_resolution():
+    assert pick_resolution(T0, T0 + timedelta(minutes=30)) == ScoreResolution.RAW
+    assert pick_resolution(T0, T0 + timedelta(days=1)) == ScoreResolution.MINUTE
+    assert pick_resolution(T0, T0 + timedelta(days=30)) == ScoreResolution.HOUR
+
+
+async def test_camera_history_and_rollups(session):
+    service = ScoreDataService(session)
+    batch = rows((10, 0.5), (20, 0.3), (30, 0.8))
+    for row, camera_id in zip(batch, ["cam-01", "cam-02", "cam-01"]):
+        row.update(camera_id=camera_id, puddle_score=0.6)
+    await service.repository.bulk_create(batch)
+
+    history = await service.get_scores("cam-01")
+    assert [float(row.final_score) for row in history] == [0.8, 0.5]
+    assert history[0].puddle_score == 0.6
+
+    window = (T0, T0 + timedelta(hours=2), ScoreResolution.MINUTE)
+    everyone = await service.get_series(*window)
+    cam1 = await service.get_series(*window, camera_id="cam-01")
+    assert everyone.points[0].count == 3
+    assert (cam1.points[0].count, cam1.points[0].min, cam1.points[0].last) == (
+        2,
+        0.5,
+        0.8,
+    )
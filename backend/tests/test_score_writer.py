@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from api.src.scores.repository import ScoreDataRepository
+from api.src.scores.schemas import ScoreDataCreate
+from api.src.scores.writer import ScoreWriteBuffer
+
+
+@pytest.fixture
+def inserts(monkeypatch):
+    batches = []
+
+    async def bulk_create(self, rows):
+        batches.append(rows)
+
+    monkeypatch.setattr(ScoreDataRepository, "bulk_create", bulk_create)
+    return batches
+
+
+async def test_flushes_on_row_count_and_on_stop(inserts):
+    buffer = ScoreWriteBuffer(flush_rows=3, flush_interval=60.0)
+    buffer.start()
+
+    for score in (0.1, 0.2, 0.3, 0.4):
+        buffer.add(ScoreDataCreate(final_score=score))
+    await asyncio.sleep(0.05)
+    assert [[row["final_score"] for row in batch] for batch in inserts] == [
+        [0.1, 0.2, 0.3, 0.4]
+    ]
+
+    buffer.add(ScoreDataCreate(final_score=0.5))
+    await buffer.stop()
+    assert [row["final_score"] for row in inserts[-1]] == [0.5]
+    assert buffer.stats()["written"] == 5
+    assert all(row["timestamp"] is not None for batch in inserts for row in batch)
+
+
+async def test_failed_flush_keeps_rows_within_limit(monkeypatch):
+    async def failing(self, rows):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(ScoreDataRepository, "bulk_create", failing)
+    buffer = ScoreWriteBuffer(flush_rows=100, flush_interval=60.0, limit=3)
+
+    for score in (0.1, 0.2, 0.3, 0.4):
+        buffer.add(ScoreDataCreate(final_score=score))
+    assert await buffer.flush() == 0
+    assert len(buffer) == 3
+    assert buffer.stats()["dropped"] == 1
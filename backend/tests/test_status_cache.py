@@ -0,0 +1,76 @@
+from api.src.websockets import status_cache
+from api.src.websockets.status_cache import GateStatusCache
+
+
+class FakePipeline:
+    def __init__(self, ops):
+        self.ops = ops
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value):
+        self.ops.append(("set", key, value))
+
+    def lpush(self, key, value):
+        self.ops.append(("lpush", key))
+
+    def ltrim(self, key, start, end):
+        self.ops.append(("ltrim", key))
+
+    async def execute(self):
+        return []
+
+
+class FakeRedis:
+    def __init__(self):
+        self.ops = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.ops)
+
+
+async def test_updates_stay_in_memory_until_flushed():
+    # No Redis server in the test environment: flushes fail and are retried
+    cache = GateStatusCache(
+        key="test:status", history_key="test:history", flush_interval=60.0
+    )
+    for i in range(100):
+        cache.update(f'{{"final_score": {i / 100}}}')
+
+    assert await cache.flush() is False
+    latest, history = await cache.recent()
+    assert latest == '{"final_score": 0.99}'
+    assert history == []
+    assert cache._dirty  # still pending for the next tick
+
+
+async def test_identical_statuses_are_not_flushed_again(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(status_cache, "redis_client", redis)
+    cache = GateStatusCache(
+        key="test:status", history_key="test:history", flush_interval=60.0
+    )
+
+    cache.update('{"final_score": 0.5}')
+    assert await cache.flush() is True
+    cache.update('{"final_score": 0.5}')
+    assert not cache._dirty
+    assert await cache.flush() is False
+
+    # Changed and back again before a flush: nothing new to write
+    cache.update('{"final_score": 0.6}')
+    cache.update('{"final_score": 0.5}')
+    assert await cache.flush() is False
+
+    cache.update('{"final_score": 0.7}')
+    assert await cache.flush() is True
+    assert [op for op in redis.ops if op[0] == "set"] == [
+        ("set", "test:status", '{"final_score": 0.5}'),
+        ("set", "test:status", '{"final_score": 0.7}'),
+    ]
+    _, history = await cache.recent()
+    assert len(history) == 2
@@ -0,0 +1,25 @@
+from fastapi.testclient import TestClient
+
+from api.core.config import settings
+from api.main import app
+
+client = TestClient(app)
+
+
+def test_get_tile_serves_png(tmp_path, monkeypatch):
+    tile = tmp_path / "dem_risk" / "15" / "27945" / "12696.png"
+    tile.parent.mkdir(parents=True)
+    tile.write_bytes(b"\x89PNG\r\n\x1a\n")
+    monkeypatch.setattr(settings, "tile_dir", str(tmp_path))
+
+    response = client.get("/tiles/dem_risk/15/27945/12696.png")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.content == b"\x89PNG\r\n\x1a\n"
+
+
+def test_get_tile_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "tile_dir", str(tmp_path))
+
+    assert client.get("/tiles/dem_risk/15/0/0.png").status_code == 404
+    assert client.get("/tiles/..%2F/15/0/0.png").status_code in (404, 422)
@@ -0,0 +1,103 @@
+import asyncio
+import json
+
+import pytest
+
+from api.src.websockets.hub import DISCONNECT, DROP_OLDEST, BroadcastHub
+from api.src.websockets.protocol import MSGPACK, DeltaSession, diff_state
+
+
+def status(score, risk="Safe", gate_a="OPEN", gate_b="OPEN"):
+    return json.dumps(
+        {"final_score": score, "risk_level": risk, "gate_A": gate_a, "gate_B": gate_b}
+    )
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.frames = []
+        self.client = "fake"
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        self.frames.append(json.loads(message))
+
+    async def send_bytes(self, message):
+        msgpack = pytest.importorskip("msgpack")
+        self.frames.append(msgpack.unpackb(message))
+
+
+def test_diff_state_reports_changed_and_removed_fields():
+    assert diff_state({"a": 1, "b": 2}, {"a": 1, "b": 3}) == {"b": 3}
+    assert diff_state({"a": 1, "b": 2}, {"a": 1}) == {"b": None}
+    assert diff_state({"a": None}, {"a": None}) == {}
+
+
+def test_session_sends_snapshot_then_deltas():
+    session = DeltaSession()
+    snapshot = json.loads(session.encode(status(0.1)))
+    assert snapshot["type"] == "snapshot" and snapshot["seq"] == 1
+    assert snapshot["data"]["risk_level"] == "Safe"
+
+    assert session.encode(status(0.1)) is None  # unchanged → no frame
+    delta = json.loads(session.encode(status(0.9, risk="Danger")))
+    assert delta == {
+        "v": 2,
+        "type": "delta",
+        "seq": 2,
+        "data": {"final_score": 0.9, "risk_level": "Danger"},
+    }
+
+    session.request_snapshot()
+    assert json.loads(session.encode(status(0.9, risk="Danger")))["type"] == "snapshot"
+
+
+async def test_throttled_client_gets_coalesced_binary_deltas():
+    pytest.importorskip("msgpack")
+    hub = BroadcastHub("v2", queue_size=100, policy=DROP_OLDEST, send_timeout=5.0)
+    websocket = FakeWebSocket()
+    await hub.connect(
+        websocket, initial=[status(0.0)], session=DeltaSession(MSGPACK, max_rate=5)
+    )
+    await asyncio.sleep(0.01)  # snapshot goes out, then the writer waits 0.2s
+
+    for i in range(1, 21):
+        await hub.broadcast(status(i / 100))
+    await hub.broadcast(status(0.2, gate_a="CLOSED"))
+    await asyncio.sleep(0.3)
+
+    assert [frame["type"] for frame in websocket.frames] == ["snapshot", "delta"]
+    assert websocket.frames[1]["data"] == {"final_score": 0.2, "gate_A": "CLOSED"}
+    hub.disconnect(websocket)
+
+
+async def test_throttled_client_survives_disconnect_policy():
+    hub = BroadcastHub("v2", queue_size=2, policy=DISCONNECT, send_timeout=5.0)
+    websocket = FakeWebSocket()
+    await hub.connect(
+        websocket, initial=[status(0.0)], session=DeltaSession(max_rate=5)
+    )
+    await asyncio.sleep(0.01)
+
+    for i in range(1, 11):
+        await hub.broadcast(status(i / 100))
+    client = hub._clients[websocket]
+    assert client.queue.qsize() == 1  # pending states coalesced, not queued
+    await asyncio.sleep(0.3)
+
+    assert hub.active_connections == [websocket]
+    assert hub.stats()["disconnected_slow"] == 0
+    assert websocket.frames[-1]["data"] == {"final_score": 0.1}
+    hub.disconnect(websocket)
+
+
+def test_first_snapshot_carries_history():
+    history = [status(0.3), status(0.2)]
+    session = DeltaSession(history=history)
+    snapshot = json.loads(session.encode(status(0.4)))
+    assert [entry["final_score"] for entry in snapshot["history"]] == [0.3, 0.2]
+
+    session.request_snapshot()
+    assert "history" not in json.loads(session.encode(status(0.5)))
@@ -221,6 +221,15 @@ const InteractiveMap = ({ selectedDevice, onDeviceSelect, isAdmin, onDeviceClick
           attribution="&copy; OpenStreetMap contributors"
         />
 
+        {/* 침수 위험도 타일 (AI/scoring/risk_tiles.py 렌더링, 백엔드 서빙) */}
+        <TileLayer
+          url="/api/tiles/dem_risk/{z}/{x}/{y}.png"
+          minZoom={12}
+          maxNativeZoom={17}
+          opacity={0.6}
+          errorTileUrl="data:image/gif;base64,R0lGODlhAQABAAAAACH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=="
+        />
+
         <ResetMapView onReset={handleResetMap} />
 
         {/* CCTV 및 차수막 마커 표시 */}
@@ -14,3 +14,18 @@ export const getLogs = async (period = "day") => {
     throw error;
   }
 };
+
+/**
+ * 로그 페이지 조회 API (최신순, 커서 기반)
+ * @param {Object} params - { limit, cursor, period, action, gate_id, user_id }
+ * @returns {Promise<{items: Array, next_cursor: string|null}>} 로그 페이지 (next_cursor 가 null 이면 마지막 페이지)
+ */
+export const getLogPage = async (params = {}) => {
+  try {
+    const response = await axios.get("/logs/page", { params });
+    return response.data;
+  } catch (error) {
+    console.error("로그 페이지 조회 중 오류:", error);
+    throw error;
+  }
+};
@@ -51,11 +51,34 @@ export const createLogsWebSocket = (onLogMessage) => {
 
 /**
  * 실시간 차수막 상태 수신 웹소켓
- * @param {Function} onGateStatusMessage - 차수막 상태 메시지 수신 콜백
+ * @param {Function} onGateStatusMessage - 차수막 상태 메시지 수신 콜백 (병합된 전체 상태)
+ * @param {number} maxRate - 초당 최대 수신 프레임 수 (0 이면 제한 없음)
  * @returns {WebSocket} 웹소켓 인스턴스
  */
-export const createGateStatusWebSocket = (onGateStatusMessage) => {
-  return createWebSocket("/ws/gate-status", onGateStatusMessage);
+export const createGateStatusWebSocket = (onGateStatusMessage, maxRate = 5) => {
+  // v2 프로토콜: 연결 시 스냅샷, 이후 변경된 필드만 수신 → 로컬 상태에 병합해 전체 상태로 전달
+  let state = {};
+  let lastSeq = 0;
+  const query = maxRate ? `?v=2&max_rate=${maxRate}` : "?v=2";
+
+  const ws = createWebSocket(`/ws/gate-status${query}`, (frame) => {
+    if (!frame || frame.v !== 2) {
+      onGateStatusMessage(frame); // v1 형식 (전체 상태)
+      return;
+    }
+    if (frame.type === "snapshot") {
+      state = { ...frame.data };
+    } else if (frame.seq !== lastSeq + 1) {
+      // 프레임 누락 → 스냅샷 재요청
+      ws.send(JSON.stringify({ type: "resync" }));
+      return;
+    } else {
+      state = { ...state, ...frame.data };
+    }
+    lastSeq = frame.seq;
+    onGateStatusMessage(state);
+  });
+  return ws;
 };
 
 /**